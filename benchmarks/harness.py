@@ -0,0 +1,161 @@
+"""
+Benchmark harness for the ZKGRA laboratory works.
+
+Measures a callable with warmup and repeated samples, reports
+min/median/p99 and throughput, and stores results as JSON so that
+runs can be compared against a saved baseline.
+"""
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class BenchResult:
+    """Timing statistics for one benchmark case at one input size."""
+    name: str
+    size: int
+    repeats: int
+    number: int
+    min_s: float
+    median_s: float
+    p99_s: float
+    mean_s: float
+    throughput_mb_s: float
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Measured values (must not be empty)
+        pct: Percentile in range 0-100
+
+    Returns:
+        Value at the given percentile.
+    """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def calibrate(func: Callable[[], object], min_sample_s: float) -> int:
+    """Find how many calls are needed for one sample to last at least min_sample_s."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_s:
+            return number
+        number *= 10
+
+
+def measure(name: str, func: Callable[[], object], size: int, warmup: int = 3,
+            repeats: int = 20, min_sample_s: float = 0.001) -> BenchResult:
+    """
+    Benchmark a zero-argument callable.
+
+    The callable is first run `warmup` times, then the number of calls per
+    sample is calibrated so that very fast operations are not dominated by
+    timer resolution. Each of the `repeats` samples is reported per call.
+
+    Args:
+        name: Benchmark case name
+        func: Callable performing one operation on an input of `size` bytes
+        size: Input size in bytes (used for throughput)
+        warmup: Number of untimed warmup calls
+        repeats: Number of timed samples
+        min_sample_s: Minimum duration of one sample in seconds
+
+    Returns:
+        BenchResult with the timing statistics.
+    """
+    for _ in range(warmup):
+        func()
+
+    number = calibrate(func, min_sample_s)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    median = statistics.median(samples)
+    return BenchResult(
+        name=name,
+        size=size,
+        repeats=repeats,
+        number=number,
+        min_s=min(samples),
+        median_s=median,
+        p99_s=percentile(samples, 99),
+        mean_s=statistics.fmean(samples),
+        throughput_mb_s=size / median / 1e6 if median > 0 else 0.0,
+    )
+
+
+def save_results(results: List[BenchResult], path: str):
+    """Write benchmark results with environment metadata to a JSON file."""
+    data = {
+        'meta': {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': [asdict(result) for result in results],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> List[BenchResult]:
+    """Load benchmark results from a JSON file written by save_results."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return [BenchResult(**item) for item in data['results']]
+
+
+def compare(current: List[BenchResult], baseline: List[BenchResult],
+            tolerance: float = 0.10) -> List[Tuple[BenchResult, Optional[BenchResult], float, bool]]:
+    """
+    Compare results against a baseline by median time.
+
+    Args:
+        current: Results of this run
+        baseline: Saved baseline results
+        tolerance: Allowed relative slowdown (0.10 = 10 %)
+
+    Returns:
+        List of (current, baseline or None, ratio current/baseline, is_regression).
+    """
+    by_key: Dict[Tuple[str, int], BenchResult] = {(b.name, b.size): b for b in baseline}
+    rows = []
+    for result in current:
+        base = by_key.get((result.name, result.size))
+        if base is None or base.median_s <= 0:
+            rows.append((result, base, float('nan'), False))
+            continue
+        ratio = result.median_s / base.median_s
+        rows.append((result, base, ratio, ratio > 1 + tolerance))
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} μs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
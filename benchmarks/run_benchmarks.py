@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the ZKGRA laboratory works.
+
+Runs the core operations of the individual labs over several input
+sizes and reports min/median/p99 time and throughput. Results can be
+written to JSON and compared against a saved baseline.
+
+Examples:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --cases atbash,block --sizes 1024,65536
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --baseline baseline.json --tolerance 0.15
+"""
+import argparse
+import importlib
+import importlib.util
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import BenchResult, compare, format_time, load_results, measure, save_results
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = [256, 4096, 65536]
+
+# Deterministic test data
+SEED = 1234
+
+
+def load_lab_module(lab: str, module: str):
+    """
+    Import a module from a lab's src directory.
+
+    Labs with an src/__init__.py are loaded as a uniquely named package
+    (e.g. cvicenie7_src) so that modules with equal names in different
+    labs do not clash; flat src directories are added to sys.path.
+    """
+    src = ROOT / lab / 'src'
+    if (src / '__init__.py').exists():
+        package = f'{lab}_src'
+        if package not in sys.modules:
+            spec = importlib.util.spec_from_file_location(
+                package, src / '__init__.py', submodule_search_locations=[str(src)]
+            )
+            pkg = importlib.util.module_from_spec(spec)
+            sys.modules[package] = pkg
+            spec.loader.exec_module(pkg)
+        return importlib.import_module(f'{package}.{module}')
+
+    if str(src) not in sys.path:
+        sys.path.insert(0, str(src))
+    return importlib.import_module(module)
+
+
+def make_text(size: int, alphabet: str) -> str:
+    """Random text of the given size over an alphabet."""
+    rng = random.Random(SEED)
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+
+# Each case factory takes an input size and returns a zero-argument callable
+# that performs one operation over an input of that size.
+
+def case_atbash(size: int) -> Callable[[], object]:
+    cipher = load_lab_module('cvicenie1', 'cipher')
+    processor = cipher.CipherProcessor()
+    text = make_text(size, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    return lambda: processor.apply_cipher(text, processor.atbash_mapping)
+
+
+def case_block(size: int) -> Callable[[], object]:
+    cipher = load_lab_module('cvicenie1', 'cipher')
+    mappings = load_lab_module('cvicenie1', 'mappings')
+    processor = cipher.CipherProcessor()
+    mapping = mappings.build_block_mapping()
+    text = make_text(size, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    return lambda: processor.apply_cipher(text, mapping)
+
+
+def case_atbash_bytes(size: int) -> Callable[[], object]:
+    cipher = load_lab_module('cvicenie1', 'cipher')
+    processor = cipher.CipherProcessor()
+    data = make_text(size, "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ,.").encode()
+    return lambda: processor.encode_bytes(data, processor.atbash_mapping)
+
+
+def case_polybius_encode(size: int) -> Callable[[], object]:
+    polybius = load_lab_module('cvicenie2', 'polybius')
+    text = make_text(size, "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ")
+    return lambda: polybius.encode(text)
+
+
+def case_polybius_decode(size: int) -> Callable[[], object]:
+    polybius = load_lab_module('cvicenie2', 'polybius')
+    # Encoded pairs are about 3 bytes per plaintext character
+    pairs, _ = polybius.encode(make_text(max(1, size // 3), "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "))
+    return lambda: polybius.decode(pairs)
+
+
+def case_xor(size: int) -> Callable[[], object]:
+    xor_utils = load_lab_module('cvicenie2', 'xor_utils')
+    a, b, c = (make_text(size, "01"), make_text(size, "10"), make_text(size, "0110"))
+    return lambda: xor_utils.xor_chain(a, b, c)
+
+
+def case_des(size: int) -> Callable[[], object]:
+    des = load_lab_module('cvicenie6', 'des')
+    cipher = des.DES(bytes.fromhex('133457799BBCDFF1'))
+    data = make_text(max(8, size - size % 8), "".join(map(chr, range(256)))).encode('latin-1')
+    return lambda: cipher.encrypt(data)
+
+
+def case_sub_bytes(size: int) -> Callable[[], object]:
+    rijndael = load_lab_module('cvicenie7', 'rijndael')
+    state = [ord(c) for c in make_text(size, "".join(map(chr, range(256))))]
+    return lambda: rijndael.sub_bytes(state)
+
+
+def case_shift_rows(size: int) -> Callable[[], object]:
+    rijndael = load_lab_module('cvicenie7', 'rijndael')
+    data = [ord(c) for c in make_text(max(16, size - size % 16), "".join(map(chr, range(256))))]
+    blocks = [data[i:i + 16] for i in range(0, len(data), 16)]
+    return lambda: [rijndael.shift_rows(block) for block in blocks]
+
+
+def case_rsa(size: int) -> Callable[[], object]:
+    rsa = load_lab_module('cvicenie8', 'rsa')
+    # p = 61, q = 53 -> n = 3233, large enough for ASCII
+    e, n = 17, 61 * 53
+    text = make_text(size, "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ")
+    return lambda: rsa.encrypt_text(text, e, n)
+
+
+def case_schnorr(size: int) -> Callable[[], object]:
+    schnorr_module = load_lab_module('cvicenie9', 'schnorr')
+    random.seed(SEED)
+    schnorr = schnorr_module.Schnorr()
+    schnorr.generate_keys()
+    message = make_text(size, "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ")
+    return lambda: schnorr.sign(message)
+
+
+def case_huffman(size: int) -> Callable[[], object]:
+    huffman = load_lab_module('cvicenie10', 'huffman')
+    text = make_text(size, "".join(map(chr, range(32, 127))))
+
+    def run():
+        root = huffman.build_huffman_tree(Counter(text))
+        return huffman.generate_huffman_codes(root)
+    return run
+
+
+CASES: Dict[str, Callable[[int], Callable[[], object]]] = {
+    'atbash': case_atbash,
+    'block': case_block,
+    'atbash_bytes': case_atbash_bytes,
+    'polybius_encode': case_polybius_encode,
+    'polybius_decode': case_polybius_decode,
+    'xor': case_xor,
+    'des': case_des,
+    'sub_bytes': case_sub_bytes,
+    'shift_rows': case_shift_rows,
+    'rsa': case_rsa,
+    'schnorr': case_schnorr,
+    'huffman': case_huffman,
+}
+
+
+def run_suite(case_names: List[str], sizes: List[int], warmup: int, repeats: int,
+              min_sample_s: float) -> List[BenchResult]:
+    """Run the selected cases for every size and print a result line for each."""
+    results = []
+    print(f"{'Case':<16} {'Size':>8} {'Min':>11} {'Median':>11} {'p99':>11} {'MB/s':>10}")
+    print("-" * 72)
+    for name in case_names:
+        for size in sizes:
+            func = CASES[name](size)
+            result = measure(name, func, size, warmup=warmup, repeats=repeats,
+                             min_sample_s=min_sample_s)
+            results.append(result)
+            print(f"{name:<16} {size:>8} {format_time(result.min_s):>11} "
+                  f"{format_time(result.median_s):>11} {format_time(result.p99_s):>11} "
+                  f"{result.throughput_mb_s:>10.2f}")
+    return results
+
+
+def print_comparison(results: List[BenchResult], baseline_path: str, tolerance: float) -> int:
+    """Print comparison with a baseline. Returns the number of regressions."""
+    rows = compare(results, load_results(baseline_path), tolerance)
+    regressions = 0
+
+    print(f"\nComparison with baseline {baseline_path} (tolerance {tolerance:.0%}):")
+    print(f"{'Case':<16} {'Size':>8} {'Baseline':>11} {'Current':>11} {'Ratio':>8}")
+    print("-" * 60)
+    for result, base, ratio, is_regression in rows:
+        if base is None:
+            print(f"{result.name:<16} {result.size:>8} {'-':>11} "
+                  f"{format_time(result.median_s):>11} {'new':>8}")
+            continue
+        flag = "  REGRESSION" if is_regression else ""
+        print(f"{result.name:<16} {result.size:>8} {format_time(base.median_s):>11} "
+              f"{format_time(result.median_s):>11} {ratio:>7.2f}x{flag}")
+        regressions += is_regression
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite for the ZKGRA labs')
+    parser.add_argument('--cases', default=','.join(CASES),
+                        help=f"Comma-separated cases to run (available: {', '.join(CASES)})")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated input sizes in bytes')
+    parser.add_argument('--warmup', type=int, default=3, help='Untimed warmup calls per case')
+    parser.add_argument('--repeats', type=int, default=20, help='Timed samples per case')
+    parser.add_argument('--min-sample-time', type=float, default=0.001,
+                        help='Minimum duration of one sample in seconds')
+    parser.add_argument('--output', metavar='FILE', help='Write results to a JSON file')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare with a saved JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed relative slowdown against the baseline')
+    args = parser.parse_args()
+
+    case_names = [name.strip() for name in args.cases.split(',') if name.strip()]
+    unknown = [name for name in case_names if name not in CASES]
+    if unknown:
+        print(f"Error: unknown cases: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    results = run_suite(case_names, sizes, args.warmup, args.repeats, args.min_sample_time)
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        regressions = print_comparison(results, args.baseline, args.tolerance)
+        if regressions:
+            print(f"\n{regressions} regression(s) found")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
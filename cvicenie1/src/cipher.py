@@ -10,19 +10,41 @@ import argparse
 import time
 import sys
 import os
-from typing import Dict, List, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple
 
 # Add current directory to path for relative imports
 sys.path.insert(0, os.path.dirname(__file__))
 
 from mappings import (
     build_atbash_mapping,
-    build_block_mapping,
-    get_direct_numbers,
-    get_reverse_numbers,
     format_mapping_table,
-    get_part_tables,
+    get_split_mapping,
+    get_split_tables,
 )
+from mapping_analysis import analyze_mapping
+from translation import TextLike, compile_mapping
+from vectorized import BytesLike, encode_bytes
+
+# Number of characters read per chunk in streaming mode
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Number of records sent to a worker process at once in batch mode
+DEFAULT_BATCH_SIZE = 10000
+
+# Deletion table for ASCII input: drops every non-letter after uppercasing
+ASCII_NON_LETTERS = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if not chr(code).isalpha()
+))
+
+
+def resolve_parts(part1: str, part2: str, parts: Optional[Sequence[str]] = None) -> Tuple[str, ...]:
+    """Get the alphabet split as a tuple; explicit parts override part1/part2."""
+    if parts:
+        return tuple(parts)
+    return (part1, part2)
 
 
 class CipherProcessor:
@@ -32,26 +54,67 @@ class CipherProcessor:
         # Build the stream cipher mapping (reverse alphabet)
         self.atbash_mapping = build_atbash_mapping()
     
+    def get_mapping(self, mode: str, part1: str = "ABCDEFGHIJKLM", part2: str = "NOPQRSTUVWXYZ",
+                    parts: Optional[Sequence[str]] = None) -> Mapping[str, str]:
+        """
+        Get the cipher mapping for 'stream' (Atbash) or 'block' mode.
+        
+        Block mappings come from the mapping registry, so the same split
+        is never rebuilt. Block mappings are shared read-only views.
+        """
+        if mode == 'stream':
+            return self.atbash_mapping
+        if mode == 'block':
+            return get_split_mapping(resolve_parts(part1, part2, parts)).mapping
+        raise ValueError(f"Unknown cipher mode: {mode}")
+    
     def normalize_input(self, text: str) -> str:
         """Convert text to uppercase and keep only letters"""
-        result = ""
-        for char in text:
-            if char.isalpha():
-                result += char.upper()
-        return result
-    
-    def apply_cipher(self, text: str, mapping: Dict[str, str]) -> str:
-        """Apply cipher mapping to each letter in text"""
-        result = ""
-        for char in text:
-            if char in mapping:
-                result += mapping[char]
-            else:
-                result += char  # keep non-mapped characters as is
-        return result
+        if text.isascii():
+            return text.upper().translate(ASCII_NON_LETTERS)
+        return ''.join(char.upper() for char in text if char.isalpha())
+    
+    def apply_cipher(self, text: TextLike, mapping: Dict[str, str]) -> TextLike:
+        """
+        Apply cipher mapping to each letter in text.
+        
+        The mapping is compiled into a translation table once (cached per
+        mapping) and applied in a single bulk pass. Non-mapped characters
+        are kept as is.
+        
+        Args:
+            text: Input as str, bytes or bytearray
+            mapping: Cipher mapping
+        
+        Returns:
+            Ciphertext of the same type as the input.
+        """
+        return compile_mapping(mapping).translate(text)
+    
+    def encode_bytes(self, data: BytesLike, mapping: Dict[str, str]):
+        """
+        Normalize and encode ASCII byte data in bulk.
+        
+        Normalization and encoding run as one fused table lookup: a single
+        bytes.translate for bytes input, a vectorized gather for NumPy
+        uint8 arrays. Only ASCII letters are kept.
+        
+        Args:
+            data: Input bytes or NumPy uint8 array
+            mapping: Cipher mapping
+        
+        Returns:
+            Ciphertext bytes (NumPy array for NumPy input).
+        """
+        return encode_bytes(data, mapping)
     
     def time_cipher_operation(self, text: str, mapping: Dict[str, str]) -> Tuple[float, float]:
-        """Measure time for cipher operation"""
+        """
+        Measure time for cipher operation (single run and 10,000-iteration average).
+        
+        This is the timing shown in the lab report. For statistically sound
+        measurements across input sizes use benchmarks/run_benchmarks.py.
+        """
         # Time single operation
         start = time.perf_counter()
         self.apply_cipher(text, mapping)
@@ -71,34 +134,56 @@ class CipherProcessor:
         
         return single_time, avg_per_char
     
-    def process_atbash(self, surname: str) -> Dict:
+    def encode_text(self, text: str, mapping: Dict[str, str]) -> Dict:
+        """
+        Normalize and encode text in one pipeline.
+        
+        The input is normalized once; the ciphertext and both numberings
+        are derived from that normalized text. Reverse numbers follow from
+        the direct ones (reverse = 27 - direct), so the text is not scanned
+        again for them.
+        
+        Args:
+            text: Input text
+            mapping: Cipher mapping
+        
+        Returns:
+            Dictionary with normalized text, ciphertext, direct and reverse numbers.
+        """
+        normalized = self.normalize_input(text)
+        direct_nums = [ord(char) - ord('A') + 1 for char in normalized if char.isalpha()]
+        return {
+            'normalized': normalized,
+            'ciphertext': self.apply_cipher(normalized, mapping),
+            'direct_numbers': direct_nums,
+            'reverse_numbers': [27 - number for number in direct_nums],
+        }
+    
+    def process_atbash(self, surname: str, measure_time: bool = True) -> Dict:
         """
         Process surname using Atbash cipher.
         
         Args:
             surname: Input surname
+            measure_time: Run the timing measurement (adds timing keys to the results)
         
         Returns:
             Dictionary with all results.
         """
-        normalized = self.normalize_input(surname)
-        ciphertext = self.apply_cipher(normalized, self.atbash_mapping)
-        direct_nums = get_direct_numbers(normalized)
-        reverse_nums = get_reverse_numbers(normalized)
+        results = self.encode_text(surname, self.atbash_mapping)
+        results['mapping_table'] = format_mapping_table(self.atbash_mapping, "Atbash Cipher (A↔Z)")
         
-        single_time, avg_time_per_char = self.time_cipher_operation(normalized, self.atbash_mapping)
+        if measure_time:
+            single_time, avg_time_per_char = self.time_cipher_operation(
+                results['normalized'], self.atbash_mapping
+            )
+            results['single_time_us'] = single_time
+            results['avg_time_per_char_us'] = avg_time_per_char
         
-        return {
-            'normalized': normalized,
-            'ciphertext': ciphertext,
-            'direct_numbers': direct_nums,
-            'reverse_numbers': reverse_nums,
-            'single_time_us': single_time,
-            'avg_time_per_char_us': avg_time_per_char,
-            'mapping_table': format_mapping_table(self.atbash_mapping, "Atbash Cipher (A↔Z)")
-        }
+        return results
     
-    def process_block(self, surname: str, part1: str = "ABCDEFGHIJKLM", part2: str = "NOPQRSTUVWXYZ") -> Dict:
+    def process_block(self, surname: str, part1: str = "ABCDEFGHIJKLM", part2: str = "NOPQRSTUVWXYZ",
+                      measure_time: bool = True, parts: Optional[Sequence[str]] = None) -> Dict:
         """
         Process surname using block cipher.
         
@@ -106,29 +191,93 @@ class CipherProcessor:
             surname: Input surname
             part1: First part of alphabet
             part2: Second part of alphabet
+            measure_time: Run the timing measurement (adds timing keys to the results)
+            parts: Any number of alphabet parts (overrides part1/part2)
         
         Returns:
             Dictionary with all results.
         """
-        normalized = self.normalize_input(surname)
-        block_mapping = build_block_mapping(part1, part2)
-        ciphertext = self.apply_cipher(normalized, block_mapping)
-        direct_nums = get_direct_numbers(normalized)
+        split = resolve_parts(part1, part2, parts)
+        block_mapping = get_split_mapping(split).mapping
+        results = self.encode_text(surname, block_mapping)
+        del results['reverse_numbers']
         
-        single_time, avg_time_per_char = self.time_cipher_operation(normalized, block_mapping)
-        part1_table, part2_table = get_part_tables(part1, part2)
+        results['parts'] = list(split)
+        results['part_tables'] = get_split_tables(split)
+        if len(split) == 2:
+            results['part1'], results['part2'] = split
+            results['part1_table'], results['part2_table'] = results['part_tables']
         
-        return {
-            'normalized': normalized,
-            'ciphertext': ciphertext,
-            'direct_numbers': direct_nums,
-            'single_time_us': single_time,
-            'avg_time_per_char_us': avg_time_per_char,
-            'part1_table': part1_table,
-            'part2_table': part2_table,
-            'part1': part1,
-            'part2': part2
-        }
+        if measure_time:
+            single_time, avg_time_per_char = self.time_cipher_operation(
+                results['normalized'], block_mapping
+            )
+            results['single_time_us'] = single_time
+            results['avg_time_per_char_us'] = avg_time_per_char
+        
+        return results
+    
+    def process_stream(self, source: TextIO, sink: TextIO, mapping: Dict[str, str],
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Encode a text stream chunk by chunk.
+        
+        Each chunk is normalized and ciphered on its own and written out
+        immediately, so memory use does not depend on the input size.
+        
+        Args:
+            source: Readable text stream (file, stdin, ...)
+            sink: Writable text stream for the ciphertext
+            mapping: Cipher mapping
+            chunk_size: Number of characters read per chunk
+        
+        Returns:
+            Number of ciphertext characters written.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        
+        written = 0
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            ciphertext = self.apply_cipher(self.normalize_input(chunk), mapping)
+            sink.write(ciphertext)
+            written += len(ciphertext)
+        return written
+    
+    def process_batch(self, records: Iterable[str], mode: str, workers: Optional[int] = None,
+                      batch_size: int = DEFAULT_BATCH_SIZE, part1: str = "ABCDEFGHIJKLM",
+                      part2: str = "NOPQRSTUVWXYZ", parts: Optional[Sequence[str]] = None) -> Iterator[str]:
+        """
+        Encode many records (e.g. surnames) in parallel.
+        
+        Records are split into chunks of batch_size and fanned out over a
+        process pool. Only a few chunks per worker are in flight at a time,
+        so the input can be an arbitrarily long iterator.
+        
+        Args:
+            records: Iterable of input texts
+            mode: 'stream' (Atbash) or 'block'
+            workers: Number of worker processes (None = CPU count, 1 = no pool)
+            batch_size: Number of records per chunk
+            part1: First part of alphabet for block mode
+            part2: Second part of alphabet for block mode
+            parts: Any number of alphabet parts for block mode (overrides part1/part2)
+        
+        Returns:
+            Generator of ciphertexts in the same order as the input records.
+        """
+        split = resolve_parts(part1, part2, parts)
+        self.get_mapping(mode, parts=split)  # validate mode and split before starting
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        return _iter_batch(records, mode, workers, batch_size, split)
     
     def verify_involution(self, text: str, mapping: Dict[str, str]) -> bool:
         """
@@ -141,10 +290,49 @@ class CipherProcessor:
         Returns:
             True if cipher is involution, False otherwise.
         """
-        normalized = self.normalize_input(text)
-        encrypted = self.apply_cipher(normalized, mapping)
-        decrypted = self.apply_cipher(encrypted, mapping)
-        return normalized == decrypted
+        # Decided from the (cached) mapping structure; the text only matters
+        # when the mapping is not an involution for some of its letters.
+        analysis = analyze_mapping(mapping)
+        if analysis.is_involution:
+            return True
+        return analysis.non_involutive.isdisjoint(self.normalize_input(text))
+
+
+def _encode_records(records: List[str], mode: str, parts: Tuple[str, ...]) -> List[str]:
+    """Encode one chunk of records (runs inside worker processes)."""
+    processor = CipherProcessor()
+    mapping = processor.get_mapping(mode, parts=parts)
+    return [processor.apply_cipher(processor.normalize_input(record), mapping) for record in records]
+
+
+def _iter_batch(records: Iterable[str], mode: str, workers: int, batch_size: int,
+                parts: Tuple[str, ...]) -> Iterator[str]:
+    """Yield encoded records chunk by chunk, keeping the input order."""
+    iterator = iter(records)
+    chunks = iter(lambda: list(islice(iterator, batch_size)), [])
+    
+    if workers == 1:
+        for chunk in chunks:
+            yield from _encode_records(chunk, mode, parts)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_encode_records, chunk, mode, parts))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def print_timing(results: Dict):
+    """Print timing results if they were measured."""
+    if 'single_time_us' not in results:
+        return
+    print(f"\nTiming:")
+    print(f"  Single operation: {results['single_time_us']:.3f} μs")
+    print(f"  Average per character (10,000 iterations): {results['avg_time_per_char_us']:.6f} μs/char")
 
 
 def print_atbash_results(results: Dict, surname: str):
@@ -163,9 +351,7 @@ def print_atbash_results(results: Dict, surname: str):
         print(f"  {char} = {results['reverse_numbers'][i]}")
     
     print(f"\nCiphertext: {results['ciphertext']}")
-    print(f"\nTiming:")
-    print(f"  Single operation: {results['single_time_us']:.3f} μs")
-    print(f"  Average per character (10,000 iterations): {results['avg_time_per_char_us']:.6f} μs/char")
+    print_timing(results)
 
 
 def print_block_results(results: Dict, surname: str):
@@ -173,34 +359,95 @@ def print_block_results(results: Dict, surname: str):
     print(f"\n=== TASK 1b: BLOCK CIPHER (Block Coding) ===")
     print(f"Input surname: {surname}")
     print(f"Normalized input: {results['normalized']}")
-    print(f"\nAlphabet split: {results['part1']} | {results['part2']}")
-    print(f"\n{results['part1_table']}")
-    print(f"{results['part2_table']}")
+    print(f"\nAlphabet split: {' | '.join(results['parts'])}")
+    print()
+    for table in results['part_tables']:
+        print(table)
     
     print(f"Direct numbers (A=1...Z=26):")
     for i, char in enumerate(results['normalized']):
         print(f"  {char} = {results['direct_numbers'][i]}")
     
     print(f"\nCiphertext: {results['ciphertext']}")
-    print(f"\nTiming:")
-    print(f"  Single operation: {results['single_time_us']:.3f} μs")
-    print(f"  Average per character (10,000 iterations): {results['avg_time_per_char_us']:.6f} μs/char")
+    print_timing(results)
+
+
+def open_stream(path: str, mode: str) -> TextIO:
+    """Open a file for streaming, '-' means stdin/stdout."""
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return open(path, mode, encoding='utf-8')
+
+
+def run_stream(processor: CipherProcessor, mapping: Dict[str, str],
+               input_path: str, output_path: str, chunk_size: int) -> int:
+    """Encode input file/stdin into output file/stdout."""
+    source = open_stream(input_path, 'r')
+    sink = open_stream(output_path, 'w')
+    try:
+        written = processor.process_stream(source, sink, mapping, chunk_size)
+        sink.write('\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return written
+
+
+def run_batch(processor: CipherProcessor, mode: str, input_path: str, output_path: str,
+              workers: Optional[int], batch_size: int, parts: Tuple[str, ...]) -> int:
+    """Encode one record per line from input file/stdin into output file/stdout."""
+    source = open_stream(input_path, 'r')
+    sink = open_stream(output_path, 'w')
+    count = 0
+    try:
+        records = (line.rstrip('\r\n') for line in source)
+        for ciphertext in processor.process_batch(records, mode, workers, batch_size, parts=parts):
+            sink.write(ciphertext + '\n')
+            count += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return count
 
 
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(description='Cipher processor for cryptography lab work')
-    parser.add_argument('--surname', required=True, help='Surname to encode')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--surname', help='Surname to encode')
+    source.add_argument('--input', metavar='FILE', help="Encode a file in streaming mode ('-' for stdin)")
+    source.add_argument('--batch', metavar='FILE', help="Encode one record per line in parallel ('-' for stdin)")
+    parser.add_argument('--output', metavar='FILE', default='-', help="Output file for streaming/batch mode ('-' for stdout)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Characters per chunk in streaming mode')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes in batch mode (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Records per worker chunk in batch mode')
     parser.add_argument('--mode', choices=['stream', 'block'], required=True, help='Cipher mode')
     parser.add_argument('--part1', default='ABCDEFGHIJKLM', help='First part for block cipher')
     parser.add_argument('--part2', default='NOPQRSTUVWXYZ', help='Second part for block cipher')
+    parser.add_argument('--parts', help='Comma-separated alphabet parts for block cipher (overrides --part1/--part2)')
+    parser.add_argument('--no-timing', action='store_true', help='Skip the timing measurement')
     
     args = parser.parse_args()
     
     processor = CipherProcessor()
+    split = resolve_parts(args.part1, args.part2, args.parts.split(',') if args.parts else None)
+    
+    if args.input is not None:
+        mapping = processor.get_mapping(args.mode, parts=split)
+        run_stream(processor, mapping, args.input, args.output, args.chunk_size)
+        return
+    
+    if args.batch is not None:
+        run_batch(processor, args.mode, args.batch, args.output, args.workers,
+                  args.batch_size, split)
+        return
     
     if args.mode == 'stream':
-        results = processor.process_atbash(args.surname)
+        results = processor.process_atbash(args.surname, measure_time=not args.no_timing)
         print_atbash_results(results, args.surname)
         
         # Verify involution
@@ -208,11 +455,11 @@ def main():
         print(f"\nInvolution test: {'PASSED' if is_involution else 'FAILED'}")
         
     elif args.mode == 'block':
-        results = processor.process_block(args.surname, args.part1, args.part2)
+        results = processor.process_block(args.surname, measure_time=not args.no_timing, parts=split)
         print_block_results(results, args.surname)
         
         # Verify involution
-        block_mapping = build_block_mapping(args.part1, args.part2)
+        block_mapping = processor.get_mapping('block', parts=split)
         is_involution = processor.verify_involution(args.surname, block_mapping)
         print(f"\nInvolution test: {'PASSED' if is_involution else 'FAILED'}")
 
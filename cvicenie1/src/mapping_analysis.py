@@ -0,0 +1,97 @@
+"""
+Structural analysis of substitution mappings
+Laboratory work No. 1
+
+Properties such as involution or bijectivity depend only on the mapping,
+not on the message, so they are computed once per mapping and cached.
+"""
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from translation import CompiledMapping, compile_mapping
+
+
+class MappingAnalysis(NamedTuple):
+    """Result of analyzing a substitution mapping"""
+    is_bijective: bool
+    is_involution: bool
+    fixed_points: Tuple[str, ...]
+    cycles: Tuple[Tuple[str, ...], ...]
+    non_involutive: FrozenSet[str]
+
+    @property
+    def cycle_type(self) -> List[int]:
+        """Sorted cycle lengths, e.g. [2, 2, ..., 1] for Atbash-like mappings"""
+        return sorted((len(cycle) for cycle in self.cycles), reverse=True)
+
+
+def find_cycles(mapping: Dict[str, str]) -> List[Tuple[str, ...]]:
+    """
+    Find all cycles of a substitution.
+
+    Characters outside the mapping are kept as is by the cipher, so they
+    act as fixed points. For a bijective mapping this is the full cycle
+    decomposition of the permutation; otherwise the cycles of its
+    functional graph are returned.
+
+    Args:
+        mapping: Letter-to-letter mapping
+
+    Returns:
+        List of cycles, each starting with its smallest character.
+    """
+    elements = sorted(set(mapping) | set(mapping.values()))
+    state = {}  # 1 = on current path, 2 = done
+    cycles = []
+
+    for start in elements:
+        path = []
+        char = start
+        while char not in state:
+            state[char] = 1
+            path.append(char)
+            char = mapping.get(char, char)
+        if state[char] == 1:
+            cycle = path[path.index(char):]
+            smallest = cycle.index(min(cycle))
+            cycles.append(tuple(cycle[smallest:] + cycle[:smallest]))
+        for visited in path:
+            state[visited] = 2
+
+    return cycles
+
+
+@lru_cache(maxsize=128)
+def _analyze_compiled(compiled: CompiledMapping) -> MappingAnalysis:
+    mapping = compiled.mapping
+    values = set(mapping.values())
+    is_bijective = len(values) == len(mapping) and values == set(mapping)
+    non_involutive = frozenset(
+        char for char, cipher in mapping.items() if mapping.get(cipher, cipher) != char
+    )
+    cycles = find_cycles(mapping)
+
+    return MappingAnalysis(
+        is_bijective=is_bijective,
+        is_involution=not non_involutive,
+        fixed_points=tuple(sorted(char for char, cipher in mapping.items() if char == cipher)),
+        cycles=tuple(cycles),
+        non_involutive=non_involutive,
+    )
+
+
+def analyze_mapping(mapping: Dict[str, str]) -> MappingAnalysis:
+    """
+    Analyze a mapping (cached per mapping contents).
+
+    Args:
+        mapping: Letter-to-letter mapping
+
+    Returns:
+        MappingAnalysis with bijectivity, involution, fixed points and cycles.
+    """
+    return _analyze_compiled(compile_mapping(mapping))
@@ -2,7 +2,14 @@
 Functions for creating cipher mappings
 Laboratory work No. 1
 """
-from typing import Dict, Tuple
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from translation import CompiledMapping, compile_mapping
 
 
 def build_atbash_mapping() -> Dict[str, str]:
@@ -20,21 +27,54 @@ def build_atbash_mapping() -> Dict[str, str]:
 
 def build_block_mapping(part1: str = "ABCDEFGHIJKLM", part2: str = "NOPQRSTUVWXYZ") -> Dict[str, str]:
     """Build mapping for block cipher (reverse within each part)"""
-    mapping = {}
+    return build_split_mapping((part1, part2))
+
+
+def build_split_mapping(parts: Sequence[str]) -> Dict[str, str]:
+    """
+    Build mapping for block cipher with any number of alphabet parts.
+    
+    Letters are reversed within each part, e.g. ("ABC", "DEFG") gives
+    A↔C, B↔B, D↔G, E↔F.
     
-    # Reverse first part
-    reversed_part1 = part1[::-1]
-    for i in range(len(part1)):
-        mapping[part1[i]] = reversed_part1[i]
+    Args:
+        parts: Alphabet parts (no letter may appear in more than one part)
     
-    # Reverse second part  
-    reversed_part2 = part2[::-1]
-    for i in range(len(part2)):
-        mapping[part2[i]] = reversed_part2[i]
+    Returns:
+        Letter-to-letter mapping.
+    
+    Raises:
+        ValueError: If a letter appears more than once
+    """
+    mapping = {}
+    for part in parts:
+        reversed_part = part[::-1]
+        for i in range(len(part)):
+            if part[i] in mapping:
+                raise ValueError(f"Letter '{part[i]}' appears in more than one part")
+            mapping[part[i]] = reversed_part[i]
     
     return mapping
 
 
+@lru_cache(maxsize=256)
+def get_split_mapping(parts: Tuple[str, ...]) -> CompiledMapping:
+    """
+    Get the compiled block mapping for an alphabet split from the registry.
+    
+    Results are kept in an LRU cache keyed by the parts, so repeated calls
+    with the same split return the same CompiledMapping (with its read-only
+    `mapping` view and translation tables) without rebuilding anything.
+    
+    Args:
+        parts: Tuple of alphabet parts, e.g. ("ABCDEFGHIJKLM", "NOPQRSTUVWXYZ")
+    
+    Returns:
+        CompiledMapping for the split.
+    """
+    return compile_mapping(build_split_mapping(parts))
+
+
 def get_direct_numbers(text: str) -> list[int]:
     """Get direct numbering A=1, B=2, ..., Z=26"""
     numbers = []
@@ -86,15 +126,24 @@ def get_part_tables(part1: str, part2: str) -> Tuple[str, str]:
     Returns:
         Tuple of (part1_table, part2_table) formatted strings.
     """
-    part1_reversed = part1[::-1]
-    part2_reversed = part2[::-1]
-    
-    part1_table = f"Part 1 ({part1[0]}-{part1[-1]}):\n"
-    part1_table += "Plain:  " + " ".join(part1) + "\n"
-    part1_table += "Cipher: " + " ".join(part1_reversed) + "\n"
+    part1_table, part2_table = get_split_tables((part1, part2))
+    return part1_table, part2_table
+
+
+def get_split_tables(parts: Sequence[str]) -> List[str]:
+    """
+    Get formatted tables for any number of block cipher parts.
     
-    part2_table = f"Part 2 ({part2[0]}-{part2[-1]}):\n"
-    part2_table += "Plain:  " + " ".join(part2) + "\n"
-    part2_table += "Cipher: " + " ".join(part2_reversed) + "\n"
+    Args:
+        parts: Alphabet parts
     
-    return part1_table, part2_table
\ No newline at end of file
+    Returns:
+        List of formatted tables, one per part.
+    """
+    tables = []
+    for number, part in enumerate(parts, start=1):
+        table = f"Part {number} ({part[0]}-{part[-1]}):\n"
+        table += "Plain:  " + " ".join(part) + "\n"
+        table += "Cipher: " + " ".join(part[::-1]) + "\n"
+        tables.append(table)
+    return tables
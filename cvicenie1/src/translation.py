@@ -0,0 +1,94 @@
+"""
+Compiled translation tables for substitution ciphers
+Laboratory work No. 1
+"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple, Union
+
+TextLike = Union[str, bytes, bytearray]
+
+
+def _build_bytes_table(items: FrozenSet[Tuple[str, str]]) -> Optional[bytes]:
+    """Build a 256-entry byte table, or None if the mapping is not single-byte"""
+    table = bytearray(range(256))
+    for plain, cipher in items:
+        if len(plain) != 1 or len(cipher) != 1:
+            return None
+        if ord(plain) > 0xFF or ord(cipher) > 0xFF:
+            return None
+        table[ord(plain)] = ord(cipher)
+    return bytes(table)
+
+
+class CompiledMapping:
+    """Substitution mapping compiled into str and bytes translation tables"""
+
+    def __init__(self, items: FrozenSet[Tuple[str, str]]):
+        # Read-only view: the mapping is shared by every caller of the cache
+        self.mapping: Mapping[str, str] = MappingProxyType(dict(items))
+        self.str_table = str.maketrans(dict(items))
+        self.bytes_table = _build_bytes_table(items)
+
+    def translate(self, data: TextLike) -> TextLike:
+        """
+        Apply the mapping to the whole input in one bulk pass.
+
+        Args:
+            data: Text as str, bytes or bytearray
+
+        Returns:
+            Translated data of the same type as the input.
+            Characters not present in the mapping are kept as is.
+        """
+        if isinstance(data, str):
+            return data.translate(self.str_table)
+        if isinstance(data, (bytes, bytearray)):
+            if self.bytes_table is None:
+                raise ValueError("Mapping cannot be applied to bytes (non single-byte characters)")
+            return data.translate(self.bytes_table)
+        raise TypeError(f"Unsupported input type: {type(data).__name__}")
+
+
+@lru_cache(maxsize=128)
+def _compile_items(items: FrozenSet[Tuple[str, str]]) -> CompiledMapping:
+    return CompiledMapping(items)
+
+
+# Fast path for callers that pass the same mapping object repeatedly:
+# keyed by id() and validated by comparing contents, so a reused id or
+# a mutated caller dict never returns a stale table. The compiled side
+# cannot change under the check, since CompiledMapping.mapping is a
+# read-only view.
+_IDENTITY_CACHE_SIZE = 128
+_identity_cache: Dict[int, CompiledMapping] = {}
+
+
+def compile_mapping(mapping: Mapping[str, str]) -> CompiledMapping:
+    """
+    Get the compiled form of a cipher mapping.
+
+    Compiled tables are cached by mapping contents, so equal mappings
+    (e.g. two results of build_block_mapping with the same parts) share
+    one CompiledMapping.
+
+    Args:
+        mapping: Letter-to-letter mapping
+
+    Returns:
+        CompiledMapping for the given mapping.
+    """
+    compiled = _identity_cache.get(id(mapping))
+    if compiled is not None and compiled.mapping == mapping:
+        return compiled
+
+    compiled = _compile_items(frozenset(mapping.items()))
+    if len(_identity_cache) >= _IDENTITY_CACHE_SIZE:
+        _identity_cache.clear()
+    _identity_cache[id(mapping)] = compiled
+    return compiled
+
+
+def translate(data: TextLike, mapping: Mapping[str, str]) -> TextLike:
+    """Translate str/bytes/bytearray data with a cipher mapping"""
+    return compile_mapping(mapping).translate(data)
@@ -0,0 +1,156 @@
+"""
+Bulk Atbash/block ciphers over ASCII byte data
+Laboratory work No. 1
+
+Normalization (uppercase, keep letters) and encoding are fused into one
+256-entry table. For bytes input it is applied with a single
+bytes.translate call; for NumPy uint8 arrays (or with use_numpy=True)
+it is applied as a lookup-table gather followed by a boolean mask.
+NumPy is optional - without it everything works on bytes.
+"""
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Optional, Union
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from translation import CompiledMapping, compile_mapping
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+    HAS_NUMPY = False
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Byte values that are not ASCII letters (removed by normalization)
+ASCII_NON_LETTER_BYTES = bytes(
+    code for code in range(256) if not (0x41 <= code <= 0x5A or 0x61 <= code <= 0x7A)
+)
+
+
+def _is_array(data) -> bool:
+    return HAS_NUMPY and isinstance(data, np.ndarray)
+
+
+def _as_array(data):
+    """View bytes-like input (or a NumPy array) as a uint8 array without copying."""
+    if _is_array(data):
+        return np.asarray(data, dtype=np.uint8)
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _use_numpy(use_numpy: Optional[bool], data) -> bool:
+    """Resolve the use_numpy option (None = NumPy only for NumPy array input)."""
+    if use_numpy is None:
+        return _is_array(data)
+    if use_numpy and not HAS_NUMPY:
+        raise ImportError("NumPy is not installed")
+    return use_numpy
+
+
+@lru_cache(maxsize=128)
+def _fused_table(compiled: CompiledMapping) -> bytes:
+    """Table mapping both letter cases to the cipher of the uppercase letter."""
+    if compiled.bytes_table is None:
+        raise ValueError("Mapping cannot be applied to bytes (non single-byte characters)")
+    table = bytearray(compiled.bytes_table)
+    for code in range(0x61, 0x7B):
+        table[code] = compiled.bytes_table[code & 0xDF]
+    return bytes(table)
+
+
+@lru_cache(maxsize=128)
+def _numpy_lookup_table(compiled: CompiledMapping):
+    table = bytearray(_fused_table(compiled))
+    for code in ASCII_NON_LETTER_BYTES:
+        table[code] = 0
+    return np.frombuffer(bytes(table), dtype=np.uint8)
+
+
+def build_lookup_table(mapping: Dict[str, str]):
+    """
+    Get the fused 256-entry uint8 lookup table for NumPy gathers.
+
+    Letters map to the cipher of their uppercase form, every other byte
+    maps to 0 so it can be masked out afterwards. Tables are cached per mapping.
+
+    Args:
+        mapping: Letter-to-letter mapping (single-byte characters only)
+
+    Returns:
+        NumPy array of shape (256,).
+    """
+    return _numpy_lookup_table(compile_mapping(mapping))
+
+
+def normalize_bytes(data: BytesLike, use_numpy: Optional[bool] = None):
+    """
+    Uppercase ASCII letters and drop every other byte.
+
+    This is the byte-level equivalent of CipherProcessor.normalize_input
+    for ASCII input; non-ASCII bytes are dropped.
+
+    Args:
+        data: Input bytes or NumPy uint8 array
+        use_numpy: Force (True) or disable (False) the NumPy path
+
+    Returns:
+        Normalized data containing only A-Z (NumPy array for the NumPy path).
+    """
+    if not _use_numpy(use_numpy, data):
+        return bytes(data).upper().translate(None, ASCII_NON_LETTER_BYTES)
+
+    arr = _as_array(data)
+    letters = arr[((arr >= 0x41) & (arr <= 0x5A)) | ((arr >= 0x61) & (arr <= 0x7A))]
+    # Clearing bit 0x20 turns a-z into A-Z
+    return letters & 0xDF
+
+
+def apply_cipher_bytes(data: BytesLike, mapping: Dict[str, str],
+                       use_numpy: Optional[bool] = None):
+    """
+    Apply a cipher mapping to every byte of the input.
+
+    Args:
+        data: Input bytes or NumPy uint8 array
+        mapping: Letter-to-letter mapping
+        use_numpy: Force (True) or disable (False) the NumPy path
+
+    Returns:
+        Ciphertext (NumPy array for the NumPy path); bytes not in the
+        mapping are kept as is.
+    """
+    compiled = compile_mapping(mapping)
+    if not _use_numpy(use_numpy, data):
+        return compiled.translate(bytes(data))
+
+    if compiled.bytes_table is None:
+        raise ValueError("Mapping cannot be applied to bytes (non single-byte characters)")
+    lut = np.frombuffer(compiled.bytes_table, dtype=np.uint8)
+    arr = _as_array(data)
+    return lut[arr]
+
+
+def encode_bytes(data: BytesLike, mapping: Dict[str, str],
+                 use_numpy: Optional[bool] = None):
+    """
+    Normalize and encode ASCII byte data in one pass.
+
+    Args:
+        data: Input bytes or NumPy uint8 array
+        mapping: Letter-to-letter mapping
+        use_numpy: Force (True) or disable (False) the NumPy path
+
+    Returns:
+        Ciphertext containing only encoded letters (NumPy array for the NumPy path).
+    """
+    if not _use_numpy(use_numpy, data):
+        return bytes(data).translate(_fused_table(compile_mapping(mapping)), ASCII_NON_LETTER_BYTES)
+
+    arr = _as_array(data)
+    encoded = build_lookup_table(mapping)[arr]
+    return encoded[encoded != 0]
@@ -11,9 +11,35 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from polybius import encode as polybius_encode, decode as polybius_decode
+from polybius import encode as polybius_encode, decode as polybius_decode, decode_stream
 from xor_utils import xor_chain, evaluate_expression
-from entropy import entropy_equiprobable
+from entropy import entropy_equiprobable, file_entropy
+
+
+class LinesAsTokens:
+    """
+    Read-only text stream wrapper that turns line breaks into token spaces.
+    
+    The newline ending the input is dropped, so a file saved with a final
+    newline does not decode to a trailing space.
+    """
+    
+    def __init__(self, source):
+        self.source = source
+        self._newline = False
+    
+    def read(self, size=-1):
+        while True:
+            chunk = self.source.read(size)
+            if not chunk:
+                return ''
+            if self._newline:
+                chunk = '\n' + chunk
+            self._newline = chunk.endswith('\n')
+            if self._newline:
+                chunk = chunk[:-1]
+            if chunk:
+                return chunk.replace('\n', ' ')
 
 
 def main():
@@ -24,8 +50,10 @@ def main():
 Examples:
   %(prog)s --encode "ENCRYPT ME 2 DAY"
   %(prog)s --decode "15 32 13 36 51 34 42"
+  %(prog)s --decode-file encoded.txt
   %(prog)s --xor 1011 0110 0100
   %(prog)s --entropy 8
+  %(prog)s --entropy-file ciphertext.bin
   %(prog)s --surname "BEDNÁR"
         """
     )
@@ -35,10 +63,14 @@ Examples:
                        help='Encode text using Polybius square')
     group.add_argument('--decode', type=str, metavar='PAIRS',
                        help='Decode Polybius-encoded text')
+    group.add_argument('--decode-file', type=str, metavar='FILE',
+                       help="Decode a Polybius-encoded file in chunks ('-' for stdin)")
     group.add_argument('--xor', nargs='+', metavar='BITSTRING',
                        help='XOR multiple bitstrings')
     group.add_argument('--entropy', type=int, metavar='N',
                        help='Calculate entropy for N equiprobable outcomes')
+    group.add_argument('--entropy-file', nargs='+', metavar='FILE',
+                       help='Calculate empirical byte entropy of files')
     group.add_argument('--surname', type=str, metavar='NAME',
                        help='Test surname encoding/decoding')
     
@@ -55,6 +87,18 @@ Examples:
         print("Input:", args.decode)
         print("Decoded:", decoded)
         
+    elif args.decode_file:
+        try:
+            if args.decode_file == '-':
+                decode_stream(LinesAsTokens(sys.stdin), sys.stdout)
+            else:
+                with open(args.decode_file, encoding='utf-8') as source:
+                    decode_stream(LinesAsTokens(source), sys.stdout)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print()
+        
     elif args.xor:
         if len(args.xor) < 2:
             print("Error: At least 2 bitstrings required for XOR", file=sys.stderr)
@@ -84,6 +128,15 @@ Examples:
             print(f"Error: {e}", file=sys.stderr)
             return 1
             
+    elif args.entropy_file:
+        try:
+            h = file_entropy(*args.entropy_file)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print("Files:", ', '.join(args.entropy_file))
+        print(f"Empirical entropy = {h:.6f} bits per byte (maximum 8)")
+        
     elif args.surname:
         from polybius import normalize_text
         pairs, concatenated = polybius_encode(args.surname)
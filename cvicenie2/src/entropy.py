@@ -1,9 +1,31 @@
 """
 Entropy calculations for ZKGRA Lab Work 2.
 
-This module provides entropy calculation for equiprobable distributions.
+This module provides entropy calculation for equiprobable distributions
+and empirical Shannon entropy estimators over streams of data.
+
+Symbol counts are kept in fixed-size lists indexed by symbol value, so
+memory does not grow with the input. Data is processed one chunk at a
+time; counts from several workers can be merged. NumPy is used for
+counting when it is installed, but it is optional.
 """
 import math
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+    HAS_NUMPY = False
+
+BytesLike = Union[bytes, bytearray, memoryview]
+Source = Union[BytesLike, str, Iterable, BinaryIO]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
 
 def entropy_equiprobable(n: int) -> float:
@@ -30,3 +52,331 @@ def entropy_equiprobable(n: int) -> float:
         raise ValueError("n must be positive")
     
     return math.log2(n)
+
+
+def entropy_from_counts(counts: Iterable[int]) -> float:
+    """
+    Calculate Shannon entropy of an empirical distribution.
+    
+    H = log2(N) - (1/N) * sum(c * log2(c)) where N is the total count.
+    
+    Args:
+        counts: Occurrence count of every symbol (zeros are ignored)
+        
+    Returns:
+        Entropy in bits per symbol (0.0 for no data)
+        
+    Examples:
+        entropy_from_counts([5, 5]) returns 1.0
+        entropy_from_counts([1, 1, 1, 1, 0]) returns 2.0
+    """
+    total = 0
+    weighted = 0.0
+    for count in counts:
+        if count:
+            total += count
+            weighted += count * math.log2(count)
+    if not total:
+        return 0.0
+    return max(0.0, math.log2(total) - weighted / total)
+
+
+def _is_bytes_like(data) -> bool:
+    return isinstance(data, (bytes, bytearray, memoryview))
+
+
+def iter_chunks(source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+    """
+    Split a source into chunks.
+    
+    Args:
+        source: bytes-like object or str (sliced into chunks), binary file
+               object (read chunk by chunk) or iterable of chunks
+        chunk_size: Chunk size for sliced and read sources
+        
+    Yields:
+        Chunks of the source
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    
+    if _is_bytes_like(source) or isinstance(source, str):
+        data = memoryview(source).cast('B') if _is_bytes_like(source) else source
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+    elif hasattr(source, 'read'):
+        yield from iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        yield from source
+
+
+class EntropyEstimator:
+    """
+    Streaming estimator of empirical Shannon entropy.
+    
+    Counts symbols 0..alphabet_size-1 in a fixed-size list. Chunks can be
+    bytes-like objects (bytes are symbols), str (code points are symbols)
+    or iterables of ints.
+    
+    Example:
+        estimator = EntropyEstimator()
+        for chunk in iter_chunks(open('ciphertext.bin', 'rb')):
+            estimator.update(chunk)
+        print(estimator.entropy())
+    """
+    
+    def __init__(self, alphabet_size: int = 256, counts: Optional[Sequence[int]] = None):
+        if alphabet_size <= 0:
+            raise ValueError("alphabet_size must be positive")
+        self.alphabet_size = alphabet_size
+        self.counts: List[int] = [0] * alphabet_size
+        if counts is not None:
+            if len(counts) != alphabet_size:
+                raise ValueError(f"Expected {alphabet_size} counts, got {len(counts)}")
+            self.counts = [int(count) for count in counts]
+    
+    @property
+    def total(self) -> int:
+        """Number of symbols counted so far."""
+        return sum(self.counts)
+    
+    def update(self, chunk) -> 'EntropyEstimator':
+        """
+        Count the symbols of one chunk.
+        
+        Args:
+            chunk: bytes-like object, str or iterable of ints
+            
+        Returns:
+            The estimator itself
+            
+        Raises:
+            ValueError: If a symbol is outside the alphabet
+        """
+        counts = self.counts
+        if _is_bytes_like(chunk) and HAS_NUMPY and self.alphabet_size >= 256:
+            binned = np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256).tolist()
+            for symbol in range(256):
+                counts[symbol] += binned[symbol]
+            return self
+        
+        if isinstance(chunk, str):
+            frequencies = Counter(map(ord, chunk))
+        else:
+            frequencies = Counter(chunk)
+        for symbol, count in frequencies.items():
+            if not 0 <= symbol < self.alphabet_size:
+                raise ValueError(f"Symbol {symbol} is outside the alphabet of size {self.alphabet_size}")
+            counts[symbol] += count
+        return self
+    
+    def update_stream(self, source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> 'EntropyEstimator':
+        """Count all symbols of a file, buffer or iterable of chunks."""
+        for chunk in iter_chunks(source, chunk_size):
+            self.update(chunk)
+        return self
+    
+    def merge(self, other: 'EntropyEstimator') -> 'EntropyEstimator':
+        """
+        Add the counts of another estimator (e.g. from a parallel worker).
+        
+        Returns:
+            The estimator itself
+        """
+        if other.alphabet_size != self.alphabet_size:
+            raise ValueError("Cannot merge estimators with different alphabet sizes")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+    
+    def entropy(self) -> float:
+        """Empirical entropy in bits per symbol."""
+        return entropy_from_counts(self.counts)
+    
+    def __repr__(self) -> str:
+        return f"EntropyEstimator(alphabet_size={self.alphabet_size}, total={self.total})"
+
+
+def sliding_window_entropy(source: Source, window: int, step: int = 1,
+                           alphabet_size: int = 256,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[float]:
+    """
+    Entropy of every full window of a stream, updated incrementally.
+    
+    Each step only adjusts the counts of the symbols entering and leaving
+    the window and the running sum of c*log2(c), taken from a precomputed
+    table, so the cost per symbol does not depend on the window size.
+    
+    Args:
+        source: Data source (see iter_chunks)
+        window: Window length in symbols
+        step: Report the entropy every `step` symbols
+        alphabet_size: Number of distinct symbols
+        chunk_size: Chunk size for reading the source
+        
+    Yields:
+        Entropy in bits per symbol of windows ending at positions
+        window, window + step, window + 2*step, ...
+        
+    Raises:
+        ValueError: If a symbol is outside the alphabet
+    """
+    if window <= 0 or step <= 0:
+        raise ValueError("window and step must be positive")
+    
+    # c * log2(c) for every possible count inside the window
+    c_log_c = [0.0] + [c * math.log2(c) for c in range(1, window + 1)]
+    log_window = math.log2(window)
+    counts = [0] * alphabet_size
+    buffer = deque()
+    weighted = 0.0
+    seen = 0
+    
+    for chunk in iter_chunks(source, chunk_size):
+        if _is_bytes_like(chunk) and alphabet_size >= 256:
+            symbols = chunk
+        else:
+            symbols = list(map(ord, chunk)) if isinstance(chunk, str) else list(chunk)
+            if symbols and (min(symbols) < 0 or max(symbols) >= alphabet_size):
+                symbol = next(x for x in symbols if not 0 <= x < alphabet_size)
+                raise ValueError(f"Symbol {symbol} is outside the alphabet of size {alphabet_size}")
+        for symbol in symbols:
+            count = counts[symbol]
+            weighted += c_log_c[count + 1] - c_log_c[count]
+            counts[symbol] = count + 1
+            buffer.append(symbol)
+            seen += 1
+            
+            if seen > window:
+                old = buffer.popleft()
+                count = counts[old]
+                weighted += c_log_c[count - 1] - c_log_c[count]
+                counts[old] = count - 1
+            
+            if seen >= window and (seen - window) % step == 0:
+                yield max(0.0, log_window - weighted / window)
+
+
+class BlockEntropyEstimator:
+    """
+    Streaming estimator of block entropy of order k.
+    
+    Counts overlapping k-symbol blocks (k-grams) of a byte stream,
+    including blocks spanning chunk boundaries. For k <= 2 the counts
+    live in a fixed list of 256**k entries; for larger k a dictionary of
+    at most max_blocks distinct blocks is used and ValueError is raised
+    when the bound would be exceeded.
+    """
+    
+    def __init__(self, k: int, max_blocks: int = 1 << 20):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.max_blocks = max_blocks
+        self._tail = b''
+        if k <= 2:
+            self.counts: Union[List[int], Dict[bytes, int]] = [0] * (256 ** k)
+        else:
+            self.counts = {}
+    
+    def update(self, chunk: BytesLike) -> 'BlockEntropyEstimator':
+        """Count the k-grams ending in this chunk."""
+        k = self.k
+        data = self._tail + bytes(chunk)
+        self._tail = data[len(data) - k + 1:] if k > 1 else b''
+        if len(data) < k:
+            return self
+        
+        if k <= 2 and HAS_NUMPY:
+            arr = np.frombuffer(data, dtype=np.uint8).astype(np.intp)
+            if k == 2:
+                arr = (arr[:-1] << 8) | arr[1:]
+            binned = np.bincount(arr, minlength=256 ** k)
+            blocks = dict(zip(np.flatnonzero(binned).tolist(), binned[binned != 0].tolist()))
+        elif k == 1:
+            blocks = Counter(data)
+        elif k == 2:
+            blocks = {hi << 8 | lo: count for (hi, lo), count in Counter(zip(data, data[1:])).items()}
+        else:
+            blocks = Counter(data[i:i + k] for i in range(len(data) - k + 1))
+        
+        counts = self.counts
+        if isinstance(counts, dict):
+            new = sum(1 for block in blocks if block not in counts)
+            if len(counts) + new > self.max_blocks:
+                raise ValueError(f"More than {self.max_blocks} distinct blocks of order {k}")
+            for block, count in blocks.items():
+                counts[block] = counts.get(block, 0) + count
+        else:
+            for block, count in blocks.items():
+                counts[block] += count
+        return self
+    
+    def update_stream(self, source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> 'BlockEntropyEstimator':
+        """Count all k-grams of a file, buffer or iterable of chunks."""
+        for chunk in iter_chunks(source, chunk_size):
+            self.update(chunk)
+        return self
+    
+    def entropy(self) -> float:
+        """Block entropy H_k in bits per block."""
+        counts = self.counts.values() if isinstance(self.counts, dict) else self.counts
+        return entropy_from_counts(counts)
+    
+    def entropy_rate(self) -> float:
+        """Block entropy divided by k, in bits per symbol."""
+        return self.entropy() / self.k
+
+
+def block_entropy(source: Source, k: int, max_blocks: int = 1 << 20,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+    """
+    Block entropy of order k of a byte stream.
+    
+    Args:
+        source: Byte data source (see iter_chunks)
+        k: Block length
+        max_blocks: Maximum number of distinct blocks kept in memory (k > 2)
+        chunk_size: Chunk size for reading the source
+        
+    Returns:
+        H_k in bits per block
+    """
+    return BlockEntropyEstimator(k, max_blocks).update_stream(source, chunk_size).entropy()
+
+
+def _count_file(path: str, chunk_size: int) -> List[int]:
+    """Worker: byte counts of one file."""
+    with open(path, 'rb') as f:
+        return EntropyEstimator().update_stream(f, chunk_size).counts
+
+
+def file_entropy(*paths: str, workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+    """
+    Byte entropy of one or more files taken together.
+    
+    Files are counted in parallel worker processes and their counts are
+    merged; with workers=1 (or a single file) everything runs in-process.
+    
+    Args:
+        *paths: Files to scan
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Chunk size for reading the files
+        
+    Returns:
+        Entropy in bits per byte
+    """
+    if not paths:
+        raise ValueError("At least one file is required")
+    
+    workers = workers or os.cpu_count() or 1
+    estimator = EntropyEstimator()
+    if workers == 1 or len(paths) == 1:
+        for path in paths:
+            estimator.merge(EntropyEstimator(counts=_count_file(path, chunk_size)))
+        return estimator.entropy()
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        for counts in executor.map(_count_file, paths, [chunk_size] * len(paths)):
+            estimator.merge(EntropyEstimator(counts=counts))
+    return estimator.entropy()
@@ -5,7 +5,9 @@ This module provides encoding and decoding functionality using a 6x6 Polybius sq
 that includes A-Z letters and 0-9 digits.
 """
 import unicodedata
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, TextIO, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
 
 
 # Hardcoded 6x6 Polybius grid (row, column both 1-based)
@@ -21,10 +23,79 @@ POLYBIUS_GRID = {
 # Reverse mapping for decoding
 REVERSE_GRID = {v: k for k, v in POLYBIUS_GRID.items()}
 
+SPACE = ord(' ')
+
+
+def _byte_table(values: Dict[int, int]) -> bytes:
+    """Build a 256-entry translation table (unlisted bytes map to 0)."""
+    table = bytearray(256)
+    for code, value in values.items():
+        table[code] = value
+    return bytes(table)
+
+
+# Byte-level codec tables. Every encodable byte (A-Z, 0-9, space) is
+# expanded into up to three output bytes: first digit, second digit and
+# pair separator. Space produces a single ' ' followed by 0 markers which
+# are deleted afterwards, so no per-character Python code is needed.
+_UPPERCASE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_NOT_ENCODABLE = bytes(
+    code for code in range(256)
+    if code != SPACE and chr(code).upper() not in POLYBIUS_GRID
+)
+_CODE_HI = _byte_table({**{ord(c): ord(code[0]) for c, code in POLYBIUS_GRID.items()}, SPACE: SPACE})
+_CODE_LO = _byte_table({ord(c): ord(code[1]) for c, code in POLYBIUS_GRID.items()})
+_PAIR_SEP = _byte_table({ord(c): SPACE for c in POLYBIUS_GRID})
+
+
+def _fold_char(char: str) -> str:
+    """Fold one character: NFD decomposition without nonspacing marks."""
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', char)
+        if unicodedata.category(c) != 'Mn'  # Mn = Mark, Nonspacing
+    )
+
+
+def _fold_code(code: int) -> Union[int, str, None]:
+    """Translation table entry for one code point (int is fastest for str.translate)."""
+    folded = _fold_char(chr(code))
+    if len(folded) == 1:
+        return ord(folded)
+    return folded or None
+
+
+class _FoldTable(dict):
+    """
+    Code point -> folded character table for str.translate.
+    
+    ASCII and Latin ranges are precomputed; other characters are folded on
+    first use and remembered until the table reaches max_size entries.
+    """
+    
+    def __init__(self, ranges, max_size: int = 4096):
+        super().__init__(
+            (code, _fold_code(code)) for start, end in ranges for code in range(start, end)
+        )
+        self.max_size = max_size
+    
+    def __missing__(self, code: int) -> Union[int, str, None]:
+        folded = _fold_code(code)
+        if len(self) < self.max_size:
+            self[code] = folded
+        return folded
+
+
+# ASCII, Latin-1 Supplement, Latin Extended-A (all Slovak/Czech letters) and Extended-B
+FOLD_TABLE = _FoldTable([(0x0000, 0x0080), (0x00C0, 0x0250)])
+
 
 def remove_diacritics(text: str) -> str:
     """
-    Remove diacritics from text using unicodedata.
+    Remove diacritics from text using a cached folding table.
+    
+    Each character is folded like unicodedata NFD normalization followed
+    by removal of nonspacing marks; folds are looked up in FOLD_TABLE and
+    applied with a single str.translate call.
     
     Args:
         text: Input text that may contain diacritics
@@ -32,13 +103,11 @@ def remove_diacritics(text: str) -> str:
     Returns:
         Text with diacritics removed (e.g., "Á" -> "A", "Č" -> "C")
     """
-    # Normalize to NFD (decomposed form) then filter out combining marks
-    nfd = unicodedata.normalize('NFD', text)
-    result = ''
-    for char in nfd:
-        if unicodedata.category(char) != 'Mn':  # Mn = Mark, Nonspacing
-            result += char
-    return result
+    # Pure ASCII text has no diacritics
+    if text.isascii():
+        return text
+    
+    return text.translate(FOLD_TABLE)
 
 
 def normalize_text(text: str) -> str:
@@ -55,6 +124,48 @@ def normalize_text(text: str) -> str:
     return text.upper()
 
 
+def encode_bytes(data: BytesLike) -> Tuple[bytes, bytes]:
+    """
+    Encode ASCII byte data using Polybius square.
+    
+    Works on whole buffers with precomputed 256-entry tables: the digits
+    of all pairs are produced by bytes.translate and written into one
+    preallocated bytearray through slice assignment, so no per-character
+    lists or strings are built. Lowercase letters are uppercased and bytes
+    that cannot be encoded are skipped.
+    
+    Args:
+        data: ASCII input (bytes, bytearray or memoryview)
+        
+    Returns:
+        Tuple of (space-separated pairs, concatenated) as bytes
+    """
+    filtered = bytes(data).translate(_UPPERCASE, _NOT_ENCODABLE)
+    length = len(filtered)
+    if not length:
+        return b'', b''
+    
+    high = filtered.translate(_CODE_HI)
+    low = filtered.translate(_CODE_LO)
+    
+    concatenated = bytearray(2 * length)
+    concatenated[0::2] = high
+    concatenated[1::2] = low
+    
+    pairs = bytearray(3 * length)
+    pairs[0::3] = high
+    pairs[1::3] = low
+    pairs[2::3] = filtered.translate(_PAIR_SEP)
+    
+    if SPACE in filtered:
+        # Drop the 0 markers emitted for spaces
+        concatenated = concatenated.translate(None, b'\x00')
+        pairs = pairs.translate(None, b'\x00')
+    
+    # Last byte is the separator after the final token
+    return bytes(pairs[:-1]), bytes(concatenated)
+
+
 def encode(text: str) -> Tuple[str, str]:
     """
     Encode text using Polybius square.
@@ -71,25 +182,14 @@ def encode(text: str) -> Tuple[str, str]:
             ("15 32 13 36 51 34 42  31 15  55  14 11 51",
              "15321336513442 3115 55 141151")
     """
-    normalized = normalize_text(text)
-    
-    pairs_parts = []
-    concatenated = []
-    
-    for char in normalized:
-        if char == ' ':
-            # Add empty string to create double space when joined
-            pairs_parts.append('')
-            concatenated.append(' ')
-        elif char in POLYBIUS_GRID:
-            code = POLYBIUS_GRID[char]
-            pairs_parts.append(code)
-            concatenated.append(code)
+    if text.isascii():
+        data = text.encode('ascii')
+    else:
+        # Characters without an ASCII form cannot be encoded and are skipped
+        data = normalize_text(text).encode('ascii', errors='ignore')
     
-    pairs_str = ' '.join(pairs_parts)
-    concat_str = ''.join(concatenated)
-    
-    return pairs_str, concat_str
+    pairs, concatenated = encode_bytes(data)
+    return pairs.decode('ascii'), concatenated.decode('ascii')
 
 
 def decode(pairs_string: str) -> str:
@@ -106,7 +206,11 @@ def decode(pairs_string: str) -> str:
     Examples:
         decode("15 32 13 36 51 34 42") returns "ENCRYPT"
     """
-    tokens = pairs_string.split(' ')
+    return _decode_tokens(pairs_string.split(' '))
+
+
+def _decode_tokens(tokens) -> str:
+    """Decode a sequence of space-separated tokens."""
     result = []
     
     for token in tokens:
@@ -122,3 +226,93 @@ def decode(pairs_string: str) -> str:
             result.append(' ')
     
     return ''.join(result)
+
+
+class PolybiusDecoder:
+    """
+    Incremental Polybius decoder.
+    
+    Accepts encoded text in chunks of any size (tokens may be split across
+    chunk boundaries) and returns plaintext as soon as tokens are complete.
+    Feeding all chunks and calling finish() gives the same result as
+    decode() on the whole input.
+    
+    Example:
+        decoder = PolybiusDecoder()
+        text = decoder.feed("15 32 1") + decoder.feed("3  31") + decoder.finish()
+    """
+    
+    def __init__(self):
+        self._pending = ''
+    
+    def feed(self, chunk: str) -> str:
+        """
+        Decode the complete tokens available after adding a chunk.
+        
+        Args:
+            chunk: Next part of the encoded text
+            
+        Returns:
+            Plaintext for all tokens completed by this chunk
+        """
+        tokens = (self._pending + chunk).split(' ')
+        pending = tokens.pop()
+        if len(pending) > 2:
+            # A token longer than 2 can never be a valid code; only whether
+            # it is all digits matters, so keep a 3-char stand-in instead
+            # of letting an endless token grow in memory.
+            pending = '000' if pending.isdigit() else '???'
+        self._pending = pending
+        return _decode_tokens(tokens)
+    
+    def finish(self) -> str:
+        """
+        Decode the last (unterminated) token and reset the decoder.
+        
+        Returns:
+            Plaintext for the final token
+        """
+        token, self._pending = self._pending, ''
+        return _decode_tokens([token])
+
+
+def iter_decode(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Decode an iterable of encoded chunks lazily.
+    
+    Args:
+        chunks: Encoded text split into arbitrary chunks
+        
+    Yields:
+        Plaintext pieces (possibly empty strings are skipped)
+    """
+    decoder = PolybiusDecoder()
+    for chunk in chunks:
+        plain = decoder.feed(chunk)
+        if plain:
+            yield plain
+    plain = decoder.finish()
+    if plain:
+        yield plain
+
+
+def decode_stream(source: TextIO, sink: TextIO, chunk_size: int = 64 * 1024) -> int:
+    """
+    Decode a text stream into another stream at constant memory.
+    
+    Args:
+        source: Readable text stream with Polybius-encoded text
+        sink: Writable text stream for the plaintext
+        chunk_size: Number of characters read at once
+        
+    Returns:
+        Number of plaintext characters written
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    
+    written = 0
+    for plain in iter_decode(iter(lambda: source.read(chunk_size), '')):
+        sink.write(plain)
+        written += len(plain)
+    return written
@@ -2,47 +2,249 @@
 XOR utilities for ZKGRA Lab Work 2.
 
 This module provides XOR operations on bitstrings and evaluation of XOR expressions.
+
+Operands are packed into Python ints once (bitstrings with int(bs, 2),
+byte buffers with int.from_bytes), XORed as whole numbers and unpacked
+only at the end, so no per-bit Python work is done.
 """
-from typing import List
+import re
+from collections import Counter
+from functools import lru_cache, reduce
+from operator import xor
+from typing import List, NamedTuple, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+Operand = Union[str, bytes, bytearray, memoryview]
+
+
+def pack_bitstring(bitstring: str) -> int:
+    """
+    Pack a bitstring into an int (most significant bit first).
+    
+    Args:
+        bitstring: String of '0' and '1' characters
+        
+    Returns:
+        Integer value of the bitstring (0 for an empty string)
+        
+    Raises:
+        ValueError: If the bitstring contains other characters
+    """
+    if not bitstring.isascii() or bitstring.replace('0', '').replace('1', ''):
+        raise ValueError(f"Bitstring must contain only '0' and '1': {bitstring}")
+    return int(bitstring, 2) if bitstring else 0
+
+
+def unpack_bitstring(value: int, length: int) -> str:
+    """
+    Unpack an int into a zero-padded bitstring of the given length.
+    
+    Args:
+        value: Non-negative integer smaller than 2**length
+        length: Number of bits
+        
+    Returns:
+        Bitstring of exactly `length` characters
+    """
+    return format(value, f'0{length}b') if length else ''
+
+
+def _is_bytes_like(operand) -> bool:
+    return isinstance(operand, (bytes, bytearray, memoryview))
 
 
-def xor_chain(*bitstrings: str) -> str:
+def _pack_operands(operands: Tuple[Operand, ...]) -> Tuple[List[int], int, bool]:
+    """
+    Validate operands and pack them into ints.
+    
+    Returns:
+        Tuple of (packed values, length, True if operands are byte buffers)
+    """
+    if not operands:
+        raise ValueError("At least one bitstring is required")
+    
+    as_bytes = _is_bytes_like(operands[0])
+    buffers = [memoryview(op).cast('B') if as_bytes else op for op in operands]
+    length = len(buffers[0])
+    packed = []
+    
+    for op, buf in zip(operands, buffers):
+        if _is_bytes_like(op) != as_bytes:
+            raise TypeError("Cannot mix bitstrings and byte buffers")
+        if len(buf) != length:
+            raise ValueError(f"All bitstrings must be the same length (expected {length}, got {len(buf)})")
+        packed.append(int.from_bytes(buf, 'big') if as_bytes else pack_bitstring(op))
+    
+    return packed, length, as_bytes
+
+
+def xor_chain(*bitstrings: Operand) -> Union[str, bytes]:
     """
     XOR multiple bitstrings of the same length.
     
+    Byte buffers (bytes, bytearray, memoryview) are accepted as well and
+    XORed byte by byte; all operands must then be byte buffers.
+    
     Args:
         *bitstrings: Variable number of bitstring arguments (e.g., "1011", "0110")
                     All must be the same length and contain only '0' and '1'
         
     Returns:
-        XOR result as a bitstring
+        XOR result as a bitstring (bytes for byte buffer operands)
         
     Raises:
         ValueError: If bitstrings are not the same length or contain invalid characters
+        TypeError: If bitstrings and byte buffers are mixed
         
     Examples:
         xor_chain("1011", "0110") returns "1101"
         xor_chain("1011", "0110", "0100") returns "1001"
+        xor_chain(b"\x0f", b"\xff") returns b"\xf0"
     """
-    if not bitstrings:
-        raise ValueError("At least one bitstring is required")
+    packed, length, as_bytes = _pack_operands(bitstrings)
+    result = reduce(xor, packed)
+    
+    if as_bytes:
+        return result.to_bytes(length, 'big')
+    return unpack_bitstring(result, length)
+
+
+def xor_bytes(*buffers: BytesLike) -> bytes:
+    """
+    XOR multiple byte buffers of the same length.
     
-    # Validate all bitstrings
-    length = len(bitstrings[0])
-    for bs in bitstrings:
-        if len(bs) != length:
-            raise ValueError(f"All bitstrings must be the same length (expected {length}, got {len(bs)})")
-        if not all(c in '01' for c in bs):
-            raise ValueError(f"Bitstring must contain only '0' and '1': {bs}")
+    Args:
+        *buffers: bytes, bytearray or memoryview operands
+        
+    Returns:
+        XOR of all buffers as bytes
+    """
+    if not all(_is_bytes_like(buf) for buf in buffers):
+        raise TypeError("xor_bytes() operands must be bytes, bytearray or memoryview")
+    return xor_chain(*buffers)
+
+
+class CompiledExpression(NamedTuple):
+    """XOR expression reduced to the operands that do not cancel out."""
+    names: Tuple[str, ...]
+    terms: Tuple[str, ...]
+
+
+_TOKEN = re.compile(r'\s*(?:([A-Za-z_]\w*)|(\^|⊕|\+|\(|\)))')
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expression: str) -> CompiledExpression:
+    """
+    Parse an XOR expression and cancel operands that appear an even number of times.
+    
+    Operands are names (e.g. "a", "key1"), operators are ^, ⊕, + or the word
+    XOR. Parentheses are allowed but have no effect, since XOR is
+    associative and commutative. Compiled expressions are cached.
+    
+    Args:
+        expression: Expression such as "a ⊕ b ⊕ c ⊕ a ⊕ b"
+        
+    Returns:
+        CompiledExpression with all referenced names and the remaining terms
+        
+    Raises:
+        ValueError: If the expression is malformed
+        
+    Examples:
+        compile_expression("a ^ b ^ c ^ a ^ b").terms == ("c",)
+    """
+    names = []
+    depth = 0
+    expect_operand = True
+    pos = 0
+    expression = expression.rstrip()
+    
+    while pos < len(expression):
+        match = _TOKEN.match(expression, pos)
+        if not match:
+            raise ValueError(f"Invalid XOR expression at position {pos}: {expression!r}")
+        pos = match.end()
+        name, symbol = match.groups()
+        if name and name.upper() == 'XOR':
+            name, symbol = None, '^'
+        
+        if name:
+            if not expect_operand:
+                raise ValueError(f"Missing operator before {name!r}: {expression!r}")
+            names.append(name)
+            expect_operand = False
+        elif symbol == '(':
+            if not expect_operand:
+                raise ValueError(f"Missing operator before '(': {expression!r}")
+            depth += 1
+        elif symbol == ')':
+            if expect_operand or depth == 0:
+                raise ValueError(f"Unexpected ')': {expression!r}")
+            depth -= 1
+        else:
+            if expect_operand:
+                raise ValueError(f"Missing operand before {symbol!r}: {expression!r}")
+            expect_operand = True
+    
+    if expect_operand or depth:
+        raise ValueError(f"Incomplete XOR expression: {expression!r}")
+    
+    # x ⊕ x = 0, so only names with an odd count remain
+    counts = Counter(names)
+    unique = tuple(dict.fromkeys(names))
+    return CompiledExpression(
+        names=unique,
+        terms=tuple(name for name in unique if counts[name] % 2),
+    )
+
+
+def evaluate_xor(expression: str, **operands: Operand) -> Union[str, bytes]:
+    """
+    Evaluate an XOR expression over named operands.
+    
+    The expression is simplified first, so cancelled operands are never
+    XORed; they are still checked for type, length and (for bitstrings)
+    valid characters.
+    
+    Args:
+        expression: Expression over operand names (see compile_expression)
+        **operands: Values of the names (bitstrings or byte buffers)
+        
+    Returns:
+        Result as a bitstring (bytes for byte buffer operands)
+        
+    Raises:
+        ValueError: If the expression is malformed, an operand is missing,
+                   the operands do not have the same length or a
+                   bitstring contains characters other than '0' and '1'
+        
+    Examples:
+        evaluate_xor("a ^ b ^ a", a="1011", b="0110") returns "0110"
+    """
+    compiled = compile_expression(expression)
+    missing = [name for name in compiled.names if name not in operands]
+    if missing:
+        raise ValueError(f"Missing operands: {', '.join(missing)}")
     
-    # Perform XOR
-    result = [int(c) for c in bitstrings[0]]
+    values = [operands[name] for name in compiled.names]
+    as_bytes = _is_bytes_like(values[0])
+    length = len(memoryview(values[0]).cast('B')) if as_bytes else len(values[0])
+    for value in values:
+        if _is_bytes_like(value) != as_bytes:
+            raise TypeError("Cannot mix bitstrings and byte buffers")
+        size = len(memoryview(value).cast('B')) if as_bytes else len(value)
+        if size != length:
+            raise ValueError(f"All bitstrings must be the same length (expected {length}, got {size})")
     
-    for bs in bitstrings[1:]:
-        for i, c in enumerate(bs):
-            result[i] ^= int(c)
+    if not as_bytes:
+        # Remaining terms are validated by xor_chain
+        for name in set(compiled.names).difference(compiled.terms):
+            pack_bitstring(operands[name])
     
-    return ''.join(str(b) for b in result)
+    if not compiled.terms:
+        return bytes(length) if as_bytes else '0' * length
+    return xor_chain(*(operands[name] for name in compiled.terms))
 
 
 def evaluate_expression(a: str, b: str, c: str) -> str:
@@ -63,6 +265,5 @@ def evaluate_expression(a: str, b: str, c: str) -> str:
         evaluate_expression("1011", "0110", "0100") returns "0100"
         evaluate_expression("0101", "1110", "1101") returns "1101"
     """
-    # Mathematically: a ⊕ b ⊕ c ⊕ a ⊕ b = c
-    # But we'll compute it explicitly to demonstrate
-    return xor_chain(a, b, c, a, b)
+    # The simplification pass reduces the expression to c before any XOR
+    return evaluate_xor("a ⊕ b ⊕ c ⊕ a ⊕ b", a=a, b=b, c=c)
@@ -15,7 +15,10 @@ try:
 except ImportError:
     HAS_PYTEST = False
 
-from entropy import entropy_equiprobable
+from entropy import (
+    entropy_equiprobable, entropy_from_counts, EntropyEstimator, BlockEntropyEstimator,
+    sliding_window_entropy, block_entropy, file_entropy
+)
 
 
 def test_entropy_power_of_2():
@@ -93,6 +96,95 @@ def test_entropy_formula():
         assert abs(actual - expected) < 0.0000001, f"H({n}) mismatch"
 
 
+def test_entropy_from_counts():
+    """Test empirical entropy of count vectors."""
+    assert entropy_from_counts([]) == 0.0
+    assert entropy_from_counts([7, 0, 0]) == 0.0
+    assert entropy_from_counts([3, 3]) == 1.0
+    assert abs(entropy_from_counts([1] * 10) - entropy_equiprobable(10)) < 1e-12
+
+
+def test_estimator_streaming_and_merge():
+    """Test that chunked counting and merged worker counts agree."""
+    import io
+    import random
+    data = random.Random(3).randbytes(10000) + b"A" * 5000
+    whole = EntropyEstimator().update(data)
+    
+    streamed = EntropyEstimator().update_stream(io.BytesIO(data), chunk_size=777)
+    assert streamed.counts == whole.counts
+    
+    merged = EntropyEstimator().update(data[:6000]).merge(EntropyEstimator().update(memoryview(data)[6000:]))
+    assert merged.counts == whole.counts
+    assert merged.total == len(data)
+    
+    text = EntropyEstimator(alphabet_size=128).update("ABAB")
+    assert text.entropy() == 1.0
+    try:
+        EntropyEstimator(alphabet_size=128).update("Á")
+        assert False, "Should raise ValueError for symbol outside the alphabet"
+    except ValueError as e:
+        assert "alphabet" in str(e)
+
+
+def test_sliding_window_entropy():
+    """Test incremental window entropy against direct computation."""
+    import random
+    rng = random.Random(5)
+    data = bytes(rng.choice(b"ABCD") for _ in range(300))
+    window, step = 32, 5
+    results = list(sliding_window_entropy(iter([data[:100], data[100:]]), window, step))
+    
+    starts = range(0, len(data) - window + 1, step)
+    assert len(results) == len(starts)
+    for start, h in zip(starts, results):
+        expected = EntropyEstimator().update(data[start:start + window]).entropy()
+        assert abs(h - expected) < 1e-9
+    
+    assert list(sliding_window_entropy(b"AAAABBBB", 4)) == [0.0, 0.8112781244591329, 1.0, 0.8112781244591329, 0.0]
+
+
+def test_sliding_window_entropy_rejects_symbols_outside_alphabet():
+    """Test that negative and too large symbols raise ValueError."""
+    assert list(sliding_window_entropy([[0, 1, 1, 0]], 2, alphabet_size=2)) == [1.0, 0.0, 1.0]
+    for chunk, size in (([0, -1, 1], 2), ([0, 2], 2), (b"\x00\x05", 4), ("Ab", 66)):
+        try:
+            list(sliding_window_entropy([chunk], 1, alphabet_size=size))
+            assert False, f"Should raise ValueError for {chunk!r}"
+        except ValueError as e:
+            assert "alphabet" in str(e)
+
+
+def test_block_entropy():
+    """Test block entropy across chunk boundaries and the memory bound."""
+    assert block_entropy(b"ABABABAB", 1) == 1.0
+    # Blocks AB, BA, AB, BA, ... (4 x AB, 3 x BA)
+    expected = entropy_from_counts([4, 3])
+    assert abs(block_entropy(b"ABABABAB", 2) - expected) < 1e-12
+    assert abs(block_entropy(iter([b"ABA", b"BA", b"BAB"]), 2) - expected) < 1e-12
+    # Blocks ABA, BAB, ABA, ... (3 x ABA, 3 x BAB)
+    assert block_entropy(iter([b"AB", b"AB", b"AB", b"AB"]), 3) == 1.0
+    assert BlockEntropyEstimator(3).update(b"AB").entropy() == 0.0
+    
+    try:
+        block_entropy(bytes(range(256)) * 2, 3, max_blocks=100)
+        assert False, "Should raise ValueError when the block bound is exceeded"
+    except ValueError as e:
+        assert "distinct blocks" in str(e)
+
+
+def test_file_entropy():
+    """Test entropy of files counted together."""
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        first = Path(directory) / "a.bin"
+        second = Path(directory) / "b.bin"
+        first.write_bytes(b"AB" * 100)
+        second.write_bytes(b"CD" * 100)
+        assert file_entropy(str(first)) == 1.0
+        assert abs(file_entropy(str(first), str(second), workers=1) - 2.0) < 1e-12
+
+
 # Manual test runner for environments without pytest
 def run_tests_manually():
     """Run all tests manually without pytest."""
@@ -104,6 +196,12 @@ def run_tests_manually():
         test_entropy_comparison,
         test_entropy_errors,
         test_entropy_formula,
+        test_entropy_from_counts,
+        test_estimator_streaming_and_merge,
+        test_sliding_window_entropy,
+        test_sliding_window_entropy_rejects_symbols_outside_alphabet,
+        test_block_entropy,
+        test_file_entropy,
     ]
     
     print("Running entropy tests manually...\n")
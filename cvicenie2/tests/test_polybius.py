@@ -14,7 +14,24 @@ try:
 except ImportError:
     HAS_PYTEST = False
 
-from polybius import encode, decode, normalize_text, remove_diacritics
+from polybius import (
+    encode, decode, encode_bytes, normalize_text, remove_diacritics, POLYBIUS_GRID,
+    PolybiusDecoder, iter_decode, decode_stream
+)
+
+
+def reference_encode(text):
+    """Straightforward per-character encoder used to cross-check encode()."""
+    pairs_parts = []
+    concatenated = []
+    for char in normalize_text(text):
+        if char == ' ':
+            pairs_parts.append('')
+            concatenated.append(' ')
+        elif char in POLYBIUS_GRID:
+            pairs_parts.append(POLYBIUS_GRID[char])
+            concatenated.append(POLYBIUS_GRID[char])
+    return ' '.join(pairs_parts), ''.join(concatenated)
 
 
 def test_remove_diacritics():
@@ -24,6 +41,20 @@ def test_remove_diacritics():
     assert remove_diacritics("ČĎŤŇŠŽÝÁÍÉ") == "CDTNSZYAIE"
 
 
+def test_remove_diacritics_matches_unicodedata():
+    """Test folding table against NFD normalization for Latin and other scripts."""
+    import unicodedata
+    
+    def reference(text):
+        nfd = unicodedata.normalize('NFD', text)
+        return ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
+    
+    text = ''.join(chr(code) for code in range(0x20, 0x250))
+    text += "Príliš žluťoučký kůň úpěl ďábelské ódy ẞ Ω ω ǅ ﬁ 한 ḉ \u0301x"
+    assert remove_diacritics(text) == reference(text)
+    assert remove_diacritics(text) == reference(text)
+
+
 def test_normalize_text():
     """Test text normalization."""
     assert normalize_text("bednár") == "BEDNAR"
@@ -108,11 +139,76 @@ def test_all_characters():
     assert decoded == alphabet
 
 
+def test_encode_bytes():
+    """Test byte-level encoding of bytes, bytearray and memoryview."""
+    expected = (b"15 32 13 36 51 34 42  31 15  55  14 11 51", b"15321336513442 3115 55 141151")
+    assert encode_bytes(b"ENCRYPT ME 2 DAY") == expected
+    assert encode_bytes(bytearray(b"encrypt me 2 day")) == expected
+    assert encode_bytes(memoryview(b"ENCRYPT ME 2 DAY")) == expected
+    assert encode_bytes(b"") == (b"", b"")
+
+
+def test_encode_edge_spaces_and_skipped():
+    """Test leading/trailing spaces and characters outside the grid."""
+    for text in [" A", "A ", "  ", " ", "A-B!C", "a\tb", "Ø€ A", "ÁB CĎ ", "?!"]:
+        assert encode(text) == reference_encode(text), text
+
+
+def test_encode_matches_reference():
+    """Test encoder against the per-character reference on random text."""
+    import random
+    rng = random.Random(42)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcxyz0123456789  .,-ÁČĎÉÍĽŇÓŠŤÚÝŽäô"
+    for _ in range(200):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert encode(text) == reference_encode(text), text
+
+
+def test_decoder_chunk_boundaries():
+    """Test streaming decoder against decode() for every chunk size."""
+    samples = [
+        encode("ENCRYPT ME 2 DAY")[0],
+        " 15  32 ",
+        "15 999 1 x 32  ",
+        "",
+        "  ",
+        "1532 15 3",
+    ]
+    for pairs in samples:
+        for size in range(1, len(pairs) + 2):
+            chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+            assert ''.join(iter_decode(chunks)) == decode(pairs), (pairs, size)
+
+
+def test_decoder_long_tokens():
+    """Test that overlong tokens are classified like decode() does."""
+    decoder = PolybiusDecoder()
+    out = decoder.feed("15 ")
+    for _ in range(100):
+        out += decoder.feed("1234")
+    out += decoder.feed(" 16 ab")
+    out += decoder.feed("cd")
+    out += decoder.finish()
+    assert out == decode("15 " + "1234" * 100 + " 16 abcd")
+    assert len(decoder._pending) == 0
+
+
+def test_decode_stream():
+    """Test decoding from one text stream into another."""
+    import io
+    pairs = encode("HELLO WORLD 2024 " * 50)[0]
+    sink = io.StringIO()
+    written = decode_stream(io.StringIO(pairs), sink, chunk_size=7)
+    assert sink.getvalue() == decode(pairs)
+    assert written == len(sink.getvalue())
+
+
 # Manual test runner for environments without pytest
 def run_tests_manually():
     """Run all tests manually without pytest."""
     test_functions = [
         test_remove_diacritics,
+        test_remove_diacritics_matches_unicodedata,
         test_normalize_text,
         test_encode_basic,
         test_encode_with_spaces,
@@ -124,6 +220,12 @@ def run_tests_manually():
         test_roundtrip,
         test_roundtrip_surname,
         test_all_characters,
+        test_encode_bytes,
+        test_encode_edge_spaces_and_skipped,
+        test_encode_matches_reference,
+        test_decoder_chunk_boundaries,
+        test_decoder_long_tokens,
+        test_decode_stream,
     ]
     
     print("Running Polybius tests manually...\n")
@@ -14,7 +14,10 @@ try:
 except ImportError:
     HAS_PYTEST = False
 
-from xor_utils import xor_chain, evaluate_expression
+from xor_utils import (
+    xor_chain, xor_bytes, evaluate_expression, evaluate_xor, compile_expression,
+    pack_bitstring, unpack_bitstring
+)
 
 
 def test_xor_chain_two():
@@ -99,6 +102,110 @@ def test_xor_chain_errors():
         assert "at least one" in str(e).lower()
 
 
+def test_pack_unpack_bitstring():
+    """Test packing bitstrings into ints with leading zeros preserved."""
+    assert pack_bitstring("1011") == 11
+    assert pack_bitstring("") == 0
+    assert unpack_bitstring(11, 8) == "00001011"
+    assert unpack_bitstring(pack_bitstring("000101"), 6) == "000101"
+    assert xor_chain("0001", "0001") == "0000"
+    assert xor_chain("", "") == ""
+    
+    for invalid in ["10 1", "1_01", "+101", "١٠"]:
+        try:
+            pack_bitstring(invalid)
+            assert False, f"Should raise ValueError for {invalid!r}"
+        except ValueError as e:
+            assert "only '0' and '1'" in str(e)
+
+
+def test_xor_chain_bytes():
+    """Test XOR of bytes, bytearray and memoryview operands."""
+    assert xor_chain(b"\x0f\xf0", bytearray(b"\xff\xff"), memoryview(b"\x01\x00")) == b"\xf1\x0f"
+    assert xor_bytes(b"\x00\x01", b"\x00\x01") == b"\x00\x00"
+    assert xor_chain(b"") == b""
+    
+    try:
+        xor_chain(b"\x01", b"\x01\x02")
+        assert False, "Should raise ValueError for different lengths"
+    except ValueError as e:
+        assert "same length" in str(e)
+    
+    try:
+        xor_chain(b"\x01", "00000001")
+        assert False, "Should raise TypeError for mixed operands"
+    except TypeError:
+        pass
+
+
+def test_xor_chain_matches_bitwise():
+    """Test packed XOR against a bit-by-bit reference on random input."""
+    import random
+    rng = random.Random(7)
+    for length in [1, 7, 8, 63, 64, 65, 1000]:
+        operands = [''.join(rng.choice('01') for _ in range(length)) for _ in range(4)]
+        expected = ''.join(str(sum(int(bs[i]) for bs in operands) % 2) for i in range(length))
+        assert xor_chain(*operands) == expected
+        
+        buffers = [bytes(rng.randrange(256) for _ in range(length)) for _ in range(3)]
+        expected_bytes = bytes(x ^ y ^ z for x, y, z in zip(*buffers))
+        assert xor_chain(*buffers) == expected_bytes
+
+
+def test_compile_expression_cancels_pairs():
+    """Test that operands appearing an even number of times cancel out."""
+    assert compile_expression("a ⊕ b ⊕ c ⊕ a ⊕ b").terms == ("c",)
+    assert compile_expression("a^b^a^b").terms == ()
+    assert compile_expression("(k1 + m) XOR k1 xor k2").terms == ("m", "k2")
+    assert compile_expression("a ^ a ^ a").names == ("a",)
+    assert compile_expression("a ^ a ^ a").terms == ("a",)
+    
+    for invalid in ["", "a ^", "^ a", "a b", "(a ^ b", "a ^ b)", "a - b", "()"]:
+        try:
+            compile_expression(invalid)
+            assert False, f"Should raise ValueError for {invalid!r}"
+        except ValueError:
+            pass
+
+
+def test_evaluate_xor():
+    """Test expression evaluation against xor_chain."""
+    a, b, c = "1011", "0110", "0100"
+    assert evaluate_xor("a ^ b ^ c", a=a, b=b, c=c) == xor_chain(a, b, c)
+    assert evaluate_xor("a ^ b ^ a", a=a, b=b) == b
+    assert evaluate_xor("a ^ a", a=a) == "0000"
+    assert evaluate_xor("x ^ y ^ x", x=b"\x01\x02", y=b"\xff\x00") == b"\xff\x00"
+    assert evaluate_xor("x ^ x", x=bytearray(b"\x01\x02")) == b"\x00\x00"
+    
+    # Cancelled operands must still match in length
+    try:
+        evaluate_xor("a ^ b ^ a", a="101", b="0110")
+        assert False, "Should raise ValueError for different lengths"
+    except ValueError as e:
+        assert "same length" in str(e)
+    
+    try:
+        evaluate_xor("a ^ b", a=a)
+        assert False, "Should raise ValueError for missing operand"
+    except ValueError as e:
+        assert "b" in str(e)
+
+
+def test_cancelled_operands_are_validated():
+    """Test that operands removed by simplification are still checked."""
+    try:
+        evaluate_expression("10a1", "0110", "0100")
+        assert False, "Should raise ValueError for invalid characters"
+    except ValueError as e:
+        assert "only '0' and '1'" in str(e)
+    
+    try:
+        evaluate_xor("a ^ a", a="xyz")
+        assert False, "Should raise ValueError for invalid characters"
+    except ValueError as e:
+        assert "only '0' and '1'" in str(e)
+
+
 # Manual test runner for environments without pytest
 def run_tests_manually():
     """Run all tests manually without pytest."""
@@ -110,6 +217,12 @@ def run_tests_manually():
         test_evaluate_expression_testset2,
         test_evaluate_expression_equals_c,
         test_xor_chain_errors,
+        test_pack_unpack_bitstring,
+        test_xor_chain_bytes,
+        test_xor_chain_matches_bitwise,
+        test_compile_expression_cancels_pairs,
+        test_evaluate_xor,
+        test_cancelled_operands_are_validated,
     ]
     
     print("Running XOR tests manually...\n")
@@ -0,0 +1,130 @@
+"""
+ZKGRA - Laboratory Work No. 4
+Batched and Multi-Party Diffie-Hellman
+
+Simulates many Diffie-Hellman exchanges over one group, fanned out over a
+process pool and streamed back in input order, and group key agreement
+between N parties.
+
+Student: Maroš Bednár (xbednarm1@stuba.sk)
+"""
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixed_base import fixed_base
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _exchange_chunk(g, p, pairs):
+    """Run one chunk of exchanges (runs inside worker processes)."""
+    # Public keys use the (per-process) fixed-base table of g
+    power = fixed_base(g, p).pow
+    results = []
+    for secret_a, secret_b in pairs:
+        public_a = power(secret_a)
+        public_b = power(secret_b)
+        results.append((public_a, public_b, pow(public_b, secret_a, p), pow(public_a, secret_b, p)))
+    return results
+
+
+def _iter_exchanges(g, p, secret_pairs, workers, batch_size):
+    """Yield exchange results chunk by chunk, keeping the input order."""
+    iterator = iter(secret_pairs)
+    chunks = iter(lambda: list(islice(iterator, batch_size)), [])
+    
+    if workers == 1:
+        for chunk in chunks:
+            yield from _exchange_chunk(g, p, chunk)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_exchange_chunk, g, p, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def batch_exchange(g, p, secret_pairs, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Perform many Diffie-Hellman exchanges over the group (g, p).
+    
+    Pairs are split into chunks of batch_size and spread over a process
+    pool; only a few chunks per worker are in flight, so secret_pairs can
+    be an arbitrarily long iterator.
+    
+    Args:
+        g: generator
+        p: modulus
+        secret_pairs: iterable of (secret_a, secret_b)
+        workers: number of worker processes (None = CPU count, 1 = no pool)
+        batch_size: number of exchanges per chunk
+    
+    Returns:
+        generator of (public_a, public_b, shared_key_alice, shared_key_bob)
+        in the same order as secret_pairs
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    return _iter_exchanges(g, p, secret_pairs, workers, batch_size)
+
+
+def _partial_keys(base, secrets, p):
+    """
+    For each party i compute base^(product of all secrets except s_i).
+    
+    Divide and conquer: each half gets the base raised to the secrets of
+    the other half, so N parties need O(N log N) exponentiations instead
+    of the N^2 of passing values around a ring.
+    """
+    if len(secrets) == 1:
+        return [base]
+    
+    middle = len(secrets) // 2
+    left, right = secrets[:middle], secrets[middle:]
+    
+    left_base = base
+    for secret in right:
+        left_base = pow(left_base, secret, p)
+    right_base = base
+    for secret in left:
+        right_base = pow(right_base, secret, p)
+    
+    return _partial_keys(left_base, left, p) + _partial_keys(right_base, right, p)
+
+
+def group_key_agreement(g, p, secrets):
+    """
+    N-party Diffie-Hellman group key agreement.
+    
+    Every party i receives g^(product of the other secrets) mod p and
+    raises it to its own secret s_i, so all parties end up with
+    g^(s_1 * s_2 * ... * s_N) mod p.
+    
+    Args:
+        g: generator
+        p: modulus
+        secrets: secret keys of the parties (at least 2)
+    
+    Returns:
+        tuple: (partial_keys, shared_keys), one entry per party
+    """
+    secrets = list(secrets)
+    if len(secrets) < 2:
+        raise ValueError("At least 2 parties are required")
+    
+    partials = _partial_keys(g % p, secrets, p)
+    shared = [pow(partial, secret, p) for partial, secret in zip(partials, secrets)]
+    return partials, shared
@@ -0,0 +1,127 @@
+"""
+ZKGRA - Laboratory Work No. 4
+Integer Factorization Helpers
+
+Primality testing and factorization (trial division + Pollard rho) used
+for multiplicative orders and generator selection.
+
+Student: Maroš Bednár (xbednarm1@stuba.sk)
+"""
+import math
+import random
+from functools import lru_cache
+
+# Primes used for trial division before switching to Pollard rho
+SMALL_PRIMES = [p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+
+# These bases make Miller-Rabin deterministic for n < 3.3 * 10^24
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def is_prime(n):
+    """
+    Miller-Rabin primality test.
+    Deterministic for n < 3.3 * 10^24, probabilistic (error < 4^-13) above.
+    """
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:13]:
+        if n % p == 0:
+            return n == p
+    
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_rho(n):
+    """
+    Find a non-trivial factor of a composite n (Pollard rho, Brent variant).
+    """
+    if n % 2 == 0:
+        return 2
+    
+    while True:
+        c = random.randrange(1, n)
+        y, m, g, r, q = random.randrange(n), 128, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # Multiply differences together, take one gcd per batch
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+    
+        if g == n:
+            # Batch overshot - redo step by step
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+@lru_cache(maxsize=1024)
+def _factorize(n):
+    factors = {}
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    
+    stack = [n] if n > 1 else []
+    while stack:
+        value = stack.pop()
+        if is_prime(value):
+            factors[value] = factors.get(value, 0) + 1
+        else:
+            divisor = pollard_rho(value)
+            stack.extend((divisor, value // divisor))
+    
+    return tuple(sorted(factors.items()))
+
+
+def factorize(n):
+    """
+    Prime factorization of n (cached).
+    
+    Args:
+        n: positive integer
+    
+    Returns:
+        dict {prime: exponent}, empty for n = 1
+    """
+    if n < 1:
+        raise ValueError("n must be positive")
+    return dict(_factorize(n))
+
+
+def euler_phi(n):
+    """Euler's totient function φ(n) computed from the factorization."""
+    result = n
+    for p in factorize(n):
+        result = result // p * (p - 1)
+    return result
@@ -0,0 +1,159 @@
+"""
+ZKGRA - Laboratory Work No. 4
+Generator Selection for Diffie-Hellman Groups
+
+Finds and checks primitive roots and subgroup generators modulo a prime p
+(primitive roots also for composite moduli). All checks need the prime
+factors of the group order p - 1 (φ(m) in general); they are taken from a
+registry of known factorizations or computed (trial division + Pollard
+rho) and cached per modulus.
+
+Student: Maroš Bednár (xbednarm1@stuba.sk)
+"""
+import math
+import os
+import sys
+from functools import lru_cache
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from factorization import euler_phi, factorize, is_prime
+
+# Known factorizations of p - 1 for large moduli: {p: {prime: exponent}}
+_KNOWN_FACTORIZATIONS = {}
+
+
+def register_factorization(p, factors):
+    """
+    Register a known factorization of p - 1 (e.g. for a safe prime p = 2q + 1).
+    
+    Args:
+        p: prime modulus
+        factors: dict {prime: exponent} with product p - 1
+    """
+    product = 1
+    for q, exponent in factors.items():
+        product *= q ** exponent
+    if product != p - 1:
+        raise ValueError(f"Factors do not multiply to p - 1 = {p - 1}")
+    _KNOWN_FACTORIZATIONS[p] = dict(factors)
+    group_order.cache_clear()
+    order_prime_factors.cache_clear()
+    find_primitive_root.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def group_order(m):
+    """Order of the multiplicative group modulo m: p - 1 for a prime, φ(m) otherwise."""
+    if m in _KNOWN_FACTORIZATIONS or is_prime(m):
+        return m - 1
+    return euler_phi(m)
+
+
+@lru_cache(maxsize=256)
+def order_prime_factors(m):
+    """Distinct prime factors of the group order (cached per modulus)."""
+    factors = _KNOWN_FACTORIZATIONS.get(m)
+    if factors is None:
+        factors = factorize(group_order(m))
+    return tuple(sorted(factors))
+
+
+def has_primitive_root(m):
+    """
+    Check whether the multiplicative group modulo m is cyclic.
+    
+    This holds exactly for m = 1, 2, 4, p^k and 2p^k (p an odd prime).
+    """
+    if m < 1:
+        raise ValueError("Modulus must be positive")
+    if m in (1, 2, 4):
+        return True
+    odd = m // 2 if m % 4 == 2 else m
+    return odd % 2 == 1 and len(factorize(odd)) == 1
+
+
+def is_primitive_root(g, m):
+    """
+    Check whether g generates the whole multiplicative group modulo m.
+    
+    g is a primitive root if gcd(g, m) = 1 and g^(n/q) != 1 for every prime
+    q | n, where n is the group order (p - 1 for a prime). Moduli without
+    primitive roots always give False.
+    """
+    if m < 1:
+        raise ValueError("Modulus must be positive")
+    g %= m
+    if m <= 2:
+        return g == m - 1
+    if math.gcd(g, m) != 1:
+        return False
+    order = group_order(m)
+    return all(pow(g, order // q, m) != 1 for q in order_prime_factors(m))
+
+
+@lru_cache(maxsize=256)
+def find_primitive_root(m):
+    """
+    Find the smallest primitive root modulo m (cached per modulus).
+    
+    Raises:
+        ValueError: If there is no primitive root modulo m
+    """
+    if not has_primitive_root(m):
+        raise ValueError(f"No primitive root modulo {m}")
+    if m <= 2:
+        return m - 1
+    g = 2
+    while not is_primitive_root(g, m):
+        g += 1
+    return g
+
+
+def is_subgroup_generator(g, p, q):
+    """
+    Check whether g generates the subgroup of prime order q modulo prime p.
+    
+    For prime q this holds exactly when g != 1 and g^q ≡ 1 (mod p).
+    """
+    g %= p
+    return (p - 1) % q == 0 and g not in (0, 1) and pow(g, q, p) == 1
+
+
+def find_subgroup_generator(p, q):
+    """
+    Find a generator of the subgroup of prime order q modulo prime p.
+    
+    Uses g = h^((p-1)/q) for h = 2, 3, ... until g != 1.
+    
+    Raises:
+        ValueError: If q is not a prime divisor of p - 1
+    """
+    if not is_prime(q) or (p - 1) % q:
+        raise ValueError(f"{q} is not a prime divisor of p - 1 = {p - 1}")
+    cofactor = (p - 1) // q
+    h = 2
+    while pow(h, cofactor, p) == 1:
+        h += 1
+    return pow(h, cofactor, p)
+
+
+def validate_group(g, p, q=None):
+    """
+    Check Diffie-Hellman group parameters.
+    
+    Args:
+        g: generator
+        p: modulus (must be prime)
+        q: order of the subgroup generated by g (None = g must be a primitive root)
+    
+    Raises:
+        ValueError: If p is not prime or g does not generate the group
+    """
+    if not is_prime(p):
+        raise ValueError(f"Modulus {p} is not prime")
+    if q is None:
+        if not is_primitive_root(g, p):
+            raise ValueError(f"{g} is not a primitive root modulo {p}")
+    elif not is_prime(q) or not is_subgroup_generator(g, p, q):
+        raise ValueError(f"{g} does not generate a subgroup of prime order {q} modulo {p}")
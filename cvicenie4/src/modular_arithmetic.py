@@ -4,20 +4,37 @@ Modular Arithmetic Operations
 
 Student: Maroš Bednár (xbednarm1@stuba.sk)
 """
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from factorization import euler_phi, factorize
+from fixed_base import fixed_pow
+from generators import validate_group
+
 
 def extended_gcd(a, b):
     """
     Extended Euclidean Algorithm.
     Returns (gcd, x, y) such that a*x + b*y = gcd(a, b)
+    
+    Iterative, so it works for operands of any size without hitting
+    the recursion limit.
     """
-    if a == 0:
-        return b, 0, 1
+    # Remainder sequence b, a, b % a, ...; invariant: a*x + b*y == r
+    old_r, r = b, a
+    old_x, x = 0, 1
+    old_y, y = 1, 0
     
-    gcd, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
     
-    return gcd, x, y
+    return old_r, old_x, old_y
 
 
 def mod_inverse(a, m):
@@ -32,7 +49,123 @@ def mod_inverse(a, m):
     if gcd != 1:
         return None  # Modular inverse doesn't exist
     
-    return (x % m + m) % m
+    return x % m
+
+
+def mod_inverse_many(values, m):
+    """
+    Calculate modular inverses of many values at once.
+    
+    Uses Montgomery's simultaneous inversion trick: prefix products of all
+    values are inverted with a single extended_gcd call, and the individual
+    inverses are recovered with about 3 multiplications per value.
+    
+    Args:
+        values: numbers to invert
+        m: modulus
+        
+    Returns:
+        list of inverses (None where the inverse doesn't exist)
+    """
+    values = [a % m for a in values]
+    if not values:
+        return []
+    
+    # prefix[i] = values[0] * ... * values[i-1] mod m
+    prefix = [1] * (len(values) + 1)
+    for i, a in enumerate(values):
+        prefix[i + 1] = prefix[i] * a % m
+    
+    inverse = mod_inverse(prefix[-1], m)
+    if inverse is None:
+        # Some value shares a factor with m - invert one by one
+        return [mod_inverse(a, m) for a in values]
+    
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        # inverse == (values[0] * ... * values[i])^-1
+        result[i] = inverse * prefix[i] % m
+        inverse = inverse * values[i] % m
+    
+    return result
+
+
+def multiplicative_order(n, m):
+    """
+    Multiplicative order of n modulo m: the smallest k > 0 with n^k ≡ 1 (mod m).
+    
+    Starts from φ(m) and divides out its prime factors while n^(order/q) is
+    still 1, so only O(log φ(m)) exponentiations are needed.
+    
+    Returns:
+        the order, or None if gcd(n, m) != 1 (n^k is never 1)
+    
+    Raises:
+        ValueError: If m < 1
+    """
+    if m < 1:
+        raise ValueError("Modulus must be positive")
+    if m == 1:
+        return 1
+    if math.gcd(n, m) != 1:
+        return None
+    
+    order = euler_phi(m)
+    for q in factorize(order):
+        while order % q == 0 and pow(n, order // q, m) == 1:
+            order //= q
+    
+    return order
+
+
+def residual_cycle(n, m):
+    """
+    Structure of the sequence n^1 mod m, n^2 mod m, ...
+    
+    The sequence is a tail followed by a repeating cycle. Write m = m1 * m2,
+    where m1 contains the primes dividing n and m2 is coprime to n. From
+    the first exponent with m1 | n^k on, the sequence repeats with period
+    ord_m2(n).
+    
+    Returns:
+        tuple (start, period): n^(start + period) ≡ n^start, with start >= 1
+    
+    Raises:
+        ValueError: If m < 1
+    """
+    if m < 1:
+        raise ValueError("Modulus must be positive")
+    
+    m1 = 1
+    m2 = m
+    g = math.gcd(n, m2)
+    while g > 1:
+        while m2 % g == 0:
+            m2 //= g
+            m1 *= g
+        g = math.gcd(n, m2)
+    
+    # Smallest exponent with n^start ≡ 0 (mod m1)
+    start = 1
+    power = n % m1
+    while power:
+        power = power * n % m1
+        start += 1
+    
+    return start, multiplicative_order(n, m2)
+
+
+def iter_residuals(n, m):
+    """
+    Lazily generate n^1 mod m, n^2 mod m, ... until the pattern repeats.
+    
+    Uses one multiplication per residual and constant memory.
+    """
+    start, period = residual_cycle(n, m)
+    residual = 1
+    for _ in range(start + period - 1):
+        residual = residual * n % m
+        yield residual
 
 
 def residual_vector(n, m):
@@ -47,28 +180,10 @@ def residual_vector(n, m):
     Returns:
         list of residuals until the cycle repeats
     """
-    vector = []
-    seen = set()
-    i = 1
-    
-    while True:
-        residual = pow(n, i, m)  # Efficient modular exponentiation
-        
-        if residual in seen:
-            break
-            
-        vector.append(residual)
-        seen.add(residual)
-        i += 1
-        
-        # Safety limit to prevent infinite loops
-        if i > m:
-            break
-    
-    return vector
+    return list(iter_residuals(n, m))
 
 
-def diffie_hellman_exchange(g, p, secret_a, secret_b):
+def diffie_hellman_exchange(g, p, secret_a, secret_b, validate=False, q=None):
     """
     Perform Diffie-Hellman key exchange.
     
@@ -77,15 +192,25 @@ def diffie_hellman_exchange(g, p, secret_a, secret_b):
         p: modulus
         secret_a: Alice's secret key
         secret_b: Bob's secret key
+        validate: check that p is prime and g generates the group
+                  (the exercises also use toy moduli, so it is off by default)
+        q: expected prime order of g for validation (None = primitive root)
         
     Returns:
         tuple: (public_a, public_b, shared_key_alice, shared_key_bob)
+        
+    Raises:
+        ValueError: If validate is set and the parameters are not a valid group
     """
+    if validate:
+        validate_group(g, p, q)
+    
     # Step 1: Alice computes her public key
-    public_a = pow(g, secret_a, p)
+    # (powers of the same g share one precomputed table)
+    public_a = fixed_pow(g, secret_a, p)
     
     # Step 2: Bob computes his public key
-    public_b = pow(g, secret_b, p)
+    public_b = fixed_pow(g, secret_b, p)
     
     # Step 3: Alice computes shared secret using Bob's public key
     shared_alice = pow(public_b, secret_a, p)
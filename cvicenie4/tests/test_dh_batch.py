@@ -0,0 +1,115 @@
+"""
+Tests for batched and multi-party Diffie-Hellman.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from dh_batch import batch_exchange, group_key_agreement
+from modular_arithmetic import diffie_hellman_exchange
+
+P = 1_000_000_007
+G = 5
+
+
+def test_batch_exchange_shared_secrets():
+    """Test that both sides of every batched exchange agree."""
+    rng = random.Random(7)
+    pairs = [(rng.randrange(1, P - 1), rng.randrange(1, P - 1)) for _ in range(250)]
+    
+    for workers, batch_size in ((1, 1000), (1, 7), (2, 16)):
+        results = list(batch_exchange(G, P, iter(pairs), workers=workers, batch_size=batch_size))
+        assert len(results) == len(pairs)
+        for (a, b), (public_a, public_b, key_alice, key_bob) in zip(pairs, results):
+            assert public_a == pow(G, a, P) and public_b == pow(G, b, P)
+            assert key_alice == key_bob == pow(G, a * b, P)
+
+
+def test_batch_exchange_matches_single_exchange():
+    """Test that the batch gives the same tuples as diffie_hellman_exchange."""
+    pairs = [(6, 15), (3, 11), (100, 200)]
+    assert list(batch_exchange(2, 23, pairs, workers=1)) == [
+        diffie_hellman_exchange(2, 23, a, b) for a, b in pairs
+    ]
+    assert list(batch_exchange(G, P, [], workers=1)) == []
+    
+    for kwargs in ({'workers': 0}, {'batch_size': 0}):
+        try:
+            batch_exchange(G, P, pairs, **kwargs)
+            assert False, f"Should raise ValueError for {kwargs}"
+        except ValueError:
+            pass
+
+
+def test_group_key_agreement():
+    """Test that all parties of an N-party agreement get the same key."""
+    rng = random.Random(11)
+    for parties in (2, 3, 5, 8, 13):
+        secrets = [rng.randrange(2, P - 1) for _ in range(parties)]
+        partials, shared = group_key_agreement(G, P, secrets)
+        
+        product = 1
+        for secret in secrets:
+            product *= secret
+        expected = pow(G, product, P)
+        assert shared == [expected] * parties
+        
+        for i, partial in enumerate(partials):
+            others = 1
+            for j, secret in enumerate(secrets):
+                if j != i:
+                    others *= secret
+            assert partial == pow(G, others, P)
+    
+    try:
+        group_key_agreement(G, P, [5])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_batch_exchange_shared_secrets,
+        test_batch_exchange_matches_single_exchange,
+        test_group_key_agreement,
+    ]
+    
+    print("Running Diffie-Hellman batch tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
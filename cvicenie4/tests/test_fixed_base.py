@@ -0,0 +1,103 @@
+"""
+Tests for fixed-base modular exponentiation.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from fixed_base import FixedBaseExp, fixed_base, fixed_pow
+
+
+def test_matches_builtin_pow():
+    """Test FixedBaseExp.pow against pow for random exponents."""
+    rng = random.Random(1234)
+    moduli = [2, 23, 1_000_000_007, 2 ** 127 - 1, rng.getrandbits(256) | 1]
+    for m in moduli:
+        for window in (1, 3, 4, 8, 11):
+            gp = FixedBaseExp(rng.randrange(m) if m > 2 else 1, m, window)
+            exponents = [0, 1, 2, (1 << window) - 1, 1 << window, (1 << window) + 1,
+                         (1 << (3 * window)) + 5, m - 1, m, m + 1]
+            exponents += [rng.getrandbits(rng.randrange(1, 300)) for _ in range(30)]
+            for e in exponents:
+                assert gp.pow(e) == pow(gp.g, e, m), (m, window, e)
+                assert gp(e) == gp.pow(e)
+
+
+def test_rows_grow_lazily():
+    """Test that larger exponents after small ones still use correct rows."""
+    gp = FixedBaseExp(5, 1_000_000_007)
+    assert gp.pow(3) == 125
+    assert len(gp._rows) == 1
+    e = 1 << 200
+    assert gp.pow(e) == pow(5, e, 1_000_000_007)
+    assert gp.pow(7) == pow(5, 7, 1_000_000_007)
+
+
+def test_edge_cases():
+    """Test modulus 1, base reduction, negative exponents and errors."""
+    assert FixedBaseExp(7, 1).pow(0) == 0
+    assert FixedBaseExp(7, 1).pow(5) == 0
+    assert FixedBaseExp(30, 23).pow(4) == pow(30, 4, 23)
+    assert FixedBaseExp(5, 23).pow(-1) == pow(5, -1, 23)
+    
+    for args in ((2, 0), (2, -5), (2, 23, 0)):
+        try:
+            FixedBaseExp(*args)
+            assert False, f"Should raise ValueError for {args}"
+        except ValueError:
+            pass
+
+
+def test_shared_tables():
+    """Test the cached table helpers."""
+    assert fixed_base(5, 23) is fixed_base(5, 23)
+    assert fixed_pow(5, 6, 23) == pow(5, 6, 23)
+    assert fixed_pow(2, 10 ** 30, 1_000_000_007) == pow(2, 10 ** 30, 1_000_000_007)
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_matches_builtin_pow,
+        test_rows_grow_lazily,
+        test_edge_cases,
+        test_shared_tables,
+    ]
+    
+    print("Running fixed-base exponentiation tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
@@ -0,0 +1,137 @@
+"""
+Tests for generator selection.
+"""
+import math
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from generators import (
+    has_primitive_root, is_primitive_root, find_primitive_root,
+    is_subgroup_generator, find_subgroup_generator, validate_group, register_factorization
+)
+
+
+def reference_primitive_roots(m):
+    """All primitive roots modulo m by brute force (elements of order φ(m))."""
+    units = [g for g in range(m) if math.gcd(g, m) == 1]
+    roots = []
+    for g in units:
+        value, order = g % m, 1
+        while value != 1 % m:
+            value = value * g % m
+            order += 1
+        if order == len(units):
+            roots.append(g)
+    return roots
+
+
+def test_primitive_roots_match_brute_force():
+    """Test primitive root checks and search on all small moduli."""
+    for m in range(1, 200):
+        roots = reference_primitive_roots(m)
+        assert has_primitive_root(m) == bool(roots), m
+        assert [g for g in range(m) if is_primitive_root(g, m)] == roots, m
+        if roots:
+            assert find_primitive_root(m) == roots[0], m
+
+
+def test_moduli_without_primitive_root():
+    """Test that moduli with a non-cyclic group are rejected."""
+    for m in (8, 12, 15, 16, 20, 21, 24, 35, 100):
+        assert not has_primitive_root(m)
+        assert not any(is_primitive_root(g, m) for g in range(m))
+        try:
+            find_primitive_root(m)
+            assert False, "Should raise ValueError"
+        except ValueError as e:
+            assert "No primitive root" in str(e)
+
+
+def test_large_prime_primitive_root():
+    """Test a primitive root of a large prime and a registered factorization."""
+    p = 1_000_000_007
+    g = find_primitive_root(p)
+    assert g == 5
+    assert is_primitive_root(g, p)
+    assert not is_primitive_root(g * g, p)
+    
+    # Safe prime p = 2q + 1 with a registered factorization
+    p, q = 2039, 1019
+    register_factorization(p, {2: 1, q: 1})
+    assert find_primitive_root(p) == reference_primitive_roots(p)[0]
+    try:
+        register_factorization(p, {2: 1, 3: 1})
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+def test_subgroup_generators():
+    """Test subgroup generators and group validation."""
+    p, q = 23, 11
+    g = find_subgroup_generator(p, q)
+    assert is_subgroup_generator(g, p, q)
+    assert pow(g, q, p) == 1 and g != 1
+    validate_group(g, p, q)
+    validate_group(5, 23)
+    
+    for args in ((2, 23), (4, 23, 11 * 2), (5, 21), (1, 23, 11)):
+        try:
+            validate_group(*args)
+            assert False, f"Should raise ValueError for {args}"
+        except ValueError:
+            pass
+    
+    try:
+        find_subgroup_generator(23, 7)
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_primitive_roots_match_brute_force,
+        test_moduli_without_primitive_root,
+        test_large_prime_primitive_root,
+        test_subgroup_generators,
+    ]
+    
+    print("Running generator tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
@@ -0,0 +1,197 @@
+"""
+Tests for modular arithmetic operations.
+"""
+import math
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from modular_arithmetic import (
+    residual_vector, residual_cycle, multiplicative_order, iter_residuals,
+    extended_gcd, mod_inverse, mod_inverse_many
+)
+from factorization import is_prime, factorize, euler_phi, pollard_rho
+
+
+def reference_residual_vector(n, m):
+    """Original brute-force loop: powers until the first repeated residual."""
+    vector = []
+    seen = set()
+    i = 1
+    while True:
+        residual = pow(n, i, m)
+        if residual in seen:
+            break
+        vector.append(residual)
+        seen.add(residual)
+        i += 1
+        if i > m:
+            break
+    return vector
+
+
+def reference_order(n, m):
+    """Smallest k > 0 with n^k ≡ 1 (mod m) by trial, None if there is none."""
+    value = 1
+    for k in range(1, m + 1):
+        value = value * n % m
+        if value == 1 % m:
+            return k
+    return None
+
+
+def test_residual_vector_examples():
+    """Test residual vectors from the exercises."""
+    assert residual_vector(4, 9) == [4, 7, 1]
+    assert residual_vector(2, 7) == [2, 4, 1]
+
+
+def test_residual_vector_matches_brute_force():
+    """Test residual vectors against the original loop on small moduli."""
+    for m in range(1, 80):
+        for n in range(0, 2 * m + 2):
+            expected = reference_residual_vector(n, m)
+            assert residual_vector(n, m) == expected, (n, m)
+            assert list(iter_residuals(n, m)) == expected, (n, m)
+            start, period = residual_cycle(n, m)
+            assert start + period - 1 == len(expected), (n, m)
+            assert pow(n, start + period, m) == pow(n, start, m), (n, m)
+
+
+def test_multiplicative_order_matches_brute_force():
+    """Test multiplicative orders against trial exponentiation."""
+    for m in range(1, 120):
+        for n in range(0, m + 1):
+            assert multiplicative_order(n, m) == reference_order(n, m), (n, m)
+    
+    # Large prime modulus: order divides p - 1 and is minimal
+    p = 1_000_000_007
+    order = multiplicative_order(5, p)
+    assert pow(5, order, p) == 1
+    assert all(pow(5, order // q, p) != 1 for q in factorize(order))
+
+
+def test_factorization_helpers():
+    """Test primality, factorization and Euler's totient."""
+    primes = [n for n in range(2, 2000) if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+    assert [n for n in range(2000) if is_prime(n)] == primes
+    assert is_prime(2 ** 61 - 1)
+    assert not is_prime(3215031751)  # strong pseudoprime to bases 2, 3, 5, 7
+    
+    for n in list(range(1, 3000)) + [2 ** 32 + 1, 600851475143, (2 ** 31 - 1) * (2 ** 61 - 1)]:
+        factors = factorize(n)
+        product = 1
+        for q, exponent in factors.items():
+            assert is_prime(q), (n, q)
+            product *= q ** exponent
+        assert product == n, n
+    
+    for n in range(1, 300):
+        assert euler_phi(n) == sum(1 for k in range(1, n + 1) if math.gcd(k, n) == 1), n
+    
+    n = 1000003 * 999983
+    d = pollard_rho(n)
+    assert d in (1000003, 999983)
+
+
+def test_residual_vector_rejects_non_positive_modulus():
+    """Test that m = 0 and negative moduli raise instead of looping."""
+    for m in (0, -1, -9):
+        for func in (residual_vector, residual_cycle, multiplicative_order):
+            try:
+                func(4, m)
+            except ValueError:
+                continue
+            raise AssertionError(f"{func.__name__}(4, {m}) did not raise ValueError")
+
+
+def test_extended_gcd_large_operands():
+    """Test Bezout coefficients on operands far beyond the recursion limit."""
+    assert extended_gcd(0, 0) == (0, 0, 1)
+    assert extended_gcd(240, 46)[0] == 2
+    
+    rng = random.Random(15)
+    # Consecutive Fibonacci numbers need the most division steps
+    a, b = 0, 1
+    for _ in range(20000):
+        a, b = b, a + b
+    pairs = [(a, b), (b, a)]
+    pairs += [(rng.getrandbits(4096), rng.getrandbits(4096)) for _ in range(20)]
+    pairs += [(rng.getrandbits(8192) * 6, rng.getrandbits(3000) * 15) for _ in range(5)]
+    for a, b in pairs:
+        g, x, y = extended_gcd(a, b)
+        assert g == math.gcd(a, b)
+        assert a * x + b * y == g
+    
+    m = 2 ** 4423 - 1  # Mersenne prime
+    a = rng.getrandbits(4000)
+    assert a * mod_inverse(a, m) % m == 1
+
+
+def test_mod_inverse_many_matches_mod_inverse():
+    """Test batched inversion against per-element mod_inverse."""
+    assert mod_inverse_many([], 47) == []
+    assert mod_inverse_many([7, 2, 3], 47) == [27, 24, 16]
+    
+    rng = random.Random(16)
+    for m in (2, 47, 97, 1000, 2 ** 127 - 1, rng.getrandbits(2048) | 1):
+        values = [rng.randrange(1, 10 * m) for _ in range(50)]
+        values = [a for a in values if math.gcd(a, m) == 1] or [1]
+        assert mod_inverse_many(values, m) == [mod_inverse(a, m) for a in values], m
+    
+    # Non-invertible elements fall back to one-by-one inversion
+    for m, values in ((1000, [3, 10, 7, 0, 999]), (97, [5, 97, 194, 96])):
+        expected = [mod_inverse(a, m) for a in values]
+        assert None in expected
+        assert mod_inverse_many(values, m) == expected
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_residual_vector_examples,
+        test_residual_vector_matches_brute_force,
+        test_multiplicative_order_matches_brute_force,
+        test_factorization_helpers,
+        test_residual_vector_rejects_non_positive_modulus,
+        test_extended_gcd_large_operands,
+        test_mod_inverse_many_matches_mod_inverse,
+    ]
+    
+    print("Running modular arithmetic tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
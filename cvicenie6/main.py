@@ -17,6 +17,8 @@ from des_tables import (
     IP_INTEL_X86, IP_INVERSE_INTEL_X86, IP_COB, S_BOX_2,
     apply_permutation, s_box_lookup, bits_to_string, bits_to_int
 )
+from permutation import Permutation
+from bitvector import BitVector
 
 
 def exercise_1():
@@ -60,10 +62,11 @@ def exercise_1():
     
     # Create 25-bit message based on positions
     # Set bit at each position to 1
-    bits = [0] * 25
+    value = 0
     for letter in message:
         pos = letter_positions[letter] - 1  # Convert to 0-indexed
-        bits[pos] = 1
+        value |= 1 << (24 - pos)
+    bits = BitVector(value, 25)
     
     print(f"\nOriginal bit pattern (25 bits):")
     print(f"  {bits_to_string(bits)}")
@@ -76,9 +79,7 @@ def exercise_1():
     
     # Designation into L and R parts
     # For simplicity, split in middle
-    mid = len(permuted) // 2
-    L = permuted[:mid]
-    R = permuted[mid:]
+    L, R = permuted.halves()
     
     print(f"\nSubdivision into L and R:")
     print(f"  L (left {len(L)} bits):  {bits_to_string(L)}")
@@ -102,10 +103,8 @@ def exercise_2():
     # Intel x86 IP tells us where each bit goes
     # We need to find where these positions come from in original DES
     
-    # Create inverse of Intel x86 IP to find original positions
-    intel_to_original_ip = {}
-    for new_pos, old_pos in enumerate(IP_INTEL_X86):
-        intel_to_original_ip[new_pos] = old_pos
+    # Intel x86 IP: output position -> source bit
+    intel_ip = Permutation(IP_INTEL_X86)
     
     # Original DES IP (standard DES initial permutation)
     # Standard DES IP (1-indexed in literature, but we use 0-indexed)
@@ -123,6 +122,10 @@ def exercise_2():
     # Adjust to 0-indexed
     ORIGINAL_DES_IP = [x - 1 for x in ORIGINAL_DES_IP]
     
+    # Position lookups use the cached index of each table
+    original_ip = Permutation(ORIGINAL_DES_IP)
+    final_ip = Permutation(IP_INVERSE_INTEL_X86)
+    
     positions_to_check = [14, 23, 61, 6]
     
     print("\nCorrespondence Table:")
@@ -133,21 +136,13 @@ def exercise_2():
     results = {}
     for pos in positions_to_check:
         # Where does position 'pos' in Intel x86 IP come from?
-        original_pos = intel_to_original_ip[pos]
+        original_pos = intel_ip.table[pos]
         
         # Find in original DES IP
-        des_original = None
-        for i, val in enumerate(ORIGINAL_DES_IP):
-            if val == original_pos:
-                des_original = i
-                break
+        des_original = original_ip.position(original_pos)
         
         # Find in final permutation (IP⁻¹)
-        final_pos = None
-        for i, val in enumerate(IP_INVERSE_INTEL_X86):
-            if val == pos:
-                final_pos = i
-                break
+        final_pos = final_ip.position(pos)
         
         results[pos] = (des_original, final_pos)
         print(f"{pos:<25} {des_original:<25} {final_pos if final_pos else 'N/A':<25}")
@@ -179,14 +174,15 @@ def exercise_3():
     
     results = {}
     for label, input_bits in zip(['A', 'B', 'C', 'D'], test_inputs):
-        output = s_box_lookup(S_BOX_2, input_bits)
+        bits = BitVector(input_bits)
+        output = s_box_lookup(S_BOX_2, bits)
         output_str = bits_to_string(output)
         output_int = bits_to_int(output)
         
         # Detailed calculation
-        bits = [int(b) for b in input_bits]
         row = (bits[0] << 1) | bits[5]
-        col = (bits[1] << 3) | (bits[2] << 2) | (bits[3] << 1) | bits[4]
+        middle = bits[1:5]
+        col = int(middle)
         
         results[label] = {
             'input': input_bits,
@@ -198,7 +194,7 @@ def exercise_3():
         
         print(f"\n{label}. Input: {input_bits}")
         print(f"   Row bits (outer): {bits[0]}...{bits[5]} = {row}")
-        print(f"   Col bits (middle): {bits[1]}{bits[2]}{bits[3]}{bits[4]} = {col}")
+        print(f"   Col bits (middle): {middle} = {col}")
         print(f"   S-box[{row}][{col}] = {output_int}")
         print(f"   Output (4 bits): {output_str}")
     
@@ -8,21 +8,54 @@ from .des_tables import (
     IP_INVERSE_INTEL_X86,
     IP_COB,
     S_BOX_2,
+    DES_S_BOXES,
     apply_permutation,
     apply_inverse_permutation,
     s_box_lookup,
+    flatten_s_box,
+    s_box_lookup_many,
+    s_box_layer,
+    make_s_box_layer,
     bits_to_string,
     bits_to_int
 )
+from .bit_permutation import CompiledPermutation, compile_permutation, permute_int
+from .bitvector import BitVector
+from .permutation import Permutation, compose, identity
+from .des import DES, TripleDES
+from .sbox_analysis import (
+    SBoxAnalysis,
+    analyze_s_box,
+    difference_distribution_table,
+    linear_approximation_table
+)
 
 __all__ = [
     'IP_INTEL_X86',
     'IP_INVERSE_INTEL_X86',
     'IP_COB',
     'S_BOX_2',
+    'DES_S_BOXES',
     'apply_permutation',
     'apply_inverse_permutation',
     's_box_lookup',
+    'flatten_s_box',
+    's_box_lookup_many',
+    's_box_layer',
+    'make_s_box_layer',
     'bits_to_string',
-    'bits_to_int'
+    'bits_to_int',
+    'CompiledPermutation',
+    'compile_permutation',
+    'permute_int',
+    'BitVector',
+    'Permutation',
+    'compose',
+    'identity',
+    'DES',
+    'TripleDES',
+    'SBoxAnalysis',
+    'analyze_s_box',
+    'difference_distribution_table',
+    'linear_approximation_table'
 ]
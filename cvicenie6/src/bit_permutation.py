@@ -0,0 +1,123 @@
+"""
+Compiled Bit Permutations
+Turns a permutation table into an integer-level routine.
+
+Bits are numbered like in the tables: position 0 is the most significant
+bit of an n-bit integer, so permuting an int gives the same bits as
+apply_permutation on the corresponding list of bits.
+
+The compiled form splits the input into bytes and precomputes, for every
+byte position, a 256-entry table with the output bits that byte
+contributes. A permutation is then 8 table lookups (for 64 bits) whose
+results are added together (the contributions never overlap).
+"""
+from functools import lru_cache
+
+
+class CompiledPermutation:
+    """
+    Byte-indexed lookup tables for one permutation table.
+    
+    Works for any selection table, including expansions (bits used more
+    than once) and compressions (bits dropped), as long as in_width covers
+    all referenced positions.
+    """
+    
+    def __init__(self, table, in_width=None):
+        table = tuple(table)
+        if in_width is None:
+            in_width = max(table) + 1 if table else 0
+        if table and not 0 <= min(table) <= max(table) < in_width:
+            raise ValueError(f"Permutation table references bits outside {in_width}-bit input")
+    
+        self.table = table
+        self.in_width = in_width
+        self.out_width = len(table)
+        self.in_bytes = (in_width + 7) // 8
+        self._tables = self._build_tables()
+        self.apply = self._make_apply()
+    
+    def _build_tables(self):
+        out_width = self.out_width
+    
+        # Output bits fed by each input position
+        contribution = [0] * self.in_width
+        for out_pos, in_pos in enumerate(self.table):
+            contribution[in_pos] |= 1 << (out_width - 1 - out_pos)
+    
+        tables = []
+        for byte_index in range(self.in_bytes):
+            # Int bit j lives in big-endian byte in_bytes-1-j//8
+            shift = 8 * (self.in_bytes - 1 - byte_index)
+            bit_values = []
+            for bit in range(8):
+                j = shift + bit
+                in_pos = self.in_width - 1 - j
+                bit_values.append(contribution[in_pos] if 0 <= in_pos < self.in_width else 0)
+    
+            byte_table = [0] * 256
+            for value in range(1, 256):
+                lowest = value & -value
+                byte_table[value] = byte_table[value ^ lowest] | bit_values[lowest.bit_length() - 1]
+            tables.append(byte_table)
+        return tables
+    
+    def _make_apply(self):
+        """Build the permutation routine (unrolled for 64-bit inputs)."""
+        tables = self._tables
+        in_bytes = self.in_bytes
+    
+        if in_bytes == 8:
+            t0, t1, t2, t3, t4, t5, t6, t7 = tables
+    
+            def apply(value):
+                return (t0[value >> 56] | t1[value >> 48 & 255] | t2[value >> 40 & 255]
+                        | t3[value >> 32 & 255] | t4[value >> 24 & 255] | t5[value >> 16 & 255]
+                        | t6[value >> 8 & 255] | t7[value & 255])
+            return apply
+    
+        def apply(value):
+            return sum(map(list.__getitem__, tables, value.to_bytes(in_bytes, 'big')))
+        return apply
+    
+    def __call__(self, value):
+        """
+        Permute the bits of an in_width-bit integer.
+    
+        Returns:
+            out_width-bit integer
+    
+        Raises:
+            ValueError: If value does not fit in in_width bits (apply
+                        itself skips this check)
+        """
+        if value < 0 or value >> self.in_width:
+            raise ValueError(f"Input does not fit in {self.in_width} bits")
+        return self.apply(value)
+    
+    def __repr__(self):
+        return f"CompiledPermutation({self.in_width} -> {self.out_width} bits)"
+
+
+@lru_cache(maxsize=128)
+def _compile(table, in_width):
+    return CompiledPermutation(table, in_width)
+
+
+def compile_permutation(table, in_width=None):
+    """
+    Get the compiled form of a permutation table (cached per table).
+    
+    Args:
+        table: List of source bit indices for each output position
+        in_width: Number of input bits (default: highest index + 1)
+    
+    Returns:
+        CompiledPermutation callable on ints
+    """
+    return _compile(tuple(table), in_width)
+
+
+def permute_int(value, table, in_width=None):
+    """Apply a permutation table to the bits of an integer."""
+    return compile_permutation(table, in_width)(value)
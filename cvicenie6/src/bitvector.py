@@ -0,0 +1,143 @@
+"""
+Bit Vectors
+Fixed-width bit strings stored as one integer.
+
+Bits are numbered like in the DES tables: bit 0 is the most significant
+of the width bits, so BitVector('0110')[1] == 1 and int(BitVector('0110'))
+== 6. Slicing, concatenation and XOR are integer shifts and masks, and
+conversions go through str/bytes routines instead of per-bit loops.
+"""
+
+# b'0'/b'1' <-> bytes 0/1
+_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_ASCII = bytes.maketrans(b'01', b'\x00\x01')
+
+
+class BitVector:
+    """
+    Immutable bit string of a fixed width backed by an int.
+    
+    Example:
+        block = BitVector('1100101011110000')
+        left, right = block.halves()
+        str(left + (right ^ left)) == '1100101000111010'
+    """
+    
+    __slots__ = ('value', 'width')
+    
+    def __init__(self, data=0, width=None):
+        """
+        Args:
+            data: Integer, string of '0' and '1', list of bits or BitVector
+            width: Number of bits (required for integers, except 0 -> empty)
+        """
+        if width is not None and width < 0:
+            raise ValueError("BitVector width must be non-negative")
+        if isinstance(data, BitVector):
+            value, size = data.value, data.width
+        elif isinstance(data, int):
+            if data < 0:
+                raise ValueError("BitVector value must be non-negative")
+            value, size = data, width if width is not None else data.bit_length()
+        elif isinstance(data, str):
+            if data.strip('01'):
+                raise ValueError("Bit string may only contain '0' and '1'")
+            value, size = int(data, 2) if data else 0, len(data)
+        else:
+            raw = bytes(data)
+            if raw.translate(None, b'\x00\x01'):
+                raise ValueError("Bits must be 0 or 1")
+            value, size = int(raw.translate(_TO_ASCII), 2) if raw else 0, len(raw)
+    
+        if width is not None and width != size:
+            raise ValueError(f"Expected {width} bits, got {size}")
+        if value >> size:
+            raise ValueError(f"Value does not fit in {size} bits")
+        self.value = value
+        self.width = size
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """Big-endian bytes to a BitVector of 8 * len(data) bits."""
+        return _make(int.from_bytes(data, 'big'), 8 * len(data))
+    
+    def to_bytes(self):
+        """Big-endian bytes (width must be a multiple of 8)."""
+        if self.width % 8:
+            raise ValueError("Width must be a multiple of 8")
+        return self.value.to_bytes(self.width // 8, 'big')
+    
+    def to_list(self):
+        """List of bits (0/1 ints)."""
+        return list(str(self).encode().translate(_FROM_ASCII))
+    
+    def halves(self):
+        """Split into left and right halves (L, R)."""
+        right_width = self.width - self.width // 2
+        value = self.value
+        return (_make(value >> right_width, self.width - right_width),
+                _make(value & ((1 << right_width) - 1), right_width))
+    
+    def __len__(self):
+        return self.width
+    
+    def __int__(self):
+        return self.value
+    
+    def __str__(self):
+        return format(self.value, f'0{self.width}b') if self.width else ''
+    
+    def __repr__(self):
+        return f"BitVector('{self}')"
+    
+    def __iter__(self):
+        return iter(self.to_list())
+    
+    def __getitem__(self, key):
+        width = self.width
+        if isinstance(key, slice):
+            start, stop, step = key.indices(width)
+            if step != 1:
+                return BitVector(self.to_list()[key])
+            length = max(stop - start, 0)
+            return _make(self.value >> (width - start - length) & ((1 << length) - 1), length)
+    
+        if key < 0:
+            key += width
+        if not 0 <= key < width:
+            raise IndexError("BitVector index out of range")
+        return self.value >> (width - 1 - key) & 1
+    
+    def __add__(self, other):
+        """Concatenation."""
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        return _make(self.value << other.width | other.value, self.width + other.width)
+    
+    def __xor__(self, other):
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        if other.width != self.width:
+            raise ValueError(f"Cannot XOR {self.width}-bit and {other.width}-bit vectors")
+        return _make(self.value ^ other.value, self.width)
+    
+    def __eq__(self, other):
+        if isinstance(other, BitVector):
+            return self.width == other.width and self.value == other.value
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash((self.value, self.width))
+
+
+def _make(value, width):
+    """Build a BitVector from a value known to fit in width bits (no checks)."""
+    vector = _new(BitVector)
+    vector.value = value
+    vector.width = width
+    return vector
+
+
+_new = object.__new__
@@ -0,0 +1,177 @@
+"""
+DES and Triple DES Block Engine
+Full 16-round DES built on the tables in des_tables.
+
+The block is kept as two 32-bit integers (L, R) through all rounds. The
+S-boxes and the permutation P are merged at import time into eight
+"SP tables": SP[i][x] is the 32-bit output of S-box i for the 6-bit
+input x, already moved to its final position by P. A round function is
+then 8 table lookups OR-ed together. IP, IP⁻¹ and the key schedule
+permutations use the compiled byte-table permutations.
+"""
+
+try:
+    from .des_tables import (
+        DES_IP, DES_FP, DES_P, DES_PC1, DES_PC2, DES_SHIFTS, DES_S_BOXES,
+        flatten_s_box
+    )
+    from .bit_permutation import compile_permutation
+except ImportError:  # loaded as a top-level module (src on sys.path)
+    from des_tables import (
+        DES_IP, DES_FP, DES_P, DES_PC1, DES_PC2, DES_SHIFTS, DES_S_BOXES,
+        flatten_s_box
+    )
+    from bit_permutation import compile_permutation
+
+BLOCK_SIZE = 8
+MASK_28 = (1 << 28) - 1
+MASK_32 = (1 << 32) - 1
+
+_IP = compile_permutation(DES_IP, 64).apply
+_FP = compile_permutation(DES_FP, 64).apply
+_PC1 = compile_permutation(DES_PC1, 64).apply
+_PC2 = compile_permutation(DES_PC2, 56).apply
+_P = compile_permutation(DES_P, 32).apply
+
+
+def _build_sp_tables():
+    """Combine every S-box with P into 64-entry tables of 32-bit ints."""
+    tables = []
+    for index, s_box in enumerate(DES_S_BOXES):
+        shift = 28 - 4 * index  # position of this S-box's nibble before P
+        tables.append([_P(value << shift) for value in flatten_s_box(s_box)])
+    return tables
+
+
+SP_TABLES = _build_sp_tables()
+
+def key_schedule(key):
+    """
+    Compute the 16 round keys of DES.
+    
+    Args:
+        key: 64-bit key (int) or 8 bytes (parity bits are ignored)
+    
+    Returns:
+        list of 16 round keys, each a tuple of eight 6-bit values
+        (one per S-box)
+    """
+    if isinstance(key, (bytes, bytearray)):
+        if len(key) != BLOCK_SIZE:
+            raise ValueError("DES key must be 8 bytes")
+        key = int.from_bytes(key, 'big')
+    
+    cd = _PC1(key)
+    c, d = cd >> 28, cd & MASK_28
+    round_keys = []
+    for shift in DES_SHIFTS:
+        c = (c << shift | c >> (28 - shift)) & MASK_28
+        d = (d << shift | d >> (28 - shift)) & MASK_28
+        k = _PC2(c << 28 | d)
+        round_keys.append(tuple(k >> (42 - 6 * i) & 63 for i in range(8)))
+    return round_keys
+
+
+def crypt_block(block, round_keys):
+    """
+    Run the 16 DES rounds on one 64-bit block.
+    
+    Encryption and decryption differ only in the order of round keys.
+    """
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = SP_TABLES
+    block = _IP(block)
+    left, right = block >> 32, block & MASK_32
+    
+    for k0, k1, k2, k3, k4, k5, k6, k7 in round_keys:
+        # 34-bit value R[31] R[0..31] R[0]: E's windows are at steps of 4 bits
+        # (this layout of DES_E is checked in tests/test_des.py)
+        x = (right & 1) << 33 | right << 1 | right >> 31
+        f = (sp0[(x >> 28 & 63) ^ k0] | sp1[(x >> 24 & 63) ^ k1]
+             | sp2[(x >> 20 & 63) ^ k2] | sp3[(x >> 16 & 63) ^ k3]
+             | sp4[(x >> 12 & 63) ^ k4] | sp5[(x >> 8 & 63) ^ k5]
+             | sp6[(x >> 4 & 63) ^ k6] | sp7[(x & 63) ^ k7])
+        left, right = right, left ^ f
+    
+    # Halves are swapped after the last round
+    return _FP(right << 32 | left)
+
+
+def _crypt_bytes(data, crypt):
+    """Apply a block function to every 8-byte block (ECB)."""
+    if len(data) % BLOCK_SIZE:
+        raise ValueError("Data length must be a multiple of 8 bytes")
+    data = bytes(data)
+    out = bytearray(len(data))
+    for start in range(0, len(data), BLOCK_SIZE):
+        block = int.from_bytes(data[start:start + BLOCK_SIZE], 'big')
+        out[start:start + BLOCK_SIZE] = crypt(block).to_bytes(BLOCK_SIZE, 'big')
+    return bytes(out)
+
+
+class DES:
+    """
+    DES block cipher.
+    
+    Example:
+        des = DES(bytes.fromhex('133457799BBCDFF1'))
+        des.encrypt_block(0x0123456789ABCDEF) == 0x85E813540F0AB405
+    """
+    
+    def __init__(self, key):
+        self.encrypt_keys = key_schedule(key)
+        self.decrypt_keys = self.encrypt_keys[::-1]
+    
+    def encrypt_block(self, block):
+        """Encrypt one 64-bit block (int)."""
+        return crypt_block(block, self.encrypt_keys)
+    
+    def decrypt_block(self, block):
+        """Decrypt one 64-bit block (int)."""
+        return crypt_block(block, self.decrypt_keys)
+    
+    def encrypt(self, data):
+        """Encrypt bytes in ECB mode (length must be a multiple of 8, no padding)."""
+        return _crypt_bytes(data, self.encrypt_block)
+    
+    def decrypt(self, data):
+        """Decrypt bytes in ECB mode."""
+        return _crypt_bytes(data, self.decrypt_block)
+
+
+class TripleDES:
+    """
+    Triple DES (EDE): encrypt with K1, decrypt with K2, encrypt with K3.
+    
+    Accepts a 16-byte key (K3 = K1) or a 24-byte key.
+    """
+    
+    def __init__(self, key):
+        key = bytes(key)
+        if len(key) == 16:
+            key += key[:8]
+        if len(key) != 24:
+            raise ValueError("Triple DES key must be 16 or 24 bytes")
+        k1, k2, k3 = (key_schedule(key[i:i + 8]) for i in range(0, 24, 8))
+        # Encryption: E(K1) D(K2) E(K3); decryption reverses it
+        self.encrypt_stages = (k1, k2[::-1], k3)
+        self.decrypt_stages = (k3[::-1], k2, k1[::-1])
+    
+    def encrypt_block(self, block):
+        """Encrypt one 64-bit block (int)."""
+        for round_keys in self.encrypt_stages:
+            block = crypt_block(block, round_keys)
+        return block
+    
+    def decrypt_block(self, block):
+        """Decrypt one 64-bit block (int)."""
+        for round_keys in self.decrypt_stages:
+            block = crypt_block(block, round_keys)
+        return block
+    
+    def encrypt(self, data):
+        """Encrypt bytes in ECB mode (length must be a multiple of 8, no padding)."""
+        return _crypt_bytes(data, self.encrypt_block)
+    
+    def decrypt(self, data):
+        """Decrypt bytes in ECB mode."""
+        return _crypt_bytes(data, self.decrypt_block)
@@ -3,6 +3,17 @@ DES Tables and Permutations
 Contains all the tables needed for simplified DES operations.
 """
 
+from functools import lru_cache
+
+try:
+    from .bit_permutation import compile_permutation
+    from .permutation import Permutation
+    from .bitvector import BitVector, _make as _make_bits
+except ImportError:  # loaded as a top-level module (src on sys.path)
+    from bit_permutation import compile_permutation
+    from permutation import Permutation
+    from bitvector import BitVector, _make as _make_bits
+
 # Initial bit permutation (IP) - Intel x86 format
 # Reading from the image carefully, row by row
 IP_INTEL_X86 = [
@@ -56,17 +67,140 @@ S_BOX_2 = [
 ]
 
 
-def apply_permutation(data, permutation_table):
+# Standard DES tables (FIPS 46-3), 0-indexed, bit 0 = most significant bit.
+# The Intel x86 tables above number input bits from the least significant
+# end, so the standard IP / IP⁻¹ follow from them by reversing the index.
+DES_IP = [63 - x for x in IP_INTEL_X86]
+DES_FP = [63 - x for x in IP_INVERSE_INTEL_X86]
+
+# Expansion E (32 -> 48 bits)
+DES_E = [x - 1 for x in [
+    32, 1, 2, 3, 4, 5,
+    4, 5, 6, 7, 8, 9,
+    8, 9, 10, 11, 12, 13,
+    12, 13, 14, 15, 16, 17,
+    16, 17, 18, 19, 20, 21,
+    20, 21, 22, 23, 24, 25,
+    24, 25, 26, 27, 28, 29,
+    28, 29, 30, 31, 32, 1
+]]
+
+# Permutation P applied to the S-box outputs (32 -> 32 bits)
+DES_P = [x - 1 for x in [
+    16, 7, 20, 21, 29, 12, 28, 17,
+    1, 15, 23, 26, 5, 18, 31, 10,
+    2, 8, 24, 14, 32, 27, 3, 9,
+    19, 13, 30, 6, 22, 11, 4, 25
+]]
+
+# Permuted choice 1 (64 -> 56 bits, parity bits dropped)
+DES_PC1 = [x - 1 for x in [
+    57, 49, 41, 33, 25, 17, 9,
+    1, 58, 50, 42, 34, 26, 18,
+    10, 2, 59, 51, 43, 35, 27,
+    19, 11, 3, 60, 52, 44, 36,
+    63, 55, 47, 39, 31, 23, 15,
+    7, 62, 54, 46, 38, 30, 22,
+    14, 6, 61, 53, 45, 37, 29,
+    21, 13, 5, 28, 20, 12, 4
+]]
+
+# Permuted choice 2 (56 -> 48 bits)
+DES_PC2 = [x - 1 for x in [
+    14, 17, 11, 24, 1, 5,
+    3, 28, 15, 6, 21, 10,
+    23, 19, 12, 4, 26, 8,
+    16, 7, 27, 20, 13, 2,
+    41, 52, 31, 37, 47, 55,
+    30, 40, 51, 45, 33, 48,
+    44, 49, 39, 56, 34, 53,
+    46, 42, 50, 36, 29, 32
+]]
+
+# Left rotations of the key halves in each round
+DES_SHIFTS = [1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 1]
+
+# All eight DES S-boxes (S_BOX_2 is the second one)
+DES_S_BOXES = [
+    [
+        [14, 4, 13, 1, 2, 15, 11, 8, 3, 10, 6, 12, 5, 9, 0, 7],
+        [0, 15, 7, 4, 14, 2, 13, 1, 10, 6, 12, 11, 9, 5, 3, 8],
+        [4, 1, 14, 8, 13, 6, 2, 11, 15, 12, 9, 7, 3, 10, 5, 0],
+        [15, 12, 8, 2, 4, 9, 1, 7, 5, 11, 3, 14, 10, 0, 6, 13]
+    ],
+    S_BOX_2,
+    [
+        [10, 0, 9, 14, 6, 3, 15, 5, 1, 13, 12, 7, 11, 4, 2, 8],
+        [13, 7, 0, 9, 3, 4, 6, 10, 2, 8, 5, 14, 12, 11, 15, 1],
+        [13, 6, 4, 9, 8, 15, 3, 0, 11, 1, 2, 12, 5, 10, 14, 7],
+        [1, 10, 13, 0, 6, 9, 8, 7, 4, 15, 14, 3, 11, 5, 2, 12]
+    ],
+    [
+        [7, 13, 14, 3, 0, 6, 9, 10, 1, 2, 8, 5, 11, 12, 4, 15],
+        [13, 8, 11, 5, 6, 15, 0, 3, 4, 7, 2, 12, 1, 10, 14, 9],
+        [10, 6, 9, 0, 12, 11, 7, 13, 15, 1, 3, 14, 5, 2, 8, 4],
+        [3, 15, 0, 6, 10, 1, 13, 8, 9, 4, 5, 11, 12, 7, 2, 14]
+    ],
+    [
+        [2, 12, 4, 1, 7, 10, 11, 6, 8, 5, 3, 15, 13, 0, 14, 9],
+        [14, 11, 2, 12, 4, 7, 13, 1, 5, 0, 15, 10, 3, 9, 8, 6],
+        [4, 2, 1, 11, 10, 13, 7, 8, 15, 9, 12, 5, 6, 3, 0, 14],
+        [11, 8, 12, 7, 1, 14, 2, 13, 6, 15, 0, 9, 10, 4, 5, 3]
+    ],
+    [
+        [12, 1, 10, 15, 9, 2, 6, 8, 0, 13, 3, 4, 14, 7, 5, 11],
+        [10, 15, 4, 2, 7, 12, 9, 5, 6, 1, 13, 14, 0, 11, 3, 8],
+        [9, 14, 15, 5, 2, 8, 12, 3, 7, 0, 4, 10, 1, 13, 11, 6],
+        [4, 3, 2, 12, 9, 5, 15, 10, 11, 14, 1, 7, 6, 0, 8, 13]
+    ],
+    [
+        [4, 11, 2, 14, 15, 0, 8, 13, 3, 12, 9, 7, 5, 10, 6, 1],
+        [13, 0, 11, 7, 4, 9, 1, 10, 14, 3, 5, 12, 2, 15, 8, 6],
+        [1, 4, 11, 13, 12, 3, 7, 14, 10, 15, 6, 8, 0, 5, 9, 2],
+        [6, 11, 13, 8, 1, 4, 10, 7, 9, 5, 0, 15, 14, 2, 3, 12]
+    ],
+    [
+        [13, 2, 8, 4, 6, 15, 11, 1, 10, 9, 3, 14, 5, 0, 12, 7],
+        [1, 15, 13, 8, 10, 3, 7, 4, 12, 5, 6, 11, 0, 14, 9, 2],
+        [7, 11, 4, 1, 9, 12, 14, 2, 0, 6, 10, 13, 15, 3, 5, 8],
+        [2, 1, 14, 7, 4, 10, 8, 13, 15, 12, 9, 0, 3, 5, 6, 11]
+    ]
+]
+
+
+def apply_permutation(data, permutation_table, in_width=None):
     """
     Apply a permutation to input data.
     
+    Integers are permuted with the compiled form of the table; bit 0 of
+    the table is the most significant of in_width bits. The tables of this
+    module are compiled at import; other tables are compiled and cached on
+    first use. In hot loops keep compile_permutation(table, in_width).apply
+    and call it directly (as des.py does).
+    
     Args:
-        data: List of bits or string of '0' and '1'
+        data: List of bits, string of '0' and '1', integer or BitVector
         permutation_table: List of indices for permutation
+        in_width: Bit width of integer data (default: highest index + 1)
         
     Returns:
-        List of permuted bits
+        List of permuted bits (integer for integer data, BitVector for
+        BitVector data)
     """
+    if isinstance(data, int):
+        known = _COMPILED_TABLES.get((id(permutation_table), in_width))
+        if known is not None and known[0] is permutation_table:
+            return known[1](data)
+        return compile_permutation(permutation_table, in_width).apply(data)
+    
+    if isinstance(data, BitVector):
+        known = _COMPILED_TABLES.get((id(permutation_table), data.width))
+        if known is not None and known[0] is permutation_table:
+            value = known[1](data.value)
+        else:
+            value = compile_permutation(permutation_table, data.width).apply(data.value)
+        return _make_bits(value, len(permutation_table))
+    
     if isinstance(data, str):
         data = [int(b) for b in data]
     
@@ -77,22 +211,55 @@ def apply_inverse_permutation(data, permutation_table):
     """
     Apply inverse permutation.
     
+    The inverses of this module's tables are built at import and found by
+    identity; for other tables the Permutation (and its inverse) is
+    interned per table. Callers applying the same inverse many times can
+    keep Permutation(table).inverse and call it directly.
+    
     Args:
-        data: List of bits or string of '0' and '1'
+        data: List of bits, string of '0' and '1', integer or BitVector
         permutation_table: Original permutation table
         
     Returns:
-        List of bits after inverse permutation
+        List of bits after inverse permutation (integer for integer data,
+        BitVector for BitVector data)
     """
-    if isinstance(data, str):
-        data = [int(b) for b in data]
+    known = _INVERSE_PERMUTATIONS.get(id(permutation_table))
+    if known is not None and known[0] is permutation_table:
+        return known[1](data)
+    return Permutation(permutation_table).inverse(data)
+
+
+def flatten_s_box(s_box):
+    """
+    Flatten an S-box into a 64-entry table indexed by the 6-bit input.
     
-    # Create inverse permutation
-    inverse = [0] * len(permutation_table)
-    for new_pos, old_pos in enumerate(permutation_table):
-        inverse[old_pos] = new_pos
+    Entry x is s_box[row][col] with row = outer bits (b0 b5) and
+    col = middle bits (b1..b4) of x, so no bit shuffling is needed per
+    lookup. Tables of the DES S-boxes are built at import and found by
+    identity; other S-boxes are cached per contents.
     
-    return [data[i] for i in inverse]
+    Args:
+        s_box: 2D array representing the S-box (4 rows x 16 columns)
+        
+    Returns:
+        bytes of length 64
+    """
+    known = _FLAT_S_BOXES.get(id(s_box))
+    if known is not None and known[0] is s_box:
+        return known[1]
+    return _flatten(tuple(map(tuple, s_box)))
+
+
+@lru_cache(maxsize=64)
+def _flatten(s_box):
+    return bytes(s_box[(x >> 4 & 2) | (x & 1)][x >> 1 & 15] for x in range(64))
+
+
+@lru_cache(maxsize=64)
+def _translate_table(flat):
+    # Inputs above 63 are rejected before translating
+    return flat + bytes(192)
 
 
 def s_box_lookup(s_box, input_bits):
@@ -101,11 +268,25 @@ def s_box_lookup(s_box, input_bits):
     
     Args:
         s_box: 2D array representing the S-box
-        input_bits: 6-bit input (as list or string)
+        input_bits: 6-bit input (as list, string, integer 0-63 or BitVector)
         
     Returns:
-        4-bit output value
+        4-bit output value (list of bits; integer for integer input,
+        BitVector for BitVector input)
     """
+    if isinstance(input_bits, int):
+        if not 0 <= input_bits < 64:
+            raise ValueError("S-box input must be 6 bits")
+        known = _FLAT_S_BOXES.get(id(s_box))
+        if known is not None and known[0] is s_box:
+            return known[1][input_bits]
+        return flatten_s_box(s_box)[input_bits]
+    
+    if isinstance(input_bits, BitVector):
+        if input_bits.width != 6:
+            raise ValueError("S-box input must be 6 bits")
+        return _make_bits(flatten_s_box(s_box)[input_bits.value], 4)
+    
     if isinstance(input_bits, str):
         input_bits = [int(b) for b in input_bits]
     
@@ -125,14 +306,153 @@ def s_box_lookup(s_box, input_bits):
     return [(value >> i) & 1 for i in range(3, -1, -1)]
 
 
+def s_box_lookup_many(s_box, inputs):
+    """
+    Look up many 6-bit inputs in one S-box.
+    
+    Args:
+        s_box: 2D array representing the S-box
+        inputs: bytes-like object or iterable of integers 0-63
+        
+    Returns:
+        bytes with one 4-bit output value per input
+    """
+    if not isinstance(inputs, (bytes, bytearray, memoryview)):
+        inputs = bytes(inputs)
+    if inputs and max(inputs) > 63:
+        raise ValueError("S-box inputs must be 6-bit values (0-63)")
+    return bytes(inputs).translate(_translate_table(flatten_s_box(s_box)))
+
+
+def _pair_tables(s_boxes):
+    """
+    12-bit tables for pairs of S-boxes: one lookup handles two S-boxes.
+    
+    Table j maps bits 12j..12j+11 of a 48-bit word to the two output
+    nibbles at their place in the 32-bit result.
+    """
+    flat = [flatten_s_box(s_box) for s_box in s_boxes]
+    if len(flat) != 8:
+        raise ValueError("Exactly 8 S-boxes are required")
+    tables = []
+    for j in range(4):
+        first, second = flat[2 * j], flat[2 * j + 1]
+        shift = 24 - 8 * j
+        tables.append([
+            (first[x >> 6] << 4 | second[x & 63]) << shift for x in range(4096)
+        ])
+    return tables
+
+
+def make_s_box_layer(s_boxes=None):
+    """
+    Build the S-box layer for a fixed set of 8 S-boxes (see s_box_layer).
+    
+    The pair tables are built once, so the returned function only does the
+    table lookups; keep it when evaluating custom S-boxes repeatedly.
+    
+    Args:
+        s_boxes: 8 S-boxes (default: DES_S_BOXES)
+        
+    Returns:
+        function words -> outputs with the same input/output forms as
+        s_box_layer
+    """
+    t0, t1, t2, t3 = _pair_tables(DES_S_BOXES if s_boxes is None else s_boxes)
+    
+    def layer(words):
+        if isinstance(words, int):
+            return t0[words >> 36 & 4095] | t1[words >> 24 & 4095] | t2[words >> 12 & 4095] | t3[words & 4095]
+        
+        if isinstance(words, (bytes, bytearray, memoryview)):
+            data = bytes(words)
+            if len(data) % 6:
+                raise ValueError("Packed input length must be a multiple of 6 bytes")
+            out = bytearray()
+            for start in range(0, len(data), 6):
+                w = int.from_bytes(data[start:start + 6], 'big')
+                out += (t0[w >> 36] | t1[w >> 24 & 4095] | t2[w >> 12 & 4095] | t3[w & 4095]).to_bytes(4, 'big')
+            return bytes(out)
+        
+        return [t0[w >> 36 & 4095] | t1[w >> 24 & 4095] | t2[w >> 12 & 4095] | t3[w & 4095] for w in words]
+    
+    return layer
+
+
+def s_box_layer(words, s_boxes=None):
+    """
+    Apply all 8 S-boxes to packed 48-bit words.
+    
+    Bits 0-5 of a word (most significant first) go to the first S-box,
+    bits 6-11 to the second, etc.; the eight 4-bit outputs are packed into
+    a 32-bit result in the same order (DES round function before P).
+    Internally two S-boxes are merged into one 4096-entry table, so a word
+    costs 4 lookups. The DES tables are built at import; for other
+    S-boxes use make_s_box_layer once instead of passing s_boxes here.
+    
+    Args:
+        words: one 48-bit integer, iterable of integers, or bytes-like
+               object of 6-byte big-endian words
+        s_boxes: 8 S-boxes (default: DES_S_BOXES)
+        
+    Returns:
+        32-bit integer, list of integers, or bytes of 4-byte words
+        (matching the input)
+    """
+    if s_boxes is None or s_boxes is DES_S_BOXES:
+        return _des_s_box_layer(words)
+    return make_s_box_layer(s_boxes)(words)
+
+
+# Flat tables of the module's S-boxes, found by identity on the hot path:
+# {id(s_box): (s_box, flat table)}
+_FLAT_S_BOXES = {
+    id(s_box): (s_box, _flatten(tuple(map(tuple, s_box)))) for s_box in DES_S_BOXES
+}
+_des_s_box_layer = make_s_box_layer(DES_S_BOXES)
+
+
 def bits_to_string(bits):
-    """Convert list of bits to string."""
+    """Convert list of bits (or BitVector) to string."""
+    if isinstance(bits, BitVector):
+        return str(bits)
     return ''.join(str(b) for b in bits)
 
 
 def bits_to_int(bits):
-    """Convert list of bits to integer."""
+    """Convert list of bits (or BitVector) to integer."""
+    if isinstance(bits, BitVector):
+        return bits.value
     result = 0
     for bit in bits:
         result = (result << 1) | bit
     return result
+
+
+def _precompile(tables):
+    """
+    Compile the module's permutation tables for the integer paths.
+    
+    Returns:
+        {(id(table), in_width): (table, apply)} for the default width and
+        the given full width of every table, looked up by identity so no
+        key has to be built per call
+    """
+    compiled = {}
+    for table, width in tables:
+        for in_width in (None, width):
+            compiled[(id(table), in_width)] = (table, compile_permutation(table, in_width).apply)
+    return compiled
+
+
+_COMPILED_TABLES = _precompile([
+    (IP_INTEL_X86, 64), (IP_INVERSE_INTEL_X86, 64), (IP_COB, len(IP_COB)),
+    (DES_IP, 64), (DES_FP, 64), (DES_E, 32), (DES_P, 32), (DES_PC1, 64), (DES_PC2, 56)
+])
+
+# Inverses of the bijective tables for apply_inverse_permutation:
+# {id(table): (table, inverse Permutation)}
+_INVERSE_PERMUTATIONS = {
+    id(table): (table, Permutation(table).inverse)
+    for table in (IP_INTEL_X86, IP_INVERSE_INTEL_X86, DES_IP, DES_FP, DES_P)
+}
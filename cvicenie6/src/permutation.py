@@ -0,0 +1,177 @@
+"""
+Permutation Algebra
+Permutation tables as objects with cached inverse, position index and
+composition.
+
+A Permutation is interned per (table, in_width): constructing it twice
+from equal tables returns the same object (kept in an LRU cache of
+MAX_INTERNED tables), so the inverse, the position index and the
+compiled integer routine are built once per table.
+Semantics follow apply_permutation: out[i] = in[table[i]].
+"""
+
+from functools import lru_cache
+
+try:
+    from .bit_permutation import compile_permutation
+    from .bitvector import BitVector, _make as _make_bits
+except ImportError:  # loaded as a top-level module (src on sys.path)
+    from bit_permutation import compile_permutation
+    from bitvector import BitVector, _make as _make_bits
+
+MAX_INTERNED = 256
+
+
+class Permutation:
+    """
+    Interned bit selection table.
+    
+    Example:
+        ip = Permutation(IP_INTEL_X86)
+        ip.position(6) == 0           # input bit 6 goes to output bit 0
+        ip.inverse(ip(bits)) == bits
+    """
+    
+    def __new__(cls, table, in_width=None):
+        if isinstance(table, Permutation):
+            return table
+        table = tuple(table)
+        if in_width is None:
+            in_width = max(table) + 1 if table else 0
+        if table and not 0 <= min(table) <= max(table) < in_width:
+            raise ValueError(f"Permutation table references bits outside {in_width}-bit input")
+        return _intern(cls, table, in_width)
+    
+    def _setup(self, table, in_width):
+        self.table = table
+        self.in_width = in_width
+        self.out_width = len(table)
+        self._index = None
+        self._inverse = None
+        self._compiled = None
+    
+    def __getnewargs__(self):
+        return (self.table, self.in_width)
+    
+    @property
+    def is_bijective(self):
+        """True if every input bit appears exactly once."""
+        return self.in_width == self.out_width and len(self.index) == self.in_width
+    
+    @property
+    def index(self):
+        """Dict {input bit: first output position that receives it}."""
+        if self._index is None:
+            index = {}
+            for out_pos, in_pos in enumerate(self.table):
+                index.setdefault(in_pos, out_pos)
+            self._index = index
+        return self._index
+    
+    def position(self, in_pos):
+        """
+        Output position of an input bit (O(1)).
+    
+        Raises:
+            ValueError: If the bit is not used by the table
+        """
+        try:
+            return self.index[in_pos]
+        except KeyError:
+            raise ValueError(f"Bit {in_pos} is not used by the permutation") from None
+    
+    @property
+    def inverse(self):
+        """
+        Inverse permutation (cached).
+    
+        Raises:
+            ValueError: If the table is not a bijection
+        """
+        if self._inverse is None:
+            if not self.is_bijective:
+                raise ValueError("Only bijective permutations have an inverse")
+            index = self.index
+            inverse = Permutation([index[i] for i in range(self.in_width)])
+            inverse._inverse = self
+            self._inverse = inverse
+        return self._inverse
+    
+    @property
+    def compiled(self):
+        """CompiledPermutation for integer inputs."""
+        if self._compiled is None:
+            self._compiled = compile_permutation(self.table, self.in_width)
+        return self._compiled
+    
+    def then(self, other):
+        """
+        Permutation that applies self first and then other.
+    
+        Raises:
+            ValueError: If other reads bits beyond self's output
+        """
+        other = Permutation(other)
+        if other.table and max(other.table) >= self.out_width:
+            raise ValueError(
+                f"Cannot chain: {self.out_width}-bit output feeds a table reading bit {max(other.table)}"
+            )
+        table = self.table
+        return Permutation([table[i] for i in other.table], self.in_width)
+    
+    def __call__(self, data):
+        """
+        Apply the permutation.
+    
+        Args:
+            data: List of bits, string of '0' and '1', integer (of
+                  in_width bits, bit 0 = most significant) or BitVector
+    
+        Returns:
+            List of permuted bits (integer for integer data, BitVector for
+            BitVector data)
+        """
+        if isinstance(data, int):
+            return (self._compiled or self.compiled).apply(data)
+        if isinstance(data, BitVector):
+            compiled = self.compiled if data.width == self.in_width else compile_permutation(self.table, data.width)
+            return _make_bits(compiled.apply(data.value), self.out_width)
+        if isinstance(data, str):
+            data = [int(b) for b in data]
+        return [data[i] for i in self.table]
+    
+    def __len__(self):
+        return self.out_width
+    
+    def __repr__(self):
+        return f"Permutation({self.in_width} -> {self.out_width} bits)"
+
+
+@lru_cache(maxsize=MAX_INTERNED)
+def _intern(cls, table, in_width):
+    self = object.__new__(cls)
+    self._setup(table, in_width)
+    return self
+
+
+def identity(width):
+    """Identity permutation on width bits."""
+    return Permutation(range(width))
+
+
+def compose(*permutations):
+    """
+    Collapse a chain of permutations into one, applied left to right.
+    
+    compose(IP, P1, ..., IP_inv)(x) == IP_inv(...(P1(IP(x)))), but runs as
+    a single table (one compiled pass for integers).
+    
+    Args:
+        permutations: Permutation objects or tables (at least one)
+    """
+    if not permutations:
+        raise ValueError("At least one permutation is required")
+    result = Permutation(permutations[0])
+    for permutation in permutations[1:]:
+        result = result.then(permutation)
+    return result
@@ -0,0 +1,227 @@
+"""
+S-box Differential and Linear Analysis
+Difference distribution table (DDT) and linear approximation table (LAT)
+of any S-box with n-bit input and m-bit output (m <= 8).
+
+Both tables are computed on whole S-box columns at once instead of
+looping over every (input, difference/mask) pair:
+- DDT: the S-box is packed into one integer (one byte per entry); the
+  table for x -> S(x ^ dx) is obtained by swapping byte blocks of that
+  integer, so each row is one XOR plus a byte count.
+- LAT: the S-box is bit-sliced; every input and output mask is a 2^n-bit
+  integer of parities, so an entry is one XOR plus a popcount.
+
+Results are stored in an on-disk cache keyed by a SHA-256 hash of the
+S-box contents, so analysing the same candidate again is a file read.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    from .des_tables import flatten_s_box
+except ImportError:  # loaded as a top-level module (src on sys.path)
+    from des_tables import flatten_s_box
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'SBOX_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'zkgra', 'sbox_analysis')
+)
+
+# DDT entries go up to 2^n and LAT entries to ±2^(n-1): 32-bit storage
+DDT_TYPECODE, LAT_TYPECODE = 'I', 'i'
+CACHE_SUFFIX = '.u32.bin'
+
+SBoxAnalysis = namedtuple('SBoxAnalysis', ['ddt', 'lat', 'differential_uniformity', 'linearity'])
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(value):
+        return bin(value).count('1')
+
+
+def normalize_s_box(s_box):
+    """
+    Convert an S-box into its flat form.
+    
+    Args:
+        s_box: DES-style 4x16 table (row from outer bits, column from
+               middle bits) or flat sequence of 2^n output values
+    
+    Returns:
+        tuple: (flat bytes indexed by input, input bits n, output bits m)
+    """
+    s_box = list(s_box)
+    if s_box and not isinstance(s_box[0], int):
+        if len(s_box) != 4 or any(len(row) != 16 for row in s_box):
+            raise ValueError("2D S-boxes must have 4 rows of 16 values")
+        flat = flatten_s_box(s_box)
+    else:
+        if any(not 0 <= value < 256 for value in s_box):
+            raise ValueError("S-box outputs must fit in 8 bits")
+        flat = bytes(s_box)
+    
+    size = len(flat)
+    if size < 2 or size & (size - 1):
+        raise ValueError("S-box size must be a power of two")
+    return flat, size.bit_length() - 1, max(max(flat).bit_length(), 1)
+
+
+def s_box_digest(s_box):
+    """SHA-256 of the S-box dimensions and contents (the cache key)."""
+    flat, n, m = normalize_s_box(s_box)
+    return hashlib.sha256(bytes([n, m]) + flat).hexdigest()
+
+
+def _ddt(flat, n, m):
+    size = 1 << n
+    packed = int.from_bytes(flat, 'big')
+    
+    # Masks selecting the low half of every block of 2^(k+1) bytes
+    masks = []
+    for k in range(n):
+        block = bytes(1 << k)
+        half = b'\xff' * (1 << k)
+        masks.append(int.from_bytes((block + half) * (size >> (k + 1)), 'big'))
+    
+    # shifted[dx] = packed S-box with entry x replaced by S(x ^ dx)
+    shifted = [packed]
+    table = [[0] * (1 << m) for _ in range(size)]
+    table[0][0] = size
+    for dx in range(1, size):
+        k = (dx & -dx).bit_length() - 1
+        previous = shifted[dx & (dx - 1)]
+        bits = 8 << k
+        mask = masks[k]
+        current = (previous & mask) << bits | (previous >> bits) & mask
+        shifted.append(current)
+    
+        diffs = (packed ^ current).to_bytes(size, 'big')
+        table[dx] = [diffs.count(dy) for dy in range(1 << m)]
+    return table
+
+
+def _parity_columns(values, width, count):
+    """Bit-sliced masks: column[a] has bit x set iff parity(a & values[x])."""
+    bits = []
+    for i in range(width):
+        column = 0
+        for x, value in enumerate(values):
+            if value >> i & 1:
+                column |= 1 << x
+        bits.append(column)
+    
+    columns = [0] * count
+    for a in range(1, count):
+        low = a & -a
+        columns[a] = columns[a ^ low] ^ bits[low.bit_length() - 1]
+    return columns
+
+
+def _lat(flat, n, m):
+    size = 1 << n
+    half = size >> 1
+    inputs = _parity_columns(range(size), n, size)
+    outputs = _parity_columns(flat, m, 1 << m)
+    return [[half - _popcount(a ^ b) for b in outputs] for a in inputs]
+
+
+def difference_distribution_table(s_box):
+    """
+    Compute the DDT: ddt[dx][dy] = #{x : S(x) ^ S(x ^ dx) == dy}.
+    
+    Args:
+        s_box: 4x16 DES-style S-box or flat sequence of 2^n outputs
+    """
+    return _ddt(*normalize_s_box(s_box))
+
+
+def linear_approximation_table(s_box):
+    """
+    Compute the LAT: lat[a][b] = #{x : a·x == b·S(x)} - 2^(n-1).
+    
+    Args:
+        s_box: 4x16 DES-style S-box or flat sequence of 2^n outputs
+    """
+    return _lat(*normalize_s_box(s_box))
+
+
+def _summarize(ddt, lat):
+    uniformity = max(max(row) for row in ddt[1:])
+    linearity = max(abs(value) for row in lat for value in row[1:])
+    return SBoxAnalysis(ddt, lat, uniformity, linearity)
+
+
+def _rows(values, width):
+    return [values[i:i + width] for i in range(0, len(values), width)]
+
+
+def _load(path, n, m):
+    """Read cached tables (raw 32-bit arrays: DDT then LAT)."""
+    rows, cols = 1 << n, 1 << m
+    ddt, lat = array(DDT_TYPECODE), array(LAT_TYPECODE)
+    try:
+        with open(path, 'rb') as f:
+            ddt.fromfile(f, rows * cols)
+            lat.fromfile(f, rows * cols)
+    except (OSError, EOFError):
+        return None
+    return _summarize(_rows(ddt.tolist(), cols), _rows(lat.tolist(), cols))
+
+
+def _store(path, result):
+    directory = os.path.dirname(path)
+    # Write to a temporary file first so readers never see a partial file
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            array(DDT_TYPECODE, [v for row in result.ddt for v in row]).tofile(f)
+            array(LAT_TYPECODE, [v for row in result.lat for v in row]).tofile(f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass  # the cache is best effort
+    finally:
+        # Already renamed, or not removable: neither may fail the analysis
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+@lru_cache(maxsize=128)
+def _analyze(flat, n, m, cache_dir):
+    digest = hashlib.sha256(bytes([n, m]) + flat).hexdigest()
+    path = os.path.join(cache_dir, digest + CACHE_SUFFIX) if cache_dir else None
+    
+    if path:
+        cached = _load(path, n, m)
+        if cached is not None:
+            return cached
+    
+    result = _summarize(_ddt(flat, n, m), _lat(flat, n, m))
+    if path:
+        _store(path, result)
+    return result
+
+
+def analyze_s_box(s_box, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Compute (or load from cache) the DDT and LAT of an S-box.
+    
+    Args:
+        s_box: 4x16 DES-style S-box or flat sequence of 2^n outputs
+        cache_dir: directory of the on-disk cache (None = no disk cache)
+    
+    Returns:
+        SBoxAnalysis(ddt, lat, differential_uniformity, linearity); the
+        result is shared between calls, do not modify the tables
+    """
+    return _analyze(*normalize_s_box(s_box), cache_dir)
@@ -0,0 +1,142 @@
+"""
+Tests for compiled integer bit permutations.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from bit_permutation import CompiledPermutation, compile_permutation, permute_int
+from des_tables import (
+    IP_INTEL_X86, IP_INVERSE_INTEL_X86, IP_COB, DES_IP, DES_FP, DES_E, DES_P, DES_PC1, DES_PC2,
+    apply_permutation, apply_inverse_permutation
+)
+
+
+def to_bits(value, width):
+    """Integer to list of bits, bit 0 = most significant."""
+    return [value >> (width - 1 - i) & 1 for i in range(width)]
+
+
+def from_bits(bits):
+    """List of bits to integer."""
+    return int(''.join(map(str, bits)) or '0', 2)
+
+
+def check_against_list_path(table, in_width, samples=200):
+    """Compare every integer path with the list path of apply_permutation."""
+    rng = random.Random(in_width * 1000 + len(table))
+    compiled = compile_permutation(table, in_width)
+    assert compiled.in_width == in_width and compiled.out_width == len(table)
+    values = [0, (1 << in_width) - 1] + [1 << i for i in range(in_width)]
+    values += [rng.getrandbits(in_width) for _ in range(samples)]
+    for value in values:
+        expected = from_bits(apply_permutation(to_bits(value, in_width), table))
+        assert compiled.apply(value) == expected, (in_width, value)
+        assert compiled(value) == expected
+        assert permute_int(value, table, in_width) == expected
+        assert apply_permutation(value, table, in_width) == expected
+
+
+def test_ip_tables_match_list_path():
+    """Test the 64-bit initial permutations and their inverses."""
+    for table in (IP_INTEL_X86, IP_INVERSE_INTEL_X86, DES_IP, DES_FP):
+        check_against_list_path(table, 64)
+    
+    rng = random.Random(1)
+    for _ in range(200):
+        value = rng.getrandbits(64)
+        assert permute_int(permute_int(value, IP_INTEL_X86), IP_INVERSE_INTEL_X86) == value
+        assert permute_int(permute_int(value, DES_IP), DES_FP) == value
+        assert apply_inverse_permutation(permute_int(value, IP_INTEL_X86), IP_INTEL_X86) == value
+        assert apply_inverse_permutation(value, DES_FP) == permute_int(value, DES_IP)
+
+
+def test_odd_widths_match_list_path():
+    """Test the 25-bit IP_COB, expansion E, P and the key schedule tables."""
+    check_against_list_path(IP_COB, 25)
+    check_against_list_path(DES_E, 32)   # expansion 32 -> 48
+    check_against_list_path(DES_P, 32)
+    check_against_list_path(DES_PC1, 64)  # compression, parity bits dropped
+    check_against_list_path(DES_PC2, 56)  # 56 -> 48, not a multiple of 8 bytes wide
+    # Widths below a full byte and wider than the highest index
+    check_against_list_path([2, 0, 1], 3)
+    check_against_list_path([3, 1, 1, 0], 12)
+    check_against_list_path([], 0, samples=0)
+
+
+def test_compiled_permutation_is_cached():
+    """Test that compiling the same table twice returns the same object."""
+    assert compile_permutation(DES_E, 32) is compile_permutation(list(DES_E), 32)
+    assert compile_permutation(DES_E, 32) is not compile_permutation(DES_E)
+    assert repr(compile_permutation(DES_E, 32)) == "CompiledPermutation(32 -> 48 bits)"
+
+
+def test_invalid_tables_and_inputs():
+    """Test out-of-range source positions and wrong input widths."""
+    for table, in_width in (([0, 64], 64), ([-1, 0], 8), (DES_E, 16), (DES_PC2, 48)):
+        try:
+            CompiledPermutation(table, in_width)
+            assert False, f"Should raise ValueError for {in_width}-bit input"
+        except ValueError:
+            pass
+    
+    compiled = compile_permutation(DES_E, 32)
+    for value in (1 << 32, -1, 1 << 64):
+        try:
+            compiled(value)
+            assert False, f"Should raise ValueError for {value}"
+        except ValueError:
+            pass
+    try:
+        permute_int(1 << 25, IP_COB, 25)
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_ip_tables_match_list_path,
+        test_odd_widths_match_list_path,
+        test_compiled_permutation_is_cached,
+        test_invalid_tables_and_inputs,
+    ]
+    
+    print("Running bit permutation tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
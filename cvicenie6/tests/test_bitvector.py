@@ -0,0 +1,153 @@
+"""
+Tests for the int-backed BitVector.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from bitvector import BitVector
+from des_tables import bits_to_string, bits_to_int
+
+
+def random_bits(rng, width):
+    """Random list of bits, the representation main.py used before BitVector."""
+    return [rng.getrandbits(1) for _ in range(width)]
+
+
+def expect_error(func, error=ValueError):
+    """Assert that func() raises error."""
+    try:
+        func()
+    except error:
+        return
+    raise AssertionError(f"Should raise {error.__name__}")
+
+
+def test_construction_and_validation():
+    """Test every input form and the validation of widths and values."""
+    assert BitVector('0110') == BitVector([0, 1, 1, 0]) == BitVector(6, 4) == BitVector(b'\x00\x01\x01\x00')
+    assert BitVector(BitVector('0110')) == BitVector('0110')
+    assert BitVector(5) == BitVector('101')
+    assert len(BitVector()) == 0 and str(BitVector('')) == ''
+    assert BitVector(0, 8).to_list() == [0] * 8
+    
+    expect_error(lambda: BitVector(8, 3))        # value too wide for its length
+    expect_error(lambda: BitVector(0, -1))       # negative length
+    expect_error(lambda: BitVector('', -3))
+    expect_error(lambda: BitVector(-1, 4))
+    expect_error(lambda: BitVector('0120'))
+    expect_error(lambda: BitVector([0, 2, 1]))
+    expect_error(lambda: BitVector('0110', 5))
+    expect_error(lambda: BitVector(BitVector('01'), 3))
+
+
+def test_indexing_and_slicing_match_list():
+    """Test indices and slices (including steps) against a list of bits."""
+    rng = random.Random(25)
+    for width in (1, 6, 25, 64, 100):
+        bits = random_bits(rng, width)
+        vector = BitVector(bits)
+        assert [vector[i] for i in range(width)] == bits
+        assert [vector[-i] for i in range(1, width + 1)] == [bits[-i] for i in range(1, width + 1)]
+        for _ in range(50):
+            start, stop = rng.randrange(-width, width + 3), rng.randrange(-width, width + 3)
+            step = rng.choice([1, 1, 2, 3, -1, -2])
+            assert vector[start:stop:step] == bits[start:stop:step], (width, start, stop, step)
+            assert len(vector[start:stop:step]) == len(bits[start:stop:step])
+        assert vector[::-1].to_list() == bits[::-1]
+        expect_error(lambda: vector[width], IndexError)
+        expect_error(lambda: vector[-width - 1], IndexError)
+
+
+def test_halves_concatenation_and_xor():
+    """Test L/R halves, + and ^ against the list operations."""
+    rng = random.Random(26)
+    for width in (0, 1, 2, 25, 32, 64, 99):
+        bits = random_bits(rng, width)
+        vector = BitVector(bits)
+        mid = width // 2
+        left, right = vector.halves()
+        assert left == bits[:mid] and right == bits[mid:]
+        assert (len(left), len(right)) == (mid, width - mid)
+        assert left + right == vector
+        
+        other = random_bits(rng, width)
+        assert (vector ^ BitVector(other)) == [a ^ b for a, b in zip(bits, other)]
+        assert vector + BitVector(other) == bits + other
+    
+    assert str(BitVector('1100') + BitVector('')) == '1100'
+    expect_error(lambda: BitVector('1100') ^ BitVector('110'))
+    expect_error(lambda: BitVector('1') + [1], TypeError)
+    expect_error(lambda: BitVector('1') ^ 1, TypeError)
+
+
+def test_round_trips_match_list_behaviour():
+    """Test str, int, bytes and list conversions against list-of-bits helpers."""
+    rng = random.Random(27)
+    for width in (1, 7, 8, 25, 48, 64, 128):
+        bits = random_bits(rng, width)
+        vector = BitVector(bits)
+        assert str(vector) == bits_to_string(bits) == bits_to_string(vector)
+        assert int(vector) == bits_to_int(bits) == bits_to_int(vector)
+        assert vector.to_list() == list(vector) == bits
+        assert BitVector(str(vector)) == vector
+        assert BitVector(int(vector), width) == vector
+        assert repr(vector) == f"BitVector('{bits_to_string(bits)}')"
+        if width % 8 == 0:
+            data = vector.to_bytes()
+            assert data == bits_to_int(bits).to_bytes(width // 8, 'big')
+            assert BitVector.from_bytes(data) == vector
+        else:
+            expect_error(vector.to_bytes)
+    
+    assert BitVector('0110') != BitVector('110')
+    assert hash(BitVector('0110')) == hash(BitVector(6, 4))
+    assert len({BitVector('0110'), BitVector(6, 4), BitVector('110')}) == 2
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_construction_and_validation,
+        test_indexing_and_slicing_match_list,
+        test_halves_concatenation_and_xor,
+        test_round_trips_match_list_behaviour,
+    ]
+    
+    print("Running BitVector tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
@@ -0,0 +1,164 @@
+"""
+Tests for the S-box lookups and the batched S-box layer.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from bitvector import BitVector
+from des_tables import (
+    DES_S_BOXES, S_BOX_2, flatten_s_box, s_box_lookup, s_box_lookup_many, s_box_layer, make_s_box_layer
+)
+
+
+def scalar_layer(word, s_boxes):
+    """Eight scalar lookups on a 48-bit word, outputs packed into 32 bits."""
+    result = 0
+    for i, s_box in enumerate(s_boxes):
+        result = result << 4 | s_box_lookup(s_box, word >> (42 - 6 * i) & 63)
+    return result
+
+
+def random_s_boxes(rng):
+    """Eight random (non-DES) S-boxes as nested lists."""
+    return [[[rng.randrange(16) for _ in range(16)] for _ in range(4)] for _ in range(8)]
+
+
+def test_s_box_lookup_forms_agree():
+    """Test the list, string, int and BitVector forms of s_box_lookup."""
+    for s_box in DES_S_BOXES:
+        for x in range(64):
+            bits = [x >> (5 - i) & 1 for i in range(6)]
+            value = s_box[(bits[0] << 1) | bits[5]][x >> 1 & 15]
+            expected = [value >> (3 - i) & 1 for i in range(4)]
+            assert s_box_lookup(s_box, bits) == expected
+            assert s_box_lookup(s_box, ''.join(map(str, bits))) == expected
+            assert s_box_lookup(s_box, x) == value
+            assert s_box_lookup(s_box, BitVector(x, 6)) == BitVector(value, 4)
+    assert s_box_lookup(S_BOX_2, 0b101010) == 4
+
+
+def test_s_box_lookup_many_matches_scalar():
+    """Test batched lookups against s_box_lookup for all 64 inputs."""
+    inputs = list(range(64))
+    for s_box in DES_S_BOXES:
+        expected = bytes(s_box_lookup(s_box, x) for x in inputs)
+        assert flatten_s_box(s_box) == expected
+        assert s_box_lookup_many(s_box, bytes(inputs)) == expected
+        assert s_box_lookup_many(s_box, bytearray(inputs)) == expected
+        assert s_box_lookup_many(s_box, memoryview(bytes(inputs))) == expected
+        assert s_box_lookup_many(s_box, inputs) == expected
+        assert s_box_lookup_many(s_box, reversed(inputs)) == expected[::-1]
+    assert s_box_lookup_many(S_BOX_2, b'') == b''
+
+
+def test_s_box_inputs_above_63_are_rejected():
+    """Test that values outside 6 bits raise ValueError."""
+    for bad in (lambda: s_box_lookup_many(S_BOX_2, [0, 64]),
+                lambda: s_box_lookup_many(S_BOX_2, b'\x00\xff'),
+                lambda: s_box_lookup_many(S_BOX_2, bytearray([200])),
+                lambda: s_box_lookup(S_BOX_2, 64),
+                lambda: s_box_lookup(S_BOX_2, -1),
+                lambda: s_box_lookup(S_BOX_2, [1, 0, 1]),
+                lambda: s_box_lookup(S_BOX_2, BitVector(5, 7))):
+        try:
+            bad()
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+
+def test_s_box_layer_matches_scalar_lookups():
+    """Test packed 48-bit words against eight scalar lookups."""
+    rng = random.Random(22)
+    words = [0, (1 << 48) - 1] + [rng.getrandbits(48) for _ in range(300)]
+    expected = [scalar_layer(w, DES_S_BOXES) for w in words]
+    
+    assert [s_box_layer(w) for w in words] == expected
+    assert s_box_layer(words) == expected
+    assert s_box_layer(iter(words), DES_S_BOXES) == expected
+    packed = b''.join(w.to_bytes(6, 'big') for w in words)
+    assert s_box_layer(packed) == b''.join(v.to_bytes(4, 'big') for v in expected)
+    assert s_box_layer(bytearray(packed)) == s_box_layer(packed)
+    
+    try:
+        s_box_layer(b'12345')
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+def test_custom_s_boxes_build_their_own_tables():
+    """Test that non-DES S-boxes are not served from the DES tables."""
+    rng = random.Random(23)
+    custom = random_s_boxes(rng)
+    words = [rng.getrandbits(48) for _ in range(200)]
+    expected = [scalar_layer(w, custom) for w in words]
+    assert expected != [scalar_layer(w, DES_S_BOXES) for w in words]
+    
+    layer = make_s_box_layer(custom)
+    assert layer(words) == expected
+    assert s_box_layer(words, custom) == expected
+    assert make_s_box_layer()(words) == s_box_layer(words)
+    
+    # A copy of a DES S-box with one entry changed gets its own flat table
+    changed = [row[:] for row in S_BOX_2]
+    changed[0][0] ^= 1
+    assert flatten_s_box(changed)[0] == S_BOX_2[0][0] ^ 1
+    assert s_box_lookup_many(changed, [0]) == bytes([S_BOX_2[0][0] ^ 1])
+    assert flatten_s_box(S_BOX_2)[0] == S_BOX_2[0][0]
+    
+    try:
+        make_s_box_layer(custom[:7])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_s_box_lookup_forms_agree,
+        test_s_box_lookup_many_matches_scalar,
+        test_s_box_inputs_above_63_are_rejected,
+        test_s_box_layer_matches_scalar_lookups,
+        test_custom_s_boxes_build_their_own_tables,
+    ]
+    
+    print("Running S-box table tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
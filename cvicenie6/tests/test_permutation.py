@@ -0,0 +1,133 @@
+"""
+Tests for the interned Permutation type and composition.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+from bitvector import BitVector
+from des_tables import IP_INTEL_X86, IP_INVERSE_INTEL_X86, DES_IP, DES_E, DES_P, DES_PC1, apply_permutation
+from permutation import Permutation, compose, identity
+
+
+def test_same_table_interns_to_same_object():
+    """Test that equal tables give one shared Permutation."""
+    p = Permutation(IP_INTEL_X86)
+    assert Permutation(list(IP_INTEL_X86)) is p
+    assert Permutation(tuple(IP_INTEL_X86), 64) is p
+    assert Permutation(p) is p
+    assert Permutation(DES_E) is not Permutation(DES_E, 40)
+    assert (p.in_width, p.out_width, len(p)) == (64, 64, 64)
+    assert repr(Permutation(DES_E)) == "Permutation(32 -> 48 bits)"
+
+
+def test_inverse_round_trip():
+    """Test inverse caching, inverse.inverse and then() with the inverse."""
+    rng = random.Random(24)
+    tables = [IP_INTEL_X86, DES_IP, DES_P, rng.sample(range(40), 40)]
+    for table in tables:
+        p = Permutation(table)
+        assert p.inverse.inverse is p
+        assert p.inverse is p.inverse
+        assert p.then(p.inverse) is identity(p.in_width)
+        assert p.inverse.then(p) is identity(p.in_width)
+        bits = [rng.getrandbits(1) for _ in range(p.in_width)]
+        assert p.inverse(p(bits)) == bits
+    
+    assert Permutation(IP_INTEL_X86).inverse is Permutation(IP_INVERSE_INTEL_X86)
+
+
+def test_compose_collapses_chain():
+    """Test that compose gives one table equal to applying every step."""
+    rng = random.Random(25)
+    steps = [IP_INTEL_X86, rng.sample(range(64), 64), DES_PC1, rng.sample(range(56), 56), DES_E]
+    chain = compose(*steps)
+    assert isinstance(chain, Permutation)
+    assert (chain.in_width, chain.out_width) == (64, 48)
+    assert compose(IP_INTEL_X86) is Permutation(IP_INTEL_X86)
+    
+    for _ in range(100):
+        value = rng.getrandbits(64)
+        bits = [value >> (63 - i) & 1 for i in range(64)]
+        expected = bits
+        for step in steps:
+            expected = apply_permutation(expected, step)
+        assert chain(bits) == expected
+        assert chain(''.join(map(str, bits))) == expected
+        assert chain(value) == int(''.join(map(str, expected)), 2)
+        assert chain(BitVector(value, 64)) == BitVector(expected)
+    
+    for bad in (lambda: compose(), lambda: compose(DES_E, DES_PC1)):
+        try:
+            bad()
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+
+def test_position_and_errors():
+    """Test positions, missing bits and non-bijective tables."""
+    ip = Permutation(IP_INTEL_X86)
+    assert ip.position(6) == 0
+    assert all(IP_INTEL_X86[ip.position(i)] == i for i in range(64))
+    assert Permutation(DES_E).position(31) == 0
+    
+    pc1 = Permutation(DES_PC1)
+    for bad in (lambda: pc1.position(7), lambda: ip.position(64),
+                lambda: Permutation(DES_E).inverse, lambda: pc1.inverse,
+                lambda: Permutation([0, 1, 70], 64)):
+        try:
+            bad()
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+    assert not Permutation(DES_E).is_bijective
+    assert ip.is_bijective
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_same_table_interns_to_same_object,
+        test_inverse_round_trip,
+        test_compose_collapses_chain,
+        test_position_and_errors,
+    ]
+    
+    print("Running permutation tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
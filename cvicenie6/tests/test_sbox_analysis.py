@@ -0,0 +1,145 @@
+"""
+Tests for S-box differential and linear analysis.
+"""
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# Try importing pytest, fallback to manual test runner
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+import sbox_analysis
+from des_tables import DES_S_BOXES, S_BOX_2, flatten_s_box
+from sbox_analysis import (
+    SBoxAnalysis, analyze_s_box, difference_distribution_table, linear_approximation_table
+)
+
+
+def reference_tables(flat, n, m):
+    """DDT and LAT by direct counting over all inputs."""
+    size = 1 << n
+    ddt = [[0] * (1 << m) for _ in range(size)]
+    for dx in range(size):
+        for x in range(size):
+            ddt[dx][flat[x] ^ flat[x ^ dx]] += 1
+    lat = [[sum(bin(a & x).count('1') % 2 == bin(b & flat[x]).count('1') % 2 for x in range(size)) - size // 2
+            for b in range(1 << m)] for a in range(size)]
+    return ddt, lat
+
+
+def test_tables_match_direct_counting():
+    """Test DDT/LAT of the DES S-boxes and a random 7x6-bit S-box."""
+    for s_box in DES_S_BOXES:
+        ddt, lat = reference_tables(flatten_s_box(s_box), 6, 4)
+        assert difference_distribution_table(s_box) == ddt
+        assert linear_approximation_table(s_box) == lat
+    
+    rng = random.Random(3)
+    s_box = [rng.randrange(64) for _ in range(128)]
+    s_box[0] = 63  # fix the output width to 6 bits
+    ddt, lat = reference_tables(s_box, 7, 6)
+    assert difference_distribution_table(s_box) == ddt
+    assert linear_approximation_table(s_box) == lat
+    
+    # Matsui's best approximation of S5
+    assert linear_approximation_table(DES_S_BOXES[4])[0x10][0x0F] == -20
+
+
+def test_disk_cache_round_trip():
+    """Test that cached tables are read back unchanged."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        result = analyze_s_box(S_BOX_2, cache_dir=cache_dir)
+        assert (result.differential_uniformity, result.linearity) == (16, 16)
+        assert len(os.listdir(cache_dir)) == 1
+        
+        sbox_analysis._analyze.cache_clear()
+        assert analyze_s_box(S_BOX_2, cache_dir=cache_dir) == result
+
+
+def test_cache_stores_wide_values():
+    """Test values of 16-bit S-boxes (DDT 65536, LAT ±32768) survive the cache."""
+    ddt = [[65536, 0], [0, 65536]]
+    lat = [[32768, 0], [0, -32768]]
+    result = SBoxAnalysis(ddt, lat, 65536, 32768)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, 'wide' + sbox_analysis.CACHE_SUFFIX)
+        sbox_analysis._store(path, result)
+        assert os.listdir(cache_dir) == [os.path.basename(path)]
+        loaded = sbox_analysis._load(path, 1, 1)
+        assert loaded.ddt == ddt and loaded.lat == lat
+
+
+def test_failed_store_leaves_no_temp_file():
+    """Test that a failing write removes its temporary file."""
+    bad = SBoxAnalysis([[1 << 40]], [[0]], 0, 0)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        try:
+            sbox_analysis._store(os.path.join(cache_dir, 'bad.bin'), bad)
+            assert False, "Should raise OverflowError"
+        except OverflowError:
+            pass
+        assert os.listdir(cache_dir) == []
+
+
+def test_failed_cleanup_does_not_fail_analysis():
+    """Test that errors from renaming or removing the temp file are ignored."""
+    def fail(*args):
+        raise PermissionError("read-only cache")
+    
+    replace, remove = os.replace, os.remove
+    with tempfile.TemporaryDirectory() as cache_dir:
+        try:
+            os.replace = os.remove = fail
+            sbox_analysis._analyze.cache_clear()
+            result = analyze_s_box(S_BOX_2, cache_dir=cache_dir)
+        finally:
+            os.replace, os.remove = replace, remove
+        assert result.differential_uniformity == 16
+
+
+def run_tests_manually():
+    """Run tests without pytest."""
+    test_functions = [
+        test_tables_match_direct_counting,
+        test_disk_cache_round_trip,
+        test_cache_stores_wide_values,
+        test_failed_store_leaves_no_temp_file,
+        test_failed_cleanup_does_not_fail_analysis,
+    ]
+    
+    print("Running S-box analysis tests manually...\n")
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✓ {test_func.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    if not HAS_PYTEST:
+        success = run_tests_manually()
+        sys.exit(0 if success else 1)
+    else:
+        # Run with pytest
+        sys.exit(pytest.main([__file__, '-v']))
@@ -8,12 +8,16 @@ def gcd(a, b):
 
 
 def extended_gcd(a, b):
-    if a == 0:
-        return b, 0, 1
-    gcd_val, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    return gcd_val, x, y
+    # Euclid without recursion, so 4096-bit RSA moduli are fine
+    old_r, r = b, a
+    old_x, x = 0, 1
+    old_y, y = 1, 0
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    return old_r, old_x, old_y
 
 
 def mod_inverse(e, phi):
@@ -0,0 +1,94 @@
+"""
+Fixed-Base Modular Exponentiation
+Copy of the lab 4 FixedBaseExp, kept in this package so the lab stays
+standalone. Schnorr key generation, signing and verification all raise
+the same generator g, so its windowed power table is built once per
+(g, p) and shared by every Schnorr instance of that group.
+"""
+from functools import lru_cache
+
+DEFAULT_WINDOW = 8
+
+# Number of (g, p) tables kept in memory, least recently used are evicted
+MAX_TABLES = 8
+
+
+class FixedBaseExp:
+    """
+    Windowed power table of a fixed base g modulo p.
+    
+    Row i holds g^(d * 2^(window*i)) mod p for all window-bit digits d.
+    Rows are built lazily, only as far as the largest exponent seen so
+    far needs. With the default 8-bit window an exponent of b bits costs
+    about b/8 multiplications instead of about 1.2*b for pow().
+    
+    Example:
+        gp = FixedBaseExp(2, 23)
+        gp.pow(6) == pow(2, 6, 23)
+    """
+    
+    def __init__(self, g, p, window=DEFAULT_WINDOW):
+        if p <= 0:
+            raise ValueError("Modulus must be positive")
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        self.g = g % p
+        self.p = p
+        self.window = window
+        self._mask = (1 << window) - 1
+        self._rows = []
+        self._next_base = self.g  # g^(2^(window * len(rows)))
+    
+    def _extend(self, rows):
+        """Build table rows up to the given count."""
+        p = self.p
+        size = 1 << self.window
+        while len(self._rows) < rows:
+            base = self._next_base
+            row = [1] * size
+            acc = 1
+            for digit in range(1, size):
+                acc = acc * base % p
+                row[digit] = acc
+            self._rows.append(row)
+            self._next_base = acc * base % p
+    
+    def pow(self, e):
+        """Calculate g^e mod p (same result as pow(g, e, p))."""
+        if e < 0:
+            return pow(self.g, e, self.p)
+    
+        window = self.window
+        rows = -(-e.bit_length() // window)
+        if rows > len(self._rows):
+            self._extend(rows)
+    
+        p = self.p
+        result = 1 % p
+        if window == 8:
+            # Bytes of the exponent are exactly its digits
+            for row, digit in zip(self._rows, e.to_bytes(rows, 'little')):
+                if digit:
+                    result = result * row[digit] % p
+            return result
+    
+        mask = self._mask
+        for row in self._rows[:rows]:
+            digit = e & mask
+            if digit:
+                result = result * row[digit] % p
+            e >>= window
+        return result
+    
+    __call__ = pow
+
+
+@lru_cache(maxsize=MAX_TABLES)
+def fixed_base(g, p, window=DEFAULT_WINDOW):
+    """Shared FixedBaseExp for (g, p), kept in an LRU cache of MAX_TABLES tables."""
+    return FixedBaseExp(g, p, window)
+
+
+def fixed_pow(g, e, p):
+    """Calculate g^e mod p using the cached power table of g."""
+    return fixed_base(g, p).pow(e)
@@ -2,6 +2,11 @@ import random
 import hashlib
 import math
 
+try:
+    from .fixed_base import fixed_base
+except ImportError:  # loaded as a top-level module (src on sys.path)
+    from fixed_base import fixed_base
+
 def is_prime(n, k=5):
     """Miller-Rabin primality test."""
     if n < 2: return False
@@ -74,12 +79,16 @@ def generate_parameters(p_bits=64, q_bits=32):
 def mod_inverse(a, m):
     """Calculate modular multiplicative inverse of a modulo m."""
     def extended_gcd(a, b):
-        if a == 0:
-            return b, 0, 1
-        else:
-            g, y, x = extended_gcd(b % a, a)
-            return g, x - (b // a) * y, y
-
+        old_r, r = b, a
+        old_x, x = 0, 1
+        old_y, y = 1, 0
+        while r:
+            q = old_r // r
+            old_r, r = r, old_r - q * r
+            old_x, x = x, old_x - q * x
+            old_y, y = y, old_y - q * y
+        return old_r, old_x, old_y
+    
     g, x, y = extended_gcd(a, m)
     if g != 1:
         raise Exception('modular inverse does not exist')
@@ -105,7 +114,7 @@ class Schnorr:
         """
         self.x = random.randint(1, self.q - 1)
         # y = g^(-x) = (g^x)^(-1) mod p
-        g_x = pow(self.g, self.x, self.p)
+        g_x = fixed_base(self.g, self.p).pow(self.x)
         self.y = mod_inverse(g_x, self.p)
         return self.x, self.y
     
@@ -137,8 +146,8 @@ class Schnorr:
         # 1. Choose random k
         k = random.randint(1, self.q - 1)
         
-        # Calculate r = g^k mod p
-        r = pow(self.g, k, self.p)
+        # Calculate r = g^k mod p (precomputed powers of g, shared per group)
+        r = fixed_base(self.g, self.p).pow(k)
         
         # 2. Calculate e = H(r, M)
         e = self.hash_function(r, message)
@@ -160,7 +169,7 @@ class Schnorr:
         """
         # 4. Calculate r' = g^s * y^e mod p
         # r' = (g^s * y^e) mod p
-        term1 = pow(self.g, s, self.p)
+        term1 = fixed_base(self.g, self.p).pow(s)
         term2 = pow(public_key_y, e, self.p)
         r_prime = (term1 * term2) % self.p
         